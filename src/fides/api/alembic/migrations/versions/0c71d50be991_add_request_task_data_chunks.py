@@ -0,0 +1,76 @@
+"""add request task data chunks
+
+Revision ID: 0c71d50be991
+Revises: f712aa9429f4
+Create Date: 2026-10-18 21:05:42.118734
+
+"""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0c71d50be991"
+down_revision = "f712aa9429f4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "requesttaskdatachunk",
+        sa.Column("id", sa.String(length=255), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("request_task_id", sa.String(), nullable=False),
+        sa.Column("data_type", sa.String(), nullable=False),
+        sa.Column("chunk_index", sa.Integer(), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "data",
+            sqlalchemy_utils.types.encrypted.encrypted_type.StringEncryptedType(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["request_task_id"], ["requesttask.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "request_task_id",
+            "data_type",
+            "chunk_index",
+            name="request_task_data_chunk_uc",
+        ),
+    )
+    op.create_index(
+        op.f("ix_requesttaskdatachunk_id"),
+        "requesttaskdatachunk",
+        ["id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_requesttaskdatachunk_request_task_id"),
+        "requesttaskdatachunk",
+        ["request_task_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_requesttaskdatachunk_request_task_id"),
+        table_name="requesttaskdatachunk",
+    )
+    op.drop_index(op.f("ix_requesttaskdatachunk_id"), table_name="requesttaskdatachunk")
+    op.drop_table("requesttaskdatachunk")
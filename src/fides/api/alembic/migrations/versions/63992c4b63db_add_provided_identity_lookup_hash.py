@@ -0,0 +1,55 @@
+"""add provided identity lookup hash
+
+Revision ID: 63992c4b63db
+Revises: 0c71d50be991
+Create Date: 2026-10-18 22:02:17.402551
+
+The lookup hashes of existing provided identities are backfilled by a scheduled task
+once the application is running, since they're computed from the decrypted identity
+values. Until then, those identities are still looked up by their hashed_value.
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from loguru import logger
+
+# revision identifiers, used by Alembic.
+revision = "63992c4b63db"
+down_revision = "0c71d50be991"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "providedidentity",
+        sa.Column("lookup_hash", sa.String(), nullable=True),
+    )
+
+    connection = op.get_bind()
+
+    # only run the index creation if the table has less than 1 million rows
+    providedidentity_count = connection.execute(
+        sa.text("SELECT COUNT(*) FROM providedidentity")
+    ).scalar()
+    if providedidentity_count < 1000000:
+        op.create_index(
+            op.f("ix_providedidentity_lookup_hash"),
+            "providedidentity",
+            ["lookup_hash"],
+            unique=False,
+        )
+    else:
+        logger.warning(
+            "The providedidentity table has more than 1 million rows, "
+            "skipping index creation. Be sure to manually run "
+            "'CREATE INDEX CONCURRENTLY ix_providedidentity_lookup_hash "
+            "ON providedidentity (lookup_hash)'"
+        )
+
+
+def downgrade():
+    # The index may have been skipped, or created manually, on large tables
+    op.execute("DROP INDEX IF EXISTS ix_providedidentity_lookup_hash")
+    op.drop_column("providedidentity", "lookup_hash")
@@ -101,12 +101,12 @@ def _filter_consent(
     )
 
     if identity:
-        hashed_identity = ProvidedIdentity.hash_value(value=identity)
+        identity_filter = ProvidedIdentity.lookup_filter(db, identity)
         identities: Set[str] = {
             identity[0]
             for identity in ProvidedIdentity.filter(
                 db=db,
-                conditions=(ProvidedIdentity.hashed_value == hashed_identity),
+                conditions=identity_filter,
             ).values(column("id"))
         }
         query = query.filter(Consent.provided_identity_id.in_(identities))
@@ -361,7 +361,7 @@ def get_consent_preferences(
     identity = ProvidedIdentity.filter(
         db,
         conditions=(
-            (ProvidedIdentity.hashed_value == ProvidedIdentity.hash_value(str(lookup)))
+            ProvidedIdentity.lookup_filter(db, str(lookup))
             & (ProvidedIdentity.privacy_request_id.is_(None))
         ),
     ).first()
@@ -527,10 +527,7 @@ def _get_or_create_provided_identity(
             db=db,
             conditions=(
                 (ProvidedIdentity.field_name == ProvidedIdentityType.email.value)
-                & (
-                    ProvidedIdentity.hashed_value
-                    == ProvidedIdentity.hash_value(identity_data.email)
-                )
+                & ProvidedIdentity.lookup_filter(db, identity_data.email)
                 & (ProvidedIdentity.privacy_request_id.is_(None))
             ),
         ).first()
@@ -541,6 +538,9 @@ def _get_or_create_provided_identity(
                     "privacy_request_id": None,
                     "field_name": ProvidedIdentityType.email.value,
                     "hashed_value": ProvidedIdentity.hash_value(identity_data.email),
+                    "lookup_hash": ProvidedIdentity.lookup_hash_value(
+                        identity_data.email
+                    ),
                     "encrypted_value": {"value": identity_data.email},
                 },
             )
@@ -552,10 +552,7 @@ def _get_or_create_provided_identity(
             db=db,
             conditions=(
                 (ProvidedIdentity.field_name == ProvidedIdentityType.phone_number.value)
-                & (
-                    ProvidedIdentity.hashed_value
-                    == ProvidedIdentity.hash_value(identity_data.phone_number)
-                )
+                & ProvidedIdentity.lookup_filter(db, identity_data.phone_number)
                 & (ProvidedIdentity.privacy_request_id.is_(None))
             ),
         ).first()
@@ -568,6 +565,9 @@ def _get_or_create_provided_identity(
                     "hashed_value": ProvidedIdentity.hash_value(
                         identity_data.phone_number
                     ),
+                    "lookup_hash": ProvidedIdentity.lookup_hash_value(
+                        identity_data.phone_number
+                    ),
                     "encrypted_value": {"value": identity_data.phone_number},
                 },
             )
@@ -583,10 +583,7 @@ def _get_or_create_provided_identity(
             db=db,
             conditions=(
                 (ProvidedIdentity.field_name == ProvidedIdentityType.external_id.value)
-                & (
-                    ProvidedIdentity.hashed_value
-                    == ProvidedIdentity.hash_value(identity_data.external_id)
-                )
+                & ProvidedIdentity.lookup_filter(db, identity_data.external_id)
                 & (ProvidedIdentity.privacy_request_id.is_(None))
             ),
         ).first()
@@ -599,6 +596,9 @@ def _get_or_create_provided_identity(
                     "hashed_value": ProvidedIdentity.hash_value(
                         identity_data.external_id
                     ),
+                    "lookup_hash": ProvidedIdentity.lookup_hash_value(
+                        identity_data.external_id
+                    ),
                     "encrypted_value": {"value": identity_data.external_id},
                 },
             )
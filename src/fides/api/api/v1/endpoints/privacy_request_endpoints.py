@@ -439,14 +439,13 @@ def _filter_privacy_request_queryset(
     )
 
     if identity:
-        hashed_identity = ProvidedIdentity.hash_value(value=identity)
+        identity_filter = ProvidedIdentity.lookup_filter(db, identity)
         identity_set: Set[str] = {
             identity[0]
             for identity in ProvidedIdentity.filter(
                 db=db,
                 conditions=(
-                    (ProvidedIdentity.hashed_value == hashed_identity)
-                    & (ProvidedIdentity.privacy_request_id.isnot(None))
+                    identity_filter & (ProvidedIdentity.privacy_request_id.isnot(None))
                 ),
             ).values(column("privacy_request_id"))
         }
@@ -455,7 +454,7 @@ def _filter_privacy_request_queryset(
     if identities:
         identity_conditions = [
             (ProvidedIdentity.field_name == field_name)
-            & (ProvidedIdentity.hashed_value == ProvidedIdentity.hash_value(value))
+            & ProvidedIdentity.lookup_filter(db, value)
             for field_name, value in identities.items()
         ]
 
@@ -2343,7 +2342,7 @@ def request_task_async_callback(
         # If access data should be added to results package, it should be
         # supplied in request body as a list of rows.  This data will be further filtered
         # by the policy before uploading to the end user
-        request_task.access_data = data.access_results or []
+        request_task.set_access_data(data.access_results or [])
     if data.rows_masked and request_task.action_type == ActionType.erasure:
         # For erasure requests, rows masked can be supplied here.
         request_task.rows_masked = data.rows_masked
@@ -82,10 +82,22 @@ import copy
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from fideslang.validation import FidesKey
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, validator
 
 from fides.api.common_exceptions import FidesopsException
 from fides.api.graph.data_type import (
@@ -439,6 +451,10 @@ class Collection(BaseModel):
     # An optional set of dependent fields that need to be queried together
     grouped_inputs: Set[str] = set()
     data_categories: Set[FidesKey] = set()
+    # Memoized field_paths_by_category, since collections aren't modified once built
+    _field_paths_by_category: Optional[Dict[FidesKey, List[FieldPath]]] = PrivateAttr(
+        default=None
+    )
 
     @property
     def field_dict(self) -> Dict[FieldPath, Field]:
@@ -487,7 +503,7 @@ class Collection(BaseModel):
         return self.field_dict[field_path] if field_path in self.field_dict else None
 
     @property
-    def field_paths_by_category(self) -> Dict[FidesKey, List[FieldPath]]:
+    def field_paths_by_category(self) -> Mapping[FidesKey, List[FieldPath]]:
         """Returns mapping of data categories to a list of FieldPaths, flips FieldPaths -> categories
         to be categories -> FieldPaths.
 
@@ -500,11 +516,13 @@ class Collection(BaseModel):
                 "user.contact.address.postal_code": ["zip"]
             }
         """
-        categories = defaultdict(list)
-        for field_path, field in self.field_dict.items():
-            for category in field.data_categories or []:
-                categories[category].append(field_path)
-        return categories
+        if self._field_paths_by_category is None:
+            categories: Dict[FidesKey, List[FieldPath]] = defaultdict(list)
+            for field_path, field in self.field_dict.items():
+                for category in field.data_categories or []:
+                    categories[category].append(field_path)
+            self._field_paths_by_category = dict(categories)
+        return MappingProxyType(self._field_paths_by_category)
 
     def contains_field(self, func: Callable[[Field], bool]) -> bool:
         """True if any field in this collection matches the condition of the callable
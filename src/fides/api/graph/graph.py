@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Dict, List, Optional, Set, Tuple
+from bisect import bisect_left
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 from fideslang.validation import FidesKey
 from loguru import logger
@@ -17,7 +18,9 @@ from fides.api.graph.config import (
     SeedAddress,
 )
 
-DataCategoryFieldMapping = Dict[CollectionAddress, Dict[FidesKey, List[FieldPath]]]
+DataCategoryFieldMapping = Mapping[
+    CollectionAddress, Mapping[FidesKey, List[FieldPath]]
+]
 
 
 class Node:
@@ -166,6 +169,46 @@ class BidirectionalEdge(Edge):
         return self.contains(addr)
 
 
+class DataCategoryIndex:
+    """Index of the field paths of each collection by data category.
+
+    The categories of each collection are kept sorted, so the categories starting with
+    a given prefix are found with a binary search rather than by scanning all of them.
+    """
+
+    def __init__(self, data_category_field_mapping: DataCategoryFieldMapping) -> None:
+        self._data_category_field_mapping = dict(data_category_field_mapping)
+        self._sorted_categories: Dict[CollectionAddress, List[FidesKey]] = {
+            address: sorted(field_paths_by_category)
+            for address, field_paths_by_category in data_category_field_mapping.items()
+        }
+
+    @property
+    def data_category_field_mapping(self) -> DataCategoryFieldMapping:
+        """A read-only view of the field paths of each collection by data category"""
+        return MappingProxyType(self._data_category_field_mapping)
+
+    def field_paths_for_categories(
+        self, address: CollectionAddress, target_categories: Iterable[str]
+    ) -> Set[FieldPath]:
+        """Returns the field paths of the collection with any of the target categories,
+        or with a category that is a subcategory of one of them"""
+        field_paths_by_category = self._data_category_field_mapping.get(address)
+        if not field_paths_by_category:
+            return set()
+
+        categories = self._sorted_categories[address]
+        field_paths: Set[FieldPath] = set()
+        for target_category in target_categories:
+            index = bisect_left(categories, target_category)
+            while index < len(categories) and categories[index].startswith(
+                target_category
+            ):
+                field_paths.update(field_paths_by_category[categories[index]])
+                index += 1
+        return field_paths
+
+
 class DatasetGraph:
     """Graph representing the entirety of all addressable datasets.
 
@@ -219,13 +262,20 @@ class DatasetGraph:
             for field_path, seed_address in node.collection.identities().items()
         }
 
+        self.data_category_index = DataCategoryIndex(
+            {
+                node_address: node.collection.field_paths_by_category
+                for node_address, node in self.nodes.items()
+            }
+        )
+
     @property
     def data_category_field_mapping(
         self,
     ) -> DataCategoryFieldMapping:
         """
         Maps the data_categories for each traversal_node to a list of field paths that have that
-        same data category.
+        same data category. The mapping is built once and is read-only.
 
         For example:
         {
@@ -239,12 +289,7 @@ class DatasetGraph:
         }
 
         """
-        mapping: Dict[CollectionAddress, Dict[FidesKey, List[FieldPath]]] = defaultdict(
-            lambda: defaultdict(list)
-        )
-        for node_address, node in self.nodes.items():
-            mapping[node_address] = node.collection.field_paths_by_category
-        return mapping
+        return self.data_category_index.data_category_field_mapping
 
     def __repr__(self) -> str:
         return f"Graph: nodes = {self.nodes.keys()}"
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from typing import Any, Callable, Dict, List, Set, Tuple, cast
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, cast
 
 import pydash.collections
 from fideslang.validation import FidesKey
 from loguru import logger
 
-from fides.api.common_exceptions import TraversalError
+from fides.api.common_exceptions import RedisConnectionError, TraversalError
 from fides.api.graph.config import (
     ROOT_COLLECTION_ADDRESS,
     TERMINATOR_ADDRESS,
@@ -20,6 +21,7 @@ from fides.api.graph.config import (
 from fides.api.graph.execution import ExecutionNode
 from fides.api.graph.graph import DatasetGraph, Edge, Node
 from fides.api.models.privacy_request import RequestTask, TraversalDetails
+from fides.api.util.cache import FidesopsRedis, get_cache
 from fides.api.util.collection_util import Row, append, partition
 from fides.api.util.logger_context_utils import Contextualizable, LoggerContextKeys
 from fides.api.util.matching_queue import MatchingQueue
@@ -32,6 +34,11 @@ ARTIFICIAL_NODES: List[CollectionAddress] = [
 Datastore = Dict[CollectionAddress, List[Row]]
 """A type expressing retrieved rows of data from a specified collection"""
 
+TraversalPlan = Dict[str, List]
+"""A serialized traversal: the traversal order, the parent -> child links and the end nodes"""
+
+TRAVERSAL_PLAN_CACHE_PREFIX = "TRAVERSAL_PLAN"
+
 
 class TraversalNode(Contextualizable):
     """Traversal_node type. This type is used for building the graph, not for executing the graph."""
@@ -241,7 +248,131 @@ class Traversal:
                 )
             )
 
-        self.__verify_traversal()
+        # A cached plan only exists if the same traversal has already been verified
+        self.cached_plan: Optional[TraversalPlan] = self.get_cached_plan()
+        if self.cached_plan:
+            self._link_nodes_from_plan(self.cached_plan)
+        else:
+            self.__verify_traversal()
+
+    def plan_cache_key(self) -> str:
+        """Returns the key under which the plan for this traversal is cached.
+
+        The traversal only depends on the graph's nodes, their "after" constraints and its
+        edges, including the edges from the root to the seeded identity fields. Any change
+        to a dataset or to the identities provided results in a different key.
+        """
+        signature = {
+            "nodes": sorted(
+                [
+                    address.value,
+                    sorted(after.value for after in node.collection.after),
+                    sorted(node.dataset.after),
+                ]
+                for address, node in self.graph.nodes.items()
+            ),
+            "edges": sorted(repr(edge) for edge in self.edges),
+        }
+        digest = hashlib.sha256(json.dumps(signature).encode("utf-8")).hexdigest()
+        return f"{TRAVERSAL_PLAN_CACHE_PREFIX}__{digest}"
+
+    def get_cached_plan(self) -> Optional[TraversalPlan]:
+        """Returns the cached plan for this traversal, if one exists"""
+        try:
+            cache: FidesopsRedis = get_cache()
+        except RedisConnectionError:
+            return None
+        cached_plan: Optional[str] = cache.get(self.plan_cache_key())
+        return json.loads(cached_plan) if cached_plan else None
+
+    def cache_plan(
+        self,
+        traversal_nodes: Dict[CollectionAddress, TraversalNode],
+        end_nodes: List[CollectionAddress],
+    ) -> None:
+        """Caches the parent -> child links found by traversing the graph so other
+        traversals of the same graph and identities can skip the traversal"""
+        links: Set[Tuple[str, Tuple[str, ...], str, Tuple[str, ...]]] = {
+            (
+                parent.address.value,
+                parent_field_path.levels,
+                child_address.value,
+                child_field_path.levels,
+            )
+            for parent in [self.root_node, *traversal_nodes.values()]
+            for child_address, children in parent.children.items()
+            for _, parent_field_path, child_field_path in children
+        }
+        plan: TraversalPlan = {
+            "traversal_order": [address.value for address in traversal_nodes],
+            "links": sorted(links),
+            "end_nodes": [address.value for address in end_nodes],
+        }
+        try:
+            cache: FidesopsRedis = get_cache()
+        except RedisConnectionError:
+            return
+        cache.set_with_autoexpire(self.plan_cache_key(), json.dumps(plan))
+
+    def traverse_and_collect_nodes(
+        self,
+    ) -> Tuple[Dict[CollectionAddress, TraversalNode], List[CollectionAddress]]:
+        """Returns every non-root TraversalNode, linked to its parents and children, along
+        with the end nodes of the traversal.
+
+        If the same traversal has been planned before, the nodes are linked from the cached
+        plan. Otherwise the graph is traversed and the resulting plan is cached.
+        """
+        if self.cached_plan:
+            # The nodes were already linked from the plan on init
+            return {
+                address: self.traversal_node_dict[address]
+                for address in map(
+                    CollectionAddress.from_string, self.cached_plan["traversal_order"]
+                )
+            }, [
+                CollectionAddress.from_string(address)
+                for address in self.cached_plan["end_nodes"]
+            ]
+
+        def collect_nodes_fn(
+            tn: TraversalNode, data: Dict[CollectionAddress, TraversalNode]
+        ) -> None:
+            if not tn.is_root_node():
+                data[tn.address] = tn
+
+        traversal_nodes: Dict[CollectionAddress, TraversalNode] = {}
+        end_nodes: List[CollectionAddress] = self.traverse(
+            traversal_nodes, collect_nodes_fn
+        )
+        self.cache_plan(traversal_nodes, end_nodes)
+        return traversal_nodes, end_nodes
+
+    def _link_nodes_from_plan(self, plan: TraversalPlan) -> None:
+        """Links the TraversalNodes to their parents and children as recorded in the plan,
+        in place of traversing the graph"""
+        nodes: Dict[CollectionAddress, TraversalNode] = {
+            self.root_node.address: self.root_node,
+            **self.traversal_node_dict,
+        }
+        for parent_address, parent_levels, child_address, child_levels in plan["links"]:
+            parent = nodes[CollectionAddress.from_string(parent_address)]
+            child = nodes[CollectionAddress.from_string(child_address)]
+            parent_field_path = FieldPath(*parent_levels)
+            child_field_path = FieldPath(*child_levels)
+            append(
+                parent.children,
+                child.address,
+                (child, parent_field_path, child_field_path),
+            )
+            append(
+                child.parents,
+                parent.address,
+                (parent, parent_field_path, child_field_path),
+            )
+
+        for address in plan["end_nodes"]:
+            nodes[CollectionAddress.from_string(address)].is_terminal_node = True
 
     def __verify_traversal(self) -> None:
         """Verify that a valid traversal exists. This method simply assembles a traversal
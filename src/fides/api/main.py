@@ -34,6 +34,7 @@ from fides.api.service.privacy_request.email_batch_service import (
     initiate_scheduled_batch_email_send,
 )
 from fides.api.service.privacy_request.request_service import (
+    initiate_identity_lookup_hash_backfill,
     initiate_poll_for_exited_privacy_request_tasks,
     initiate_scheduled_dsr_data_removal,
 )
@@ -285,6 +286,7 @@ async def setup_server() -> None:
     initiate_scheduled_batch_email_send()
     initiate_poll_for_exited_privacy_request_tasks()
     initiate_scheduled_dsr_data_removal()
+    initiate_identity_lookup_hash_backfill()
 
     logger.debug("Sending startup analytics events...")
     # Avoid circular imports
@@ -3,9 +3,24 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum as EnumType
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from celery.result import AsyncResult
 from loguru import logger
@@ -18,12 +33,19 @@ from sqlalchemy import (
     Integer,
     String,
     UniqueConstraint,
+    and_,
+    case,
+    exists,
+    func,
+    or_,
+    type_coerce,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlalchemy.orm import Query, RelationshipProperty, Session, backref, relationship
 from sqlalchemy.orm.dynamic import AppenderQuery
+from sqlalchemy.sql.expression import BinaryExpression, BooleanClauseList
 from sqlalchemy_utils.types.encrypted.encrypted_type import (
     AesGcmEngine,
     StringEncryptedType,
@@ -35,7 +57,7 @@ from fides.api.common_exceptions import (
     NoCachedManualWebhookEntry,
     PrivacyRequestPaused,
 )
-from fides.api.cryptography.cryptographic_util import hash_with_salt
+from fides.api.cryptography.cryptographic_util import hash_with_salt, hmac_sha256_hash
 from fides.api.db.base_class import Base  # type: ignore[attr-defined]
 from fides.api.db.base_class import JSONTypeOverride
 from fides.api.db.util import EnumColumn
@@ -82,14 +104,21 @@ from fides.api.tasks import celery_app
 from fides.api.util.cache import (
     FidesopsRedis,
     celery_tasks_in_flight,
-    get_all_cache_keys_for_privacy_request,
+    clear_cache_for_privacy_request,
     get_async_task_tracking_cache_key,
     get_cache,
+    get_celery_task_ids_in_flight,
     get_custom_privacy_request_field_cache_key,
     get_drp_request_body_cache_key,
     get_encryption_cache_key,
     get_identity_cache_key,
     get_masking_secret_cache_key,
+    get_privacy_request_cache_index_key,
+)
+from fides.api.util.cache_codec import (
+    MSGPACK_CACHE_CODEC,
+    decode_with_codec,
+    get_cache_codec,
 )
 from fides.api.util.collection_util import Row, extract_key_for_address
 from fides.api.util.constants import API_DATE_FORMAT
@@ -419,10 +448,7 @@ class PrivacyRequest(
         Clean up the cached and persisted data related to this privacy request before
         deleting this object from the database
         """
-        cache: FidesopsRedis = get_cache()
-        all_keys = get_all_cache_keys_for_privacy_request(privacy_request_id=self.id)
-        for key in all_keys:
-            cache.delete(key)
+        clear_cache_for_privacy_request(privacy_request_id=self.id)
 
         for provided_identity in self.provided_identities:  # type: ignore[attr-defined]
             provided_identity.delete(db=db)
@@ -442,6 +468,7 @@ class PrivacyRequest(
                 cache.set_with_autoexpire(
                     get_identity_cache_key(self.id, key),
                     FidesopsRedis.encode_obj(value),
+                    index_key=get_privacy_request_cache_index_key(self.id),
                 )
 
     def cache_custom_privacy_request_fields(
@@ -464,6 +491,7 @@ class PrivacyRequest(
                     cache.set_with_autoexpire(
                         get_custom_privacy_request_field_cache_key(self.id, key),
                         json.dumps(item.value, cls=CustomJSONEncoder),
+                        index_key=get_privacy_request_cache_index_key(self.id),
                     )
         else:
             logger.info(
@@ -501,6 +529,7 @@ class PrivacyRequest(
                     # We don't need to manually encrypt this field, it's done at the ORM level
                     "encrypted_value": {"value": value},
                     "hashed_value": hashed_value,
+                    "lookup_hash": ProvidedIdentity.lookup_hash_value(value),
                 }
 
                 if label is not None:
@@ -599,11 +628,13 @@ class PrivacyRequest(
                     cache.set_with_autoexpire(
                         get_drp_request_body_cache_key(self.id, key),
                         repr(value),
+                        index_key=get_privacy_request_cache_index_key(self.id),
                     )
                 else:
                     cache.set_with_autoexpire(
                         get_drp_request_body_cache_key(self.id, key),
                         value,
+                        index_key=get_privacy_request_cache_index_key(self.id),
                     )
 
     def cache_encryption(self, encryption_key: Optional[str] = None) -> None:
@@ -615,6 +646,7 @@ class PrivacyRequest(
         cache.set_with_autoexpire(
             get_encryption_cache_key(self.id, "key"),
             encryption_key,
+            index_key=get_privacy_request_cache_index_key(self.id),
         )
 
     def cache_masking_secret(self, masking_secret: MaskingSecretCache) -> None:
@@ -629,6 +661,7 @@ class PrivacyRequest(
                 secret_type=masking_secret.secret_type,
             ),
             FidesopsRedis.encode_obj(masking_secret.secret),
+            index_key=get_privacy_request_cache_index_key(self.id),
         )
 
     def get_cached_identity_data(self) -> Dict[str, Any]:
@@ -769,6 +802,7 @@ class PrivacyRequest(
         cache.set_encoded_object(
             f"WEBHOOK_MANUAL_ACCESS_INPUT__{self.id}__{manual_webhook.id}",
             parsed_data.dict(),
+            index_key=get_privacy_request_cache_index_key(self.id),
         )
 
     def cache_manual_webhook_erasure_input(
@@ -785,6 +819,7 @@ class PrivacyRequest(
         cache.set_encoded_object(
             f"WEBHOOK_MANUAL_ERASURE_INPUT__{self.id}__{manual_webhook.id}",
             parsed_data.dict(),
+            index_key=get_privacy_request_cache_index_key(self.id),
         )
 
     def get_manual_webhook_access_input_strict(
@@ -883,7 +918,11 @@ class PrivacyRequest(
         mapped to their associated data uses
         """
         cache: FidesopsRedis = get_cache()
-        cache.set_encoded_object(f"DATA_USE_MAP__{self.id}", value)
+        cache.set_encoded_object(
+            f"DATA_USE_MAP__{self.id}",
+            value,
+            index_key=get_privacy_request_cache_index_key(self.id),
+        )
 
     def get_cached_data_use_map(self) -> Optional[Dict[str, Set[str]]]:
         """
@@ -1157,23 +1196,49 @@ class PrivacyRequest(
         assert terminate  # for mypy
         return terminate
 
-    def get_raw_access_results(self) -> Dict[str, Optional[List[Row]]]:
+    def get_raw_access_results(self) -> Mapping[str, Optional[List[Row]]]:
         """Retrieve the *raw* access data saved on the individual access nodes
 
         These shouldn't be returned to the user - they are not filtered by data category
         """
-        # For DSR 3.0, pull these off of the RequestTask.access_data fields
-        if self.access_tasks.count():
-            final_results: Dict = {}
-            for task in self.access_tasks.filter(
-                RequestTask.status == PrivacyRequestStatus.complete,
-                RequestTask.collection_address.notin_(
-                    [ROOT_COLLECTION_ADDRESS.value, TERMINATOR_ADDRESS.value]
+        # For DSR 3.0, pull these off of the RequestTask data chunks. The results of every
+        # access task are fetched in one query and only decrypted when a collection is read.
+        # Tasks that haven't completed are still fetched, without their data, so that
+        # requests with access tasks are never mistaken for DSR 2.0 requests.
+        task_completed = and_(
+            RequestTask.status == PrivacyRequestStatus.complete,
+            RequestTask.collection_address.notin_(
+                [ROOT_COLLECTION_ADDRESS.value, TERMINATOR_ADDRESS.value]
+            ),
+        )
+        task_rows = (
+            self.access_tasks.outerjoin(
+                RequestTaskDataChunk,
+                and_(
+                    task_completed,
+                    RequestTaskDataChunk.request_task_id == RequestTask.id,
+                    RequestTaskDataChunk.data_type == RequestTaskDataType.access_data,
                 ),
-            ):
-                final_results[task.collection_address] = task.get_access_data()
-
-            return final_results
+            )
+            .with_entities(
+                RequestTask.collection_address,
+                task_completed,
+                # The encrypted values are decrypted lazily by RequestTaskResults
+                case(
+                    [(task_completed, type_coerce(RequestTask.access_data, String))],
+                    else_=None,
+                ),
+                type_coerce(RequestTaskDataChunk.data, String),
+            )
+            .order_by(RequestTask.id, RequestTaskDataChunk.chunk_index)
+            .all()
+        )
+        if task_rows:
+            return RequestTaskResults.from_rows(
+                (collection_address, legacy_data, chunk_data)
+                for collection_address, completed, legacy_data, chunk_data in task_rows
+                if completed
+            )
 
         # TODO Remove when we stop support for DSR 2.0
         # We will no longer be pulling access results from the cache, but off of Request Tasks instead
@@ -1191,14 +1256,17 @@ class PrivacyRequest(
 
         This is largely just used for testing
         """
-        if self.erasure_tasks.count():
+        task_rows = self.erasure_tasks.with_entities(
+            RequestTask.collection_address, RequestTask.status, RequestTask.rows_masked
+        ).all()
+        if task_rows:
             # For DSR 3.0
             return {
-                t.collection_address: t.rows_masked
-                for t in self.erasure_tasks.filter(
-                    RequestTask.status.in_(COMPLETED_EXECUTION_LOG_STATUSES)
-                )
-                if not t.is_root_task and not t.is_terminator_task
+                collection_address: rows_masked
+                for collection_address, status, rows_masked in task_rows
+                if status in COMPLETED_EXECUTION_LOG_STATUSES
+                and collection_address
+                not in (ROOT_COLLECTION_ADDRESS.value, TERMINATOR_ADDRESS.value)
             }
 
         # TODO Remove when we stop support for DSR 2.0
@@ -1214,14 +1282,17 @@ class PrivacyRequest(
 
         This is largely just used for testing
         """
-        if self.consent_tasks.count():
+        task_rows = self.consent_tasks.with_entities(
+            RequestTask.collection_address, RequestTask.status, RequestTask.consent_sent
+        ).all()
+        if task_rows:
             # For DSR 3.0
             return {
-                t.collection_address: t.consent_sent
-                for t in self.consent_tasks.filter(
-                    RequestTask.status.in_(EXITED_EXECUTION_LOG_STATUSES)
-                )
-                if not t.is_root_task and not t.is_terminator_task
+                collection_address: consent_sent
+                for collection_address, status, consent_sent in task_rows
+                if status in EXITED_EXECUTION_LOG_STATUSES
+                and collection_address
+                not in (ROOT_COLLECTION_ADDRESS.value, TERMINATOR_ADDRESS.value)
             }
         # DSR 2.0 does not cache the results so nothing to do here
         return {}
@@ -1311,6 +1382,19 @@ class ProvidedIdentityType(EnumType):
     external_id = "external_id"
 
 
+def get_identity_lookup_hash_key(encoding: str = "UTF-8") -> bytes:
+    """
+    The key for the lookup hashes of provided identities. Unless it's configured, it's
+    derived from the app encryption key, so the lookup hashes can't be computed without it.
+    """
+    if CONFIG.security.identity_lookup_hash_key:
+        return CONFIG.security.identity_lookup_hash_key.encode(encoding)
+    return hmac_sha256_hash(
+        b"fides-identity-lookup-hash",
+        CONFIG.security.app_encryption_key.encode(encoding),
+    ).encode(encoding)
+
+
 class ProvidedIdentity(Base):  # pylint: disable=R0904
     """
     A table for storing identity fields and values provided at privacy request
@@ -1342,6 +1426,12 @@ class ProvidedIdentity(Base):  # pylint: disable=R0904
         unique=False,
         nullable=True,
     )  # This field is used as a blind index for exact match searches
+    lookup_hash = Column(
+        String,
+        index=True,
+        unique=False,
+        nullable=True,
+    )  # A fast, keyed blind index for exact match searches, see lookup_filter
     encrypted_value = Column(
         MutableDict.as_mutable(
             StringEncryptedType(
@@ -1362,6 +1452,12 @@ class ProvidedIdentity(Base):  # pylint: disable=R0904
         cascade="delete, delete-orphan",
     )
 
+    # How long every identity having a lookup hash is trusted for before checking again,
+    # since identities saved by older versions during a rolling deploy won't have one
+    LOOKUP_HASHES_BACKFILLED_TTL_SECONDS = 60
+    # When every identity was last found to have a lookup hash, see lookup_hashes_backfilled
+    _lookup_hashes_backfilled_at: Optional[float] = None
+
     @classmethod
     def hash_value(
         cls,
@@ -1377,6 +1473,65 @@ class ProvidedIdentity(Base):  # pylint: disable=R0904
         )
         return hashed_value
 
+    @classmethod
+    def lookup_hash_value(
+        cls,
+        value: MultiValue,
+        encoding: str = "UTF-8",
+    ) -> str:
+        """
+        Hashes the value with HMAC-SHA256, keyed with CONFIG.security.identity_lookup_hash_key.
+        Unlike hash_value, this is cheap enough to compute for every lookup.
+        """
+        return hmac_sha256_hash(
+            str(value).encode(encoding), get_identity_lookup_hash_key()
+        )
+
+    @classmethod
+    def lookup_filter(
+        cls, db: Session, value: MultiValue
+    ) -> BinaryExpression | BooleanClauseList:
+        """
+        Returns a filter matching the provided identities with the given value by their
+        lookup hash.
+
+        Until the lookup hashes of identities saved before they were introduced have been
+        backfilled, identities without one are also matched by their bcrypt hashed_value.
+        """
+        lookup_hash_matches = cls.lookup_hash == cls.lookup_hash_value(value)
+        if cls.lookup_hashes_backfilled(db):
+            return lookup_hash_matches
+        return or_(
+            lookup_hash_matches,
+            and_(cls.lookup_hash.is_(None), cls.hashed_value == cls.hash_value(value)),
+        )
+
+    @classmethod
+    def lookup_hashes_backfilled(cls, db: Session) -> bool:
+        """
+        Whether every identity that can be looked up has a lookup hash. Once true, this is
+        cached for LOOKUP_HASHES_BACKFILLED_TTL_SECONDS.
+        """
+        backfilled_at = cls._lookup_hashes_backfilled_at
+        if (
+            backfilled_at is not None
+            and time.monotonic() - backfilled_at
+            < cls.LOOKUP_HASHES_BACKFILLED_TTL_SECONDS
+        ):
+            return True
+
+        backfilled = not db.query(
+            exists().where(
+                and_(
+                    cls.lookup_hash.is_(None),
+                    cls.hashed_value.isnot(None),
+                    cls.encrypted_value.isnot(None),
+                )
+            )
+        ).scalar()
+        cls._lookup_hashes_backfilled_at = time.monotonic() if backfilled else None
+        return backfilled
+
     def as_identity_schema(self) -> Identity:
         """Creates an Identity schema from a ProvidedIdentity record in the application DB."""
 
@@ -1838,6 +1993,16 @@ class RequestTask(Base):
         uselist=False,
     )
 
+    # Access data and data for erasures saved with set_access_data and set_data_for_erasures,
+    # split into encrypted, compressed chunks
+    data_chunks: RelationshipProperty[AppenderQuery] = relationship(
+        "RequestTaskDataChunk",
+        lazy="dynamic",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="RequestTaskDataChunk.chunk_index",
+    )
+
     @property
     def request_task_address(self) -> CollectionAddress:
         """Convert the collection_address into Collection Address format"""
@@ -1861,11 +2026,79 @@ class RequestTask(Base):
 
     def get_access_data(self) -> List[Row]:
         """Helper to retrieve access data or default to empty list"""
-        return self.access_data or []
+        return list(self.iter_access_data())
 
     def get_data_for_erasures(self) -> List[Row]:
         """Helper to retrieve erasure data needed to build masking requests or default to empty list"""
-        return self.data_for_erasures or []
+        return list(self.iter_data_for_erasures())
+
+    def iter_access_data(self) -> Iterator[Row]:
+        """Yields the access data rows, decoding a single chunk at a time"""
+        return self._iter_data(RequestTaskDataType.access_data)
+
+    def iter_data_for_erasures(self) -> Iterator[Row]:
+        """Yields the data for erasures rows, decoding a single chunk at a time"""
+        return self._iter_data(RequestTaskDataType.data_for_erasures)
+
+    def get_access_data_row_count(self) -> int:
+        """Returns the number of access data rows without decoding them"""
+        return self._get_row_count(RequestTaskDataType.access_data)
+
+    def get_data_for_erasures_row_count(self) -> int:
+        """Returns the number of data for erasures rows without decoding them"""
+        return self._get_row_count(RequestTaskDataType.data_for_erasures)
+
+    def set_access_data(self, rows: Iterable[Row]) -> None:
+        """Saves the access data, replacing any previously saved access data"""
+        self._set_data(RequestTaskDataType.access_data, rows)
+
+    def set_data_for_erasures(self, rows: Iterable[Row]) -> None:
+        """Saves the data for erasures, replacing any previously saved data for erasures"""
+        self._set_data(RequestTaskDataType.data_for_erasures, rows)
+
+    def _get_data_chunks(self, data_type: RequestTaskDataType) -> Query:
+        return self.data_chunks.filter(RequestTaskDataChunk.data_type == data_type)
+
+    def _iter_data(self, data_type: RequestTaskDataType) -> Iterator[Row]:
+        """
+        Yields the rows saved in data chunks. Tasks that aren't in a session, or whose
+        data was saved before it was chunked, fall back to the data stored on the task itself.
+        """
+        found_chunks = False
+        if Session.object_session(self) is not None:
+            for chunk in self._get_data_chunks(data_type):
+                found_chunks = True
+                yield from chunk.get_rows()
+        if not found_chunks:
+            yield from getattr(self, data_type.value) or []
+
+    def _get_row_count(self, data_type: RequestTaskDataType) -> int:
+        db: Optional[Session] = Session.object_session(self)
+        if db is not None:
+            chunk_count, row_count = (
+                db.query(
+                    func.count(RequestTaskDataChunk.id),
+                    func.sum(RequestTaskDataChunk.row_count),
+                )
+                .filter(
+                    RequestTaskDataChunk.request_task_id == self.id,
+                    RequestTaskDataChunk.data_type == data_type,
+                )
+                .one()
+            )
+            if chunk_count:
+                return row_count
+        return len(getattr(self, data_type.value) or [])
+
+    def _set_data(self, data_type: RequestTaskDataType, rows: Iterable[Row]) -> None:
+        """
+        Splits the rows into chunks of CONFIG.execution.request_task_data_chunk_size rows,
+        which are saved along with the task. Tasks that aren't in a session store
+        the rows on the task itself.
+        """
+        writer = RequestTaskDataWriter(self, data_type)
+        writer.write(rows)
+        writer.close()
 
     def update_status(self, db: Session, status: ExecutionLogStatus) -> None:
         """Helper method to update a task's status"""
@@ -1891,6 +2124,87 @@ class RequestTask(Base):
             RequestTask.status == ExecutionLogStatus.pending,
         )
 
+    def get_ready_downstream_tasks(self, db: Session) -> List["RequestTask"]:
+        """Returns the immediate downstream tasks that are still pending, have all of their
+        upstream tasks complete, and are not running in another celery task.
+
+        Equivalent to calling can_queue_request_task on each pending downstream task, but
+        the upstream statuses of every downstream task are loaded in a single query and the
+        cached celery task IDs are fetched in a single round trip.
+        """
+        pending_downstream: List[RequestTask] = self.get_pending_downstream_tasks(
+            db
+        ).all()
+        if not pending_downstream:
+            return []
+
+        upstream_addresses: Set[str] = {
+            address
+            for downstream_task in pending_downstream
+            for address in downstream_task.upstream_tasks or []
+        }
+        upstream_statuses: Dict[str, ExecutionLogStatus] = dict(
+            db.query(RequestTask.collection_address, RequestTask.status).filter(
+                RequestTask.privacy_request_id == self.privacy_request_id,
+                RequestTask.action_type == self.action_type,
+                RequestTask.collection_address.in_(upstream_addresses),
+            )
+        )
+
+        upstream_complete: List[RequestTask] = []
+        for downstream_task in pending_downstream:
+            if all(
+                upstream_statuses.get(address) in COMPLETED_EXECUTION_LOG_STATUSES
+                for address in downstream_task.upstream_tasks or []
+            ):
+                upstream_complete.append(downstream_task)
+            else:
+                logger.debug(
+                    "Upstream tasks incomplete for {} task {}. Privacy Request: {}, Request Task {}.",
+                    downstream_task.action_type.value,
+                    downstream_task.collection_address,
+                    downstream_task.privacy_request_id,
+                    downstream_task.id,
+                )
+        if not upstream_complete:
+            return []
+
+        cache: FidesopsRedis = get_cache()
+        cached_task_ids: Dict[str, Optional[Any]] = cache.get_values(
+            [
+                get_async_task_tracking_cache_key(downstream_task.id)
+                for downstream_task in upstream_complete
+            ]
+        )
+        celery_task_ids: Dict[str, str] = {
+            downstream_task.id: cached_task_id
+            for downstream_task in upstream_complete
+            if (
+                cached_task_id := cached_task_ids[
+                    get_async_task_tracking_cache_key(downstream_task.id)
+                ]
+            )
+        }
+        in_flight: Set[str] = get_celery_task_ids_in_flight(
+            list(celery_task_ids.values())
+        )
+
+        ready: List[RequestTask] = []
+        for downstream_task in upstream_complete:
+            celery_task_id: Optional[str] = celery_task_ids.get(downstream_task.id)
+            if celery_task_id in in_flight:
+                logger.debug(
+                    "Celery Task {} already processing for {} task {}. Privacy Request: {}, Request Task {}.",
+                    celery_task_id,
+                    downstream_task.action_type.value,
+                    downstream_task.collection_address,
+                    downstream_task.privacy_request_id,
+                    downstream_task.id,
+                )
+                continue
+            ready.append(downstream_task)
+        return ready
+
     def can_queue_request_task(self, db: Session, should_log: bool = False) -> bool:
         """Returns True if upstream tasks are complete and the current Request Task
         is not running in another celery task.
@@ -1964,3 +2278,245 @@ class RequestTask(Base):
             )
 
         return task_in_flight
+
+
+class RequestTaskDataType(EnumType):
+    """The kinds of data saved in chunks for a Request Task"""
+
+    access_data = "access_data"
+    data_for_erasures = "data_for_erasures"
+
+
+class RequestTaskDataChunk(Base):
+    """
+    A chunk of the access data or data for erasures saved for a Request Task.
+
+    Rows are encoded with msgpack, compressed and encrypted, and the number of rows in
+    each chunk is stored alongside so results can be counted without decrypting them.
+    """
+
+    request_task_id = Column(
+        String,
+        ForeignKey(RequestTask.id_field_path, ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    data_type = Column(
+        EnumColumn(
+            RequestTaskDataType,
+            native_enum=False,
+            values_callable=lambda x: [i.value for i in x],
+        ),
+        nullable=False,
+    )
+    chunk_index = Column(Integer, nullable=False)
+    row_count = Column(Integer, nullable=False)
+    data = Column(
+        StringEncryptedType(
+            type_in=String(),
+            key=CONFIG.security.app_encryption_key,
+            engine=AesGcmEngine,
+            padding="pkcs5",
+        ),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "request_task_id",
+            "data_type",
+            "chunk_index",
+            name="request_task_data_chunk_uc",
+        ),
+    )
+
+    @classmethod
+    def from_rows(
+        cls, data_type: RequestTaskDataType, chunk_index: int, rows: List[Row]
+    ) -> "RequestTaskDataChunk":
+        """Builds a chunk holding the encoded rows"""
+        return cls(
+            data_type=data_type,
+            chunk_index=chunk_index,
+            row_count=len(rows),
+            data=get_cache_codec(MSGPACK_CACHE_CODEC).encode(rows),
+        )
+
+    def get_rows(self) -> List[Row]:
+        """Decodes the rows held in this chunk"""
+        return decode_with_codec(self.data)
+
+
+class RequestTaskDataWriter:
+    """
+    Saves rows to a Request Task as they're produced, replacing any rows of the same
+    data type that were saved before.
+
+    Rows are buffered until a full chunk of CONFIG.execution.request_task_data_chunk_size
+    rows can be saved, and each chunk is flushed as soon as it's built, so no more than
+    one chunk of rows is held in memory. Tasks that aren't in a session collect the
+    rows on the task itself.
+    """
+
+    def __init__(
+        self, request_task: RequestTask, data_type: RequestTaskDataType
+    ) -> None:
+        self.request_task = request_task
+        self.data_type = data_type
+        self.db: Optional[Session] = Session.object_session(request_task)
+        self.chunk_index = 0
+        self.pending_rows: List[Row] = []
+
+        if self.db is None:
+            setattr(request_task, data_type.value, [])
+            return
+
+        # Chunks appended by an earlier write are flushed first so that they're replaced too,
+        # and the replaced chunks are removed from the session along with the database
+        self.db.flush()
+        self.db.query(RequestTaskDataChunk).filter(
+            RequestTaskDataChunk.request_task_id == request_task.id,
+            RequestTaskDataChunk.data_type == data_type,
+        ).delete(synchronize_session="fetch")
+        setattr(request_task, data_type.value, None)
+
+    def write(self, rows: Iterable[Row]) -> None:
+        """Adds the rows, saving every full chunk"""
+        if self.db is None:
+            getattr(self.request_task, self.data_type.value).extend(rows)
+            return
+
+        chunk_size: int = CONFIG.execution.request_task_data_chunk_size
+        for row in rows:
+            self.pending_rows.append(row)
+            if len(self.pending_rows) >= chunk_size:
+                self._save_chunk()
+
+    def close(self) -> None:
+        """Saves the remaining rows"""
+        if self.pending_rows:
+            self._save_chunk()
+
+    def _save_chunk(self) -> None:
+        self.request_task.data_chunks.append(
+            RequestTaskDataChunk.from_rows(
+                self.data_type, self.chunk_index, self.pending_rows
+            )
+        )
+        self.chunk_index += 1
+        self.pending_rows = []
+        # Flushed chunks are no longer held by the session once they're written
+        self.db.flush()  # type: ignore[union-attr]
+
+
+@dataclass
+class EncryptedTaskResults:
+    """
+    The still encrypted access data of a single Request Task: either its data chunks,
+    in order, or the data saved on the task itself before results were chunked
+    """
+
+    legacy_data: Optional[str]
+    chunks: List[str]
+
+    def decode(self) -> List[Row]:
+        """Decrypts and decodes the rows"""
+        if self.chunks:
+            chunk_type: StringEncryptedType = RequestTaskDataChunk.data.type
+            rows: List[Row] = []
+            for chunk in self.chunks:
+                rows.extend(
+                    decode_with_codec(chunk_type.process_result_value(chunk, None))
+                )
+            return rows
+
+        legacy_type: StringEncryptedType = RequestTask.access_data.type
+        return legacy_type.process_result_value(self.legacy_data, None) or []
+
+
+class RequestTaskResults(Mapping[str, List[Row]]):
+    """
+    A read-only mapping of collection address to the access data saved on a Privacy
+    Request's completed Request Tasks.
+
+    The encrypted results of every task are fetched up front in a single query, but a
+    collection's results are only decrypted and decoded the first time they're read,
+    so callers only pay for the collections they use. prefetch decodes the remaining
+    collections on a pool of worker threads.
+    """
+
+    def __init__(
+        self,
+        encrypted_results: Dict[str, EncryptedTaskResults],
+        decoded_results: Optional[Dict[str, List[Row]]] = None,
+    ) -> None:
+        self._encrypted_results = encrypted_results
+        self._decoded_results: Dict[str, List[Row]] = decoded_results or {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple]) -> "RequestTaskResults":
+        """
+        Groups rows of (collection address, legacy access data, chunk data), ordered by
+        task and chunk index, by collection. Encrypted values are kept as they are.
+        """
+        encrypted_results: Dict[str, EncryptedTaskResults] = {}
+        for collection_address, legacy_data, chunk_data in rows:
+            if collection_address not in encrypted_results:
+                encrypted_results[collection_address] = EncryptedTaskResults(
+                    legacy_data=legacy_data, chunks=[]
+                )
+            if chunk_data is not None:
+                encrypted_results[collection_address].chunks.append(chunk_data)
+        return cls(encrypted_results)
+
+    def __getitem__(self, collection_address: str) -> List[Row]:
+        if collection_address not in self._decoded_results:
+            rows = self._encrypted_results[collection_address].decode()
+            with self._lock:
+                self._decoded_results.setdefault(collection_address, rows)
+        return self._decoded_results[collection_address]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._encrypted_results)
+
+    def __len__(self) -> int:
+        return len(self._encrypted_results)
+
+    def select(self, collection_addresses: Iterable[str]) -> "RequestTaskResults":
+        """Returns the results of only the given collections, without decoding them"""
+        encrypted_results = {
+            address: self._encrypted_results[address]
+            for address in collection_addresses
+        }
+        return RequestTaskResults(
+            encrypted_results,
+            {
+                address: rows
+                for address, rows in self._decoded_results.items()
+                if address in encrypted_results
+            },
+        )
+
+    def prefetch(self, max_workers: Optional[int] = None) -> None:
+        """
+        Decodes every collection that hasn't been read yet, using up to
+        CONFIG.execution.request_task_results_decode_workers threads.
+        """
+        pending = [
+            address
+            for address in self._encrypted_results
+            if address not in self._decoded_results
+        ]
+        workers = min(
+            max_workers or CONFIG.execution.request_task_results_decode_workers,
+            len(pending),
+        )
+        if workers <= 1:
+            for address in pending:
+                self[address]  # pylint: disable=pointless-statement
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the results so decoding errors are raised here
+            list(executor.map(self.__getitem__, pending))
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional, Set, Union
 
 from fideslang.models import FidesCollectionKey, FidesDatasetReference
 from fideslang.validation import FidesKey
-from pydantic import BaseModel, Extra, root_validator, validator
+from pydantic import BaseModel, Extra, PositiveInt, root_validator, validator
 
 from fides.api.common_exceptions import ValidationError
 from fides.api.graph.config import (
@@ -419,6 +419,7 @@ class SaaSConfig(SaaSConfigBase):
     test_request: SaaSRequest
     data_protection_request: Optional[SaaSRequest] = None  # GDPR Delete
     rate_limit_config: Optional[RateLimitConfig]
+    max_concurrent_requests: Optional[PositiveInt]
     consent_requests: Optional[ConsentRequestMap]
     user_guide: Optional[str]
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generator, Generic, List, Optional, TypeVar
 
 from sqlalchemy.orm import Session
 
@@ -74,6 +74,22 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
         The input data is expected to include a key and list of values for
         each input key that may be queried on."""
 
+    def retrieve_data_in_chunks(
+        self,
+        node: ExecutionNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        request_task: RequestTask,
+        input_data: Dict[str, List[Any]],
+    ) -> Generator[List[Row], None, None]:
+        """Retrieve data as a series of row chunks so callers can process results incrementally.
+
+        Defaults to returning all of the results of retrieve_data as a single chunk. Override
+        on connectors that are able to stream results from their datastore."""
+        yield self.retrieve_data(
+            node, policy, privacy_request, request_task, input_data
+        )
+
     @abstractmethod
     def mask_data(
         self,
@@ -1,8 +1,10 @@
+import random
 import time
 from enum import Enum
-from typing import List
+from typing import Dict, List, Optional
 
 from loguru import logger
+from redis.client import Script  # type: ignore
 
 from fides.api.common_exceptions import RedisConnectionError
 from fides.api.util.cache import FidesopsRedis, get_cache
@@ -47,12 +49,52 @@ class RateLimiterTimeoutException(Exception):
     """
 
 
+# Atomically reserves one call in every bucket, or in none of them.
+#
+# KEYS[1..n] are the bucket keys for the current time window and KEYS[n+1..2n] are the
+# metrics hashes for each request key and period. ARGV[1..n] are the rate limits, ARGV[n+1..2n] are
+# the bucket expirations and ARGV[2n+1] is the metrics expiration.
+#
+# Returns the (1-based) indices of the breached buckets, so an empty list means the
+# reservation succeeded.
+RESERVE_SCRIPT = """
+local n = #KEYS / 2
+local breached = {}
+for i = 1, n do
+    local used = tonumber(redis.call('GET', KEYS[i]) or '0')
+    if used >= tonumber(ARGV[i]) then
+        table.insert(breached, i)
+    end
+end
+if #breached == 0 then
+    for i = 1, n do
+        redis.call('INCR', KEYS[i])
+        redis.call('EXPIRE', KEYS[i], ARGV[n + i])
+        redis.call('HINCRBY', KEYS[n + i], 'reservations', 1)
+        redis.call('EXPIRE', KEYS[n + i], ARGV[2 * n + 1])
+    end
+else
+    for _, i in ipairs(breached) do
+        redis.call('HINCRBY', KEYS[n + i], 'breaches', 1)
+        redis.call('EXPIRE', KEYS[n + i], ARGV[2 * n + 1])
+    end
+end
+return breached
+"""
+
+
 class RateLimiter:
     """
     A rate limiter which interacts with Redis to provide a shared state between fidesops instances
     """
 
     EXPIRE_AFTER_PERIOD_SECONDS: int = 500
+    METRICS_EXPIRE_SECONDS: int = RateLimiterPeriod.DAY.factor
+    # Upper bound on the random delay added to waits, so that callers waiting on the
+    # same bucket don't all retry at the exact start of the next time window
+    MAX_WAIT_JITTER_SECONDS: float = 0.05
+    # The reserve script, registered on first use and shared by every rate limiter
+    _reserve_script: Optional[Script] = None
 
     def build_redis_key(self, current_seconds: int, request: RateLimiterRequest) -> str:
         """
@@ -64,61 +106,108 @@ class RateLimiter:
         redis_key = f"{request.key}:{request.period.label}:{fixed_time_filter}"
         return redis_key
 
-    def increment_usage(
+    @staticmethod
+    def build_metrics_key(request_key: str, period: RateLimiterPeriod) -> str:
+        """
+        Builds the key of the hash holding usage metrics for a rate limit key and period
+        """
+        return f"rate_limiter_metrics:{request_key}:{period.label}"
+
+    @classmethod
+    def get_reserve_script(cls, redis: FidesopsRedis) -> Script:
+        """
+        Returns the reserve script, registering it the first time it's needed. Redis
+        caches the script by its hash, so it only has to be sent once per server.
+        """
+        script = cls._reserve_script
+        if script is None:
+            script = cls._reserve_script = redis.register_script(RESERVE_SCRIPT)
+        return script
+
+    def reserve(
         self,
         redis: FidesopsRedis,
         current_seconds: int,
         requests: List[RateLimiterRequest],
-    ) -> List[int]:
+    ) -> List[RateLimiterRequest]:
         """
-        Increments the call count for the given requests for rate limitting.
+        Atomically reserves a call in the current time bucket of every request. Either all of
+        the buckets are incremented or, if any of them is already at its rate limit, none are.
 
-        Also sets an expire time on the redis key.
+        Returns the requests whose buckets are full, which is empty on a successful reservation.
         """
-        pipe = redis.pipeline()
-        for request in requests:
-            redis_key = self.build_redis_key(
-                current_seconds=current_seconds, request=request
-            )
-            pipe.incrby(redis_key, 1)
-            pipe.expire(
-                redis_key, request.period.factor + self.EXPIRE_AFTER_PERIOD_SECONDS
-            )
-        response = pipe.execute()
-
-        found_bucket_usages = []
-        for index, request in enumerate(requests):
-            # alternates between incr and expire responses
-            found_bucket_usages.append(response[index * 2])
+        script = self.get_reserve_script(redis)
+        keys = [
+            self.build_redis_key(current_seconds=current_seconds, request=request)
+            for request in requests
+        ] + [
+            self.build_metrics_key(request.key, request.period) for request in requests
+        ]
+        args = (
+            [request.rate_limit for request in requests]
+            + [
+                request.period.factor + self.EXPIRE_AFTER_PERIOD_SECONDS
+                for request in requests
+            ]
+            + [self.METRICS_EXPIRE_SECONDS]
+        )
+        breached_indices: List[int] = script(keys=keys, args=args, client=redis)
+        return [requests[int(index) - 1] for index in breached_indices]
 
-        return found_bucket_usages
+    @staticmethod
+    def seconds_until_available(
+        current_time: float, breached_requests: List[RateLimiterRequest]
+    ) -> float:
+        """
+        Returns the number of seconds until every breached bucket has rolled over into a new time window
+        """
+        return max(
+            (int(current_time / request.period.factor) + 1) * request.period.factor
+            - current_time
+            for request in breached_requests
+        )
 
-    def decrement_usage(
+    def record_metrics(
         self,
         redis: FidesopsRedis,
-        current_seconds: int,
         requests: List[RateLimiterRequest],
+        metrics: Dict[str, float],
     ) -> None:
         """
-        Decrements the call count for the given requests for rate limitting.
+        Increments the given usage metrics for the key and period of each of the given requests
         """
         pipe = redis.pipeline()
         for request in requests:
-            redis_key = self.build_redis_key(
-                current_seconds=current_seconds, request=request
-            )
-            pipe.decrby(redis_key, 1)
+            metrics_key = self.build_metrics_key(request.key, request.period)
+            for metric, amount in metrics.items():
+                pipe.hincrbyfloat(metrics_key, metric, amount)
+            pipe.expire(metrics_key, self.METRICS_EXPIRE_SECONDS)
         pipe.execute()
 
+    def get_metrics(
+        self, request_key: str, period: RateLimiterPeriod
+    ) -> Dict[str, float]:
+        """
+        Returns the usage metrics recorded for a rate limit key and period: the number of
+        successful reservations, breached reservation attempts, waits, total seconds spent
+        waiting and timeouts.
+        """
+        redis: FidesopsRedis = get_cache()
+        metrics = redis.hgetall(self.build_metrics_key(request_key, period))
+        return {
+            (name.decode() if isinstance(name, bytes) else name): float(value)
+            for name, value in metrics.items()
+        }
+
     def limit(
         self, requests: List[RateLimiterRequest], timeout_seconds: int = 30
     ) -> None:
         """
-        Increments call count for the current time bucket and verifies that it is within the
-        rate limit provided. If limit is breached it will decrement the count and try again
-        until it can successfully reserve a call, or timeout. Because we rely on optimistic
-        locking for many keys at a time, it is possible that concurrent rate limiters could
-        make the wrong decision in between increment to decrement operations.
+        Reserves a call in the current time bucket of every request, with all of the rate
+        limits checked and incremented in a single atomic Redis script. If any limit is
+        breached, no bucket is incremented and the caller sleeps until the breached buckets
+        roll over into their next time window before trying again. If that is later than the
+        timeout allows, a RateLimiterTimeoutException is raised right away.
 
         If connection to the redis cluster fails then rate limiter will be skipped.
 
@@ -134,33 +223,33 @@ class RateLimiter:
             )
             return
 
-        start_time = time.time()
-        while time.time() - start_time < timeout_seconds:
-            current_seconds = int(time.time())
-
-            bucket_usages = self.increment_usage(
-                redis=redis, current_seconds=current_seconds, requests=requests
+        deadline = time.time() + timeout_seconds
+        while True:
+            current_time = time.time()
+            breached_requests = self.reserve(
+                redis=redis, current_seconds=int(current_time), requests=requests
             )
-
-            breached_requests = [
-                request
-                for index, request in enumerate(requests)
-                if bucket_usages[index] > request.rate_limit
-            ]
-
-            if breached_requests:
-                logger.debug(
-                    "Breached rate limits: {}. Decrementing usage and trying again.",
-                    ",".join(str(r) for r in breached_requests),
-                )
-                self.decrement_usage(
-                    redis=redis, current_seconds=current_seconds, requests=requests
-                )
-                time.sleep(0.1)
-            else:
+            if not breached_requests:
                 # success
                 return
 
+            wait_seconds = self.seconds_until_available(
+                current_time, breached_requests
+            ) + random.uniform(0, self.MAX_WAIT_JITTER_SECONDS)
+            if current_time + wait_seconds > deadline:
+                break
+
+            logger.debug(
+                "Breached rate limits: {}. Waiting {:.3f} seconds for the next available time bucket.",
+                ",".join(str(r) for r in breached_requests),
+                wait_seconds,
+            )
+            self.record_metrics(
+                redis, breached_requests, {"waits": 1, "wait_seconds": wait_seconds}
+            )
+            time.sleep(wait_seconds)
+
+        self.record_metrics(redis, breached_requests, {"timeouts": 1})
         error_message = f"Timeout waiting for rate limiter. Last breached requests: {','.join(str(r) for r in breached_requests)}"
         logger.error(error_message)
         raise RateLimiterTimeoutException(error_message)
@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+import pydash
+from loguru import logger
+
+from fides.api.graph.config import Field, FieldPath, MaskingOverride
+from fides.api.models.policy import Rule
+from fides.api.service.masking.strategy.masking_strategy import MaskingStrategy
+from fides.api.service.masking.strategy.masking_strategy_nullify import (
+    NullMaskingStrategy,
+)
+from fides.api.task.refine_target_path import (
+    build_refined_target_paths,
+    join_detailed_path,
+)
+from fides.api.util.collection_util import Row
+
+
+@dataclass
+class MaskingTarget:
+    """A field path targeted by an erasure rule, along with how its values are masked"""
+
+    field_path: FieldPath
+    strategy: MaskingStrategy
+    masking_override: MaskingOverride
+    null_masking: bool
+
+
+def build_masking_targets(
+    rule_to_collection_field_paths: Dict[Rule, List[FieldPath]],
+    field_map: Dict[FieldPath, Field],
+) -> List[MaskingTarget]:
+    """
+    Resolves the masking strategy and masking override of every field path targeted by
+    the given erasure rules, skipping fields whose data type the strategy doesn't support.
+    """
+    targets: List[MaskingTarget] = []
+    for rule, field_paths in rule_to_collection_field_paths.items():
+        strategy_config = rule.masking_strategy
+        if not strategy_config:
+            continue
+        strategy: MaskingStrategy = MaskingStrategy.get_strategy(
+            strategy_config["strategy"], strategy_config["configuration"]
+        )
+        null_masking: bool = strategy_config.get("strategy") == NullMaskingStrategy.name
+        for rule_field_path in field_paths:
+            field: Field = field_map[rule_field_path]
+            masking_override = MaskingOverride(field.data_type_converter, field.length)
+            if not _supported_data_type(masking_override, null_masking, strategy):
+                logger.warning(
+                    "Unable to generate a query for field {}: data_type is either not present on the field or not supported for the {} masking strategy. Received data type: {}",
+                    rule_field_path.string_path,
+                    strategy_config["strategy"],
+                    masking_override.data_type_converter.name,  # type: ignore
+                )
+                continue
+            targets.append(
+                MaskingTarget(
+                    field_path=rule_field_path,
+                    strategy=strategy,
+                    masking_override=masking_override,
+                    null_masking=null_masking,
+                )
+            )
+    return targets
+
+
+def update_value_maps(
+    rows: List[Row], targets: List[MaskingTarget], request_id: str
+) -> List[Dict[str, Any]]:
+    """Returns the update value map of each of the given rows.
+
+    Masking is done column by column: the values of each targeted field path are
+    gathered across all of the rows, masked with a single call to the masking strategy,
+    and the masked values are scattered back to the value map of the row they came from.
+    """
+    value_maps: List[Dict[str, Any]] = [{} for _ in rows]
+    for target in targets:
+        locations: List[Tuple[int, str]] = []
+        values: List[Any] = []
+        for index, row in enumerate(rows):
+            for path in build_refined_target_paths(
+                row, query_paths={target.field_path: None}
+            ):
+                detailed_path = join_detailed_path(path)
+                locations.append((index, detailed_path))
+                values.append(pydash.objects.get(row, detailed_path))
+
+        if not values:
+            continue
+
+        masked_values = _generate_masked_values(request_id, target, values)
+        for (index, detailed_path), masked_value in zip(locations, masked_values):
+            value_maps[index][detailed_path] = masked_value
+    return value_maps
+
+
+def _supported_data_type(
+    masking_override: MaskingOverride, null_masking: bool, strategy: MaskingStrategy
+) -> bool:
+    """Helper method to determine whether given data_type exists and is supported by the masking strategy"""
+    if null_masking:
+        return True
+    if not masking_override.data_type_converter:
+        return False
+    if not strategy.data_type_supported(
+        data_type=masking_override.data_type_converter.name
+    ):
+        return False
+    return True
+
+
+def _generate_masked_values(
+    request_id: str, target: MaskingTarget, values: List[Any]
+) -> List[Any]:
+    masked_values: List[Any] = target.strategy.mask(values, request_id)  # type: ignore
+    str_field_path = target.field_path.string_path
+
+    logger.debug(
+        "Generated {} masked value(s) for field {}",
+        len(masked_values),
+        str_field_path,
+    )
+
+    # special case for null masking
+    if target.null_masking:
+        return masked_values
+
+    masking_override = target.masking_override
+    if masking_override.length:
+        logger.warning(
+            "Because a length has been specified for field {}, we will truncate length of masked value to match, regardless of masking strategy",
+            str_field_path,
+        )
+        #  for strategies other than null masking we assume that masked data type is the same as specified data type
+        masked_values = [
+            masking_override.data_type_converter.truncate(  # type: ignore
+                masking_override.length, masked_value
+            )
+            for masked_value in masked_values
+        ]
+    return masked_values
@@ -1,8 +1,8 @@
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
-from pymongo import MongoClient
-from pymongo.errors import OperationFailure, ServerSelectionTimeoutError
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure, ServerSelectionTimeoutError
 
 from fides.api.common_exceptions import ConnectionException
 from fides.api.graph.execution import ExecutionNode
@@ -13,9 +13,10 @@ from fides.api.schemas.connection_configuration.connection_secrets_mongodb impor
     MongoDBSchema,
 )
 from fides.api.service.connectors.base_connector import BaseConnector
-from fides.api.service.connectors.query_config import MongoQueryConfig, QueryConfig
-from fides.api.util.collection_util import Row
+from fides.api.service.connectors.query_config import MongoQueryConfig
+from fides.api.util.collection_util import Row, chunks
 from fides.api.util.logger import Pii
+from fides.config import CONFIG
 
 
 class MongoDBConnector(BaseConnector[MongoClient]):
@@ -50,7 +51,7 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         except ValueError:
             raise ConnectionException("Value Error connecting to MongoDB.")
 
-    def query_config(self, node: ExecutionNode) -> QueryConfig[Any]:
+    def query_config(self, node: ExecutionNode) -> MongoQueryConfig:
         """Query wrapper corresponding to the input traversal_node."""
         return MongoQueryConfig(node)
 
@@ -111,7 +112,9 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         collection = db[collection_name]
         rows = []
         logger.info("Starting data retrieval for {}", node.address)
-        for row in collection.find(query_data, fields):
+        for row in collection.find(
+            query_data, fields, batch_size=CONFIG.execution.mongo_retrieval_batch_size
+        ):
             rows.append(row)
         logger.info("Found {} rows on {}", len(rows), node.address)
         return rows
@@ -124,28 +127,54 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         request_task: RequestTask,
         rows: List[Row],
     ) -> int:
-        """Execute a masking request"""
+        """Execute a masking request. Returns the number of documents masked
+
+        The update of each row is sent to the database as an unordered bulk write of at
+        most `CONFIG.execution.mongo_masking_batch_size` updates at a time.
+        """
         query_config = self.query_config(node)
         collection_name = node.address.collection
-        client = self.client()
-        update_ct = 0
-        for row in rows:
-            update_stmt = query_config.generate_update_stmt(
-                row, policy, privacy_request
-            )
+        update_ops: List[UpdateOne] = []
+        for update_stmt in query_config.generate_update_stmts(
+            rows, policy, privacy_request
+        ):
             if update_stmt is not None:
                 query, update = update_stmt
-                db = client[node.address.dataset]
-                collection = db[collection_name]
-                update_result = collection.update_one(query, update, upsert=False)
-                update_ct += update_result.modified_count
-                logger.info(
+                update_ops.append(UpdateOne(query, update, upsert=False))
+                logger.debug(
                     "db.{}.update_one({}, {}, upsert=False)",
                     collection_name,
                     Pii(query),
                     Pii(update),
                 )
 
+        if not update_ops:
+            return 0
+
+        client = self.client()
+        collection = client[node.address.dataset][collection_name]
+        update_ct = 0
+        for batch in chunks(update_ops, CONFIG.execution.mongo_masking_batch_size):
+            try:
+                bulk_write_result = collection.bulk_write(batch, ordered=False)
+            except BulkWriteError as exc:
+                # Unordered writes carry on past a failed update, so count the rest
+                update_ct += exc.details.get("nModified", 0)
+                logger.error(
+                    "Masked {} documents in {} before bulk write errors: {}",
+                    update_ct,
+                    node.address,
+                    Pii(exc.details.get("writeErrors")),
+                )
+                raise
+            update_ct += bulk_write_result.modified_count
+            logger.info(
+                "db.{}.bulk_write({} updates): {} documents masked",
+                collection_name,
+                len(batch),
+                bulk_write_result.modified_count,
+            )
+
         return update_ct
 
     def close(self) -> None:
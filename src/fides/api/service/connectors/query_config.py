@@ -1,8 +1,7 @@
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Set, Tuple, TypeVar
 
-import pydash
 from boto3.dynamodb.types import TypeSerializer
 from loguru import logger
 from sqlalchemy import MetaData, Table, text
@@ -15,23 +14,20 @@ from fides.api.graph.config import (
     CollectionAddress,
     Field,
     FieldPath,
-    MaskingOverride,
 )
 from fides.api.graph.execution import ExecutionNode
 from fides.api.models.policy import Policy, Rule
 from fides.api.models.privacy_request import ManualAction, PrivacyRequest
 from fides.api.schemas.policy import ActionType
-from fides.api.service.masking.strategy.masking_strategy import MaskingStrategy
-from fides.api.service.masking.strategy.masking_strategy_nullify import (
-    NullMaskingStrategy,
+from fides.api.service.connectors.masking_targets import (
+    MaskingTarget,
+    build_masking_targets,
+    update_value_maps,
 )
-from fides.api.task.refine_target_path import (
-    build_refined_target_paths,
-    join_detailed_path,
-)
-from fides.api.util.collection_util import Row, append, filter_nonempty_values
+from fides.api.util.collection_util import Row, append, chunks, filter_nonempty_values
 from fides.api.util.logger import Pii
 from fides.api.util.querytoken import QueryToken
+from fides.config import CONFIG
 
 T = TypeVar("T")
 
@@ -42,6 +38,7 @@ class QueryConfig(Generic[T], ABC):
 
     def __init__(self, node: ExecutionNode):
         self.node = node
+        self._masking_targets: Optional[Tuple[Policy, List[MaskingTarget]]] = None
 
     def field_map(self) -> Dict[FieldPath, Field]:
         """Flattened FieldPaths of interest from this traversal_node."""
@@ -123,7 +120,7 @@ class QueryConfig(Generic[T], ABC):
 
         return data
 
-    def update_value_map(  # pylint: disable=R0914
+    def update_value_map(
         self, row: Row, policy: Policy, request: PrivacyRequest
     ) -> Dict[str, Any]:
         """Map the relevant field (as strings) to be updated on the row with their masked values from Policy Rules
@@ -135,102 +132,29 @@ class QueryConfig(Generic[T], ABC):
         with null values.
 
         """
-        rule_to_collection_field_paths: Dict[Rule, List[FieldPath]] = (
-            self.build_rule_target_field_paths(policy)
-        )
+        return self.update_value_maps([row], policy, request)[0]
 
-        value_map: Dict[str, Any] = {}
-        for rule, field_paths in rule_to_collection_field_paths.items():
-            strategy_config = rule.masking_strategy
-            if not strategy_config:
-                continue
-            strategy: MaskingStrategy = MaskingStrategy.get_strategy(
-                strategy_config["strategy"], strategy_config["configuration"]
-            )
-            for rule_field_path in field_paths:
-                masking_override: MaskingOverride = [
-                    MaskingOverride(field.data_type_converter, field.length)
-                    for field_path, field in self.field_map().items()
-                    if field_path == rule_field_path
-                ][0]
-                null_masking: bool = (
-                    strategy_config.get("strategy") == NullMaskingStrategy.name
-                )
-                if not self._supported_data_type(
-                    masking_override, null_masking, strategy
-                ):
-                    logger.warning(
-                        "Unable to generate a query for field {}: data_type is either not present on the field or not supported for the {} masking strategy. Received data type: {}",
-                        rule_field_path.string_path,
-                        strategy_config["strategy"],
-                        masking_override.data_type_converter.name,  # type: ignore
-                    )
-                    continue
+    def update_value_maps(
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[Dict[str, Any]]:
+        """Returns the update_value_map of each of the given rows, masking each targeted
+        column of the rows with a single call to its masking strategy."""
+        return update_value_maps(rows, self.build_masking_targets(policy), request.id)
 
-                paths_to_mask: List[str] = [
-                    join_detailed_path(path)
-                    for path in build_refined_target_paths(
-                        row, query_paths={rule_field_path: None}
-                    )
-                ]
-                for detailed_path in paths_to_mask:
-                    value_map[detailed_path] = self._generate_masked_value(
-                        request_id=request.id,
-                        strategy=strategy,
-                        val=pydash.objects.get(row, detailed_path),
-                        masking_override=masking_override,
-                        null_masking=null_masking,
-                        str_field_path=detailed_path,
-                    )
-        return value_map
-
-    @staticmethod
-    def _supported_data_type(
-        masking_override: MaskingOverride, null_masking: bool, strategy: MaskingStrategy
-    ) -> bool:
-        """Helper method to determine whether given data_type exists and is supported by the masking strategy"""
-        if null_masking:
-            return True
-        if not masking_override.data_type_converter:
-            return False
-        if not strategy.data_type_supported(
-            data_type=masking_override.data_type_converter.name
-        ):
-            return False
-        return True
-
-    @staticmethod
-    def _generate_masked_value(  # pylint: disable=R0913
-        request_id: str,
-        strategy: MaskingStrategy,
-        val: Any,
-        masking_override: MaskingOverride,
-        null_masking: bool,
-        str_field_path: str,
-    ) -> T:
-        # masking API takes and returns lists, but here we are only leveraging single elements
-        masked_val = strategy.mask([val], request_id)[0]  # type: ignore
-
-        logger.debug(
-            "Generated the following masked val for field {}: {}",
-            str_field_path,
-            masked_val,
-        )
-
-        # special case for null masking
-        if null_masking:
-            return masked_val
-
-        if masking_override.length:
-            logger.warning(
-                "Because a length has been specified for field {}, we will truncate length of masked value to match, regardless of masking strategy",
-                str_field_path,
-            )
-            #  for strategies other than null masking we assume that masked data type is the same as specified data type
-            masked_val = masking_override.data_type_converter.truncate(  # type: ignore
-                masking_override.length, masked_val
+    def build_masking_targets(self, policy: Policy) -> List[MaskingTarget]:
+        """
+        Returns the masking targets of the policy's erasure rules on this collection. The
+        targets are resolved once per policy and reused for every row masked with this
+        query config.
+        """
+        if self._masking_targets is None or self._masking_targets[0] is not policy:
+            self._masking_targets = (
+                policy,
+                build_masking_targets(
+                    self.build_rule_target_field_paths(policy), self.field_map()
+                ),
             )
-        return masked_val
+        return self._masking_targets[1]
 
     @abstractmethod
     def generate_query(
@@ -340,6 +264,17 @@ class ManualQueryConfig(QueryConfig[Executable]):
 class SQLQueryConfig(QueryConfig[Executable]):
     """Query config that translates parameters into SQL statements."""
 
+    # Hard limit on the number of values a single statement can match against in this
+    # dialect, if any. Caps CONFIG.execution.sql_in_clause_chunk_size.
+    max_in_clause_values: Optional[int] = None
+
+    def in_clause_chunk_size(self) -> int:
+        """The maximum number of input values to match against in a single retrieval query."""
+        chunk_size: int = CONFIG.execution.sql_in_clause_chunk_size
+        if self.max_in_clause_values:
+            return min(chunk_size, self.max_in_clause_values)
+        return chunk_size
+
     def format_fields_for_query(
         self,
         field_paths: List[FieldPath],
@@ -397,10 +332,9 @@ class SQLQueryConfig(QueryConfig[Executable]):
                     )
                     query_data[string_path] = (data.pop(),)
                 elif len(data) > 1:
-                    clauses.append(
-                        self.format_clause_for_query(string_path, "IN", string_path)
-                    )
-                    query_data[string_path] = tuple(data)
+                    clause, param = self.format_multi_value_clause(string_path, data)
+                    clauses.append(clause)
+                    query_data[string_path] = param
             if len(clauses) > 0:
                 query_str = self.get_formatted_query_string(field_list, clauses)
                 return text(query_str).params(query_data)
@@ -411,6 +345,62 @@ class SQLQueryConfig(QueryConfig[Executable]):
         )
         return None
 
+    def format_multi_value_clause(
+        self, string_path: str, values: Set[Any]
+    ) -> Tuple[str, Any]:
+        """Returns the clause and bind parameter used to match a field against multiple values."""
+        return self.format_clause_for_query(string_path, "IN", string_path), tuple(
+            values
+        )
+
+    def generate_chunked_queries(
+        self,
+        input_data: Dict[str, List[Any]],
+        policy: Optional[Policy] = None,
+    ) -> List[TextClause]:
+        """Generate one or more retrieval queries that together cover all of the input data.
+
+        If the total number of distinct input values exceeds the dialect's IN-clause chunk size,
+        the values for each key are split into chunks and one query is generated per chunk, so
+        that no single statement exceeds driver parameter limits. Because clauses are OR'ed
+        together the union of the chunked results matches the unchunked query, though the same
+        row may be returned by more than one chunk.
+        """
+        filtered_data: Dict[str, Any] = self.node.typed_filtered_values(input_data)
+        distinct_values: Dict[str, List[Any]] = {
+            string_path: list(dict.fromkeys(data))
+            for string_path, data in filtered_data.items()
+        }
+        chunk_size = self.in_clause_chunk_size()
+        if sum(len(values) for values in distinct_values.values()) <= chunk_size:
+            query = self.generate_query(input_data, policy)
+            return [query] if query is not None else []
+
+        # Split the budget across keys so each statement stays within the chunk size
+        key_chunk_size = max(1, chunk_size // len(distinct_values))
+        value_chunks: Dict[str, List[List[Any]]] = {
+            string_path: list(chunks(values, key_chunk_size))
+            for string_path, values in distinct_values.items()
+        }
+        queries: List[TextClause] = []
+        for i in range(max(len(c) for c in value_chunks.values())):
+            chunk_input: Dict[str, List[Any]] = {
+                string_path: key_chunks[i]
+                for string_path, key_chunks in value_chunks.items()
+                if i < len(key_chunks)
+            }
+            query = self.generate_query(chunk_input, policy)
+            if query is not None:
+                queries.append(query)
+
+        logger.info(
+            "Split retrieval query for {} into {} chunks of at most {} values",
+            self.node.address,
+            len(queries),
+            chunk_size,
+        )
+        return queries
+
     def format_key_map_for_update_stmt(self, fields: List[str]) -> List[str]:
         """Adds the appropriate formatting for update statements in this datastore."""
         fields.sort()
@@ -420,7 +410,42 @@ class SQLQueryConfig(QueryConfig[Executable]):
         self, row: Row, policy: Policy, request: PrivacyRequest
     ) -> Optional[TextClause]:
         """Returns an update statement in generic SQL dialect."""
-        update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
+        update_components: Optional[Tuple[str, Dict[str, Any]]] = (
+            self.generate_update_components(row, policy, request)
+        )
+        if update_components is None:
+            return None
+        query_str, update_value_map = update_components
+        return text(query_str).params(update_value_map)
+
+    def generate_update_components(
+        self, row: Row, policy: Policy, request: PrivacyRequest
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Returns the parameterized update query string and its bind parameters.
+
+        Rows whose update touches the same set of fields share the same query string,
+        which lets callers group rows and execute them together as one batch.
+        """
+        return self._build_update_components(
+            row, self.update_value_map(row, policy, request)
+        )
+
+    def generate_update_components_for_rows(
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[Optional[Tuple[str, Dict[str, Any]]]]:
+        """Returns the update components of each of the given rows, masking the values
+        of all of the rows column by column"""
+        return [
+            self._build_update_components(row, update_value_map)
+            for row, update_value_map in zip(
+                rows, self.update_value_maps(rows, policy, request)
+            )
+        ]
+
+    def _build_update_components(
+        self, row: Row, update_value_map: Dict[str, Any]
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Builds the update query string and bind parameters from the row's masked values"""
         update_clauses: list[str] = self.format_key_map_for_update_stmt(
             list(update_value_map.keys())
         )
@@ -451,7 +476,7 @@ class SQLQueryConfig(QueryConfig[Executable]):
             pk_clauses,
         )
         logger.info("query = {}, params = {}", Pii(query_str), Pii(update_value_map))
-        return text(query_str).params(update_value_map)
+        return query_str, update_value_map
 
     def query_to_str(self, t: TextClause, input_data: Dict[str, List[Any]]) -> str:
         """string representation of a query for logging/dry-run"""
@@ -492,6 +517,25 @@ class PostgresQueryConfig(SQLQueryConfig):
         Postgres reserved words."""
         return f'SELECT {field_list} FROM "{self.node.collection.name}" WHERE {" OR ".join(clauses)}'
 
+    def format_multi_value_clause(
+        self, string_path: str, values: Set[Any]
+    ) -> Tuple[str, Any]:
+        """Matches inputs larger than the chunk size with a single array parameter
+        (field = ANY(:values)) rather than a long IN list."""
+        if len(values) > self.in_clause_chunk_size():
+            return f"{string_path} = ANY(:{string_path})", list(values)
+        return super().format_multi_value_clause(string_path, values)
+
+    def generate_chunked_queries(
+        self,
+        input_data: Dict[str, List[Any]],
+        policy: Optional[Policy] = None,
+    ) -> List[TextClause]:
+        """Postgres can match any number of values through an array parameter, so large
+        inputs are never split across multiple queries."""
+        query = self.generate_query(input_data, policy)
+        return [query] if query is not None else []
+
 
 class MySQLQueryConfig(SQLQueryConfig):
     """
@@ -593,10 +637,16 @@ class MicrosoftSQLServerQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig)
     Generates SQL valid for SQLServer.
     """
 
+    # SQL Server allows at most 2100 parameters per statement
+    max_in_clause_values = 2000
+
 
 class SnowflakeQueryConfig(SQLQueryConfig):
     """Generates SQL in Snowflake's custom dialect."""
 
+    # Snowflake limits expression lists to 16,384 values
+    max_in_clause_values = 16384
+
     def format_fields_for_query(
         self,
         field_paths: List[FieldPath],
@@ -660,6 +710,9 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
     Generates SQL valid for BigQuery
     """
 
+    # BigQuery allows at most 10,000 query parameters
+    max_in_clause_values = 10000
+
     def get_formatted_query_string(
         self,
         field_list: str,
@@ -761,8 +814,24 @@ class MongoQueryConfig(QueryConfig[MongoStatement]):
         self, row: Row, policy: Policy, request: PrivacyRequest
     ) -> Optional[MongoStatement]:
         """Generate a SQL update statement in the form of Mongo update statement components"""
-        update_clauses = self.update_value_map(row, policy, request)
+        return self._build_update_stmt(row, self.update_value_map(row, policy, request))
+
+    def generate_update_stmts(
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[Optional[MongoStatement]]:
+        """Returns the update statement of each of the given rows, masking the values
+        of all of the rows field by field"""
+        return [
+            self._build_update_stmt(row, update_clauses)
+            for row, update_clauses in zip(
+                rows, self.update_value_maps(rows, policy, request)
+            )
+        ]
 
+    def _build_update_stmt(
+        self, row: Row, update_clauses: Dict[str, Any]
+    ) -> Optional[MongoStatement]:
+        """Builds the update statement components from the row's masked values"""
         pk_clauses: Dict[str, Any] = filter_nonempty_values(
             {
                 field_path.string_path: field.cast(row[field_path.string_path])
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import email
 import re
+import threading
 import time
 from functools import wraps
 from time import sleep
@@ -34,6 +35,11 @@ if TYPE_CHECKING:
     from fides.api.schemas.saas.saas_config import ClientConfig
     from fides.api.schemas.saas.shared_schemas import SaaSRequestParams
 
+# Read requests for a SaaS collection can be sent from multiple threads. Authentication
+# strategies like OAuth2 may refresh and save tokens on the connection config, so
+# requests are authenticated one at a time.
+_authentication_lock = threading.Lock()
+
 
 class AuthenticatedClient:
     """
@@ -80,7 +86,8 @@ class AuthenticatedClient:
                 self.client_config.authentication.strategy,
                 self.client_config.authentication.configuration,
             )
-            return auth_strategy.add_authentication(req, self.configuration)
+            with _authentication_lock:
+                return auth_strategy.add_authentication(req, self.configuration)
 
         # otherwise just return the prepared request
         return req
@@ -1,4 +1,6 @@
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import Context, copy_context
 from json import JSONDecodeError
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
@@ -57,6 +59,7 @@ from fides.api.util.saas_util import (
     assign_placeholders,
     map_param_values,
 )
+from fides.config import CONFIG
 
 
 class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
@@ -288,23 +291,13 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
                     query_config.generate_requests(input_data, policy, read_request)
                 )
 
-                # Iterates through initial list of prepared requests and through subsequent
-                # requests generated by pagination. The results are added to the output
-                # list of rows after each request.
-                for next_request, param_value_map in prepared_requests:
-                    while next_request:
-                        processed_rows, next_request = self.execute_prepared_request(  # type: ignore
-                            next_request,
-                            privacy_request.get_cached_identity_data(),
-                            read_request,
-                        )
-                        rows.extend(
-                            self._apply_output_template(
-                                [param_value_map],
-                                read_request.output,
-                                processed_rows,
-                            )
-                        )
+                rows.extend(
+                    self._execute_prepared_requests(
+                        prepared_requests,
+                        privacy_request.get_cached_identity_data(),
+                        read_request,
+                    )
+                )
 
             # This allows us to build an output object even if we didn't generate and execute
             # any HTTP requests. This is useful if we just want to select specific input_data
@@ -328,6 +321,94 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
 
         return rows
 
+    def get_max_concurrent_requests(self) -> int:
+        """
+        Returns the maximum number of prepared requests to execute concurrently,
+        preferring the SaaS config's setting over the global default
+        """
+        return (
+            self.saas_config.max_concurrent_requests
+            or CONFIG.execution.saas_max_concurrent_requests
+        )
+
+    def _execute_prepared_requests(
+        self,
+        prepared_requests: List[Tuple[SaaSRequestParams, Dict[str, Any]]],
+        identity_data: Dict[str, Any],
+        read_request: ReadSaaSRequest,
+    ) -> List[Row]:
+        """
+        Executes the initial list of prepared requests and the subsequent requests generated
+        by pagination, returning the output rows in the order of the prepared requests.
+
+        The pages of a single prepared request are always requested one after another, but
+        the prepared requests themselves are independent of each other, so up to
+        get_max_concurrent_requests of them are executed at once. All requests still go
+        through the shared rate limiter.
+        """
+
+        def execute_pages(
+            next_request: Optional[SaaSRequestParams], param_value_map: Dict[str, Any]
+        ) -> List[Row]:
+            pages: List[Row] = []
+            while next_request:
+                processed_rows, next_request = self.execute_prepared_request(
+                    next_request,
+                    identity_data,
+                    read_request,
+                )
+                pages.extend(
+                    self._apply_output_template(
+                        [param_value_map],
+                        read_request.output,
+                        processed_rows,
+                    )
+                )
+            return pages
+
+        def execute_pages_in_context(
+            context: Context,
+            next_request: Optional[SaaSRequestParams],
+            param_value_map: Dict[str, Any],
+        ) -> List[Row]:
+            return context.run(execute_pages, next_request, param_value_map)
+
+        max_workers = min(self.get_max_concurrent_requests(), len(prepared_requests))
+        if max_workers <= 1:
+            return [
+                row
+                for next_request, param_value_map in prepared_requests
+                for row in execute_pages(next_request, param_value_map)
+            ]
+
+        logger.debug(
+            "Executing {} prepared requests for '{}' with up to {} concurrent requests",
+            len(prepared_requests),
+            self.current_collection_name,
+            max_workers,
+        )
+        rows: List[Row] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Each task runs in a copy of the current context so the
+            # logger context is kept in the worker threads
+            futures: List[Future[List[Row]]] = [
+                executor.submit(
+                    execute_pages_in_context,
+                    copy_context(),
+                    next_request,
+                    param_value_map,
+                )
+                for next_request, param_value_map in prepared_requests
+            ]
+            try:
+                for future in futures:
+                    rows.extend(future.result())
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+        return rows
+
     def _apply_output_template(
         self,
         param_value_maps: List[Dict[str, Any]],
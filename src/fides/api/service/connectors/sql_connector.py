@@ -1,6 +1,17 @@
 import io
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from urllib.parse import quote_plus
 
 import paramiko
@@ -68,7 +79,8 @@ from fides.api.service.connectors.query_config import (
     SnowflakeQueryConfig,
     SQLQueryConfig,
 )
-from fides.api.util.collection_util import Row
+from fides.api.service.connectors.sql_engine_registry import sql_engine_registry
+from fides.api.util.collection_util import Row, chunks, make_immutable
 from fides.config import get_config
 
 CONFIG = get_config()
@@ -91,27 +103,37 @@ class SQLConnector(BaseConnector[Engine]):
                 "SQL Connectors must define their secrets schema class"
             )
         self.ssh_server: sshtunnel._ForwardServer = None
+        # Whether db_client was acquired from the SQL engine registry, which owns it
+        self.registered_client = False
 
     @staticmethod
-    def cursor_result_to_rows(results: CursorResult) -> List[Row]:
-        """Convert SQLAlchemy results to a list of dictionaries"""
+    def cursor_result_to_rows(
+        results: CursorResult, row_tuples: Optional[Iterable[Any]] = None
+    ) -> List[Row]:
+        """Convert SQLAlchemy results to a list of dictionaries
+
+        If row_tuples is supplied, only those rows (for example one partition of a
+        streamed result) are converted, using the column descriptions from results.
+        """
         columns: List[Column] = results.cursor.description
         rows = []
-        for row_tuple in results:
+        for row_tuple in results if row_tuples is None else row_tuples:
             rows.append(
                 {col.name: row_tuple[count] for count, col in enumerate(columns)}
             )
         return rows
 
     @staticmethod
-    def default_cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def default_cursor_result_to_rows(
+        results: LegacyCursorResult, row_tuples: Optional[Iterable[Any]] = None
+    ) -> List[Row]:
         """
         Convert SQLAlchemy results to a list of dictionaries
         Overrides BaseConnector.cursor_result_to_rows since SQLAlchemy execute returns LegacyCursorResult for MariaDB
         """
         columns: List[Column] = results.cursor.description
         rows = []
-        for row_tuple in results:
+        for row_tuple in results if row_tuples is None else row_tuples:
             rows.append({col[0]: row_tuple[count] for count, col in enumerate(columns)})
         return rows
 
@@ -155,16 +177,75 @@ class SQLConnector(BaseConnector[Engine]):
         input_data: Dict[str, List[Any]],
     ) -> List[Row]:
         """Retrieve sql data"""
+        return [
+            row
+            for chunk in self.retrieve_data_in_chunks(
+                node, policy, privacy_request, request_task, input_data
+            )
+            for row in chunk
+        ]
+
+    def retrieve_data_in_chunks(
+        self,
+        node: ExecutionNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        request_task: RequestTask,
+        input_data: Dict[str, List[Any]],
+    ) -> Generator[List[Row], None, None]:
+        """Retrieve sql data in chunks of at most `CONFIG.execution.sql_retrieval_chunk_size` rows.
+
+        Results are read through a server-side cursor where the dialect supports one,
+        so only the current chunk is buffered in memory while it is being processed.
+
+        Large inputs may be split across several queries by the query config, in which
+        case rows returned by more than one query are only yielded once.
+        """
         query_config = self.query_config(node)
         client = self.client()
-        stmt: Optional[TextClause] = query_config.generate_query(input_data, policy)
-        if stmt is None:
-            return []
+        stmts: List[TextClause] = query_config.generate_chunked_queries(
+            input_data, policy
+        )
+        if not stmts:
+            return
         logger.info("Starting data retrieval for {}", node.address)
+        seen_rows: Set[Any] = set()
         with client.connect() as connection:
             self.set_schema(connection)
-            results = connection.execute(stmt)
-            return self.cursor_result_to_rows(results)
+            for stmt in stmts:
+                results = connection.execution_options(stream_results=True).execute(
+                    stmt
+                )
+                for partition in results.partitions(
+                    CONFIG.execution.sql_retrieval_chunk_size
+                ):
+                    rows: List[Row] = self.cursor_result_to_rows(results, partition)
+                    if len(stmts) > 1:
+                        rows = self._remove_seen_rows(query_config, rows, seen_rows)
+                    if rows:
+                        yield rows
+
+    @staticmethod
+    def _remove_seen_rows(
+        query_config: SQLQueryConfig, rows: List[Row], seen_rows: Set[Any]
+    ) -> List[Row]:
+        """Filters out rows that were already returned by a previous chunked query.
+
+        Rows are identified by their primary key values when the collection has a primary key,
+        otherwise by the full row contents. seen_rows is updated in place."""
+        primary_keys: List[str] = [
+            field_path.string_path
+            for field_path in query_config.primary_key_field_paths
+        ]
+        unseen_rows: List[Row] = []
+        for row in rows:
+            row_key = make_immutable(
+                [row.get(key) for key in primary_keys] if primary_keys else row
+            )
+            if row_key not in seen_rows:
+                seen_rows.add(row_key)
+                unseen_rows.append(row)
+        return unseen_rows
 
     def mask_data(
         self,
@@ -174,29 +255,117 @@ class SQLConnector(BaseConnector[Engine]):
         request_task: RequestTask,
         rows: List[Row],
     ) -> int:
-        """Execute a masking request. Returns the number of records masked"""
+        """Execute a masking request. Returns the number of records masked
+
+        Rows are grouped by the shape of their update statement and each group is
+        sent to the database as batched executemany calls of at most
+        `CONFIG.execution.sql_masking_batch_size` rows, all within a single
+        connection and transaction.
+        """
         query_config = self.query_config(node)
+        update_batches: Dict[str, List[Dict[str, Any]]] = {}
+        for update_components in query_config.generate_update_components_for_rows(
+            rows, policy, privacy_request
+        ):
+            if update_components is not None:
+                query_str, update_value_map = update_components
+                update_batches.setdefault(query_str, []).append(update_value_map)
+
+        if not update_batches:
+            return 0
+
         update_ct = 0
         client = self.client()
-        for row in rows:
-            update_stmt: Optional[TextClause] = query_config.generate_update_stmt(
-                row, policy, privacy_request
-            )
-            if update_stmt is not None:
-                with client.connect() as connection:
-                    self.set_schema(connection)
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
+        with client.connect() as connection:
+            with connection.begin():
+                self.set_schema(connection)
+                for query_str, param_sets in update_batches.items():
+                    for batch in chunks(
+                        param_sets, CONFIG.execution.sql_masking_batch_size
+                    ):
+                        update_ct += self._execute_update_batch(
+                            connection, text(query_str), batch
+                        )
+        logger.info(
+            "Masked {} rows in {} in {} update group(s)",
+            update_ct,
+            node.address,
+            len(update_batches),
+        )
         return update_ct
 
+    @staticmethod
+    def _execute_update_batch(
+        connection: Connection, update_stmt: TextClause, batch: List[Dict[str, Any]]
+    ) -> int:
+        """Runs a single batch of update parameters against the same statement.
+
+        A batch of one is executed directly; larger batches use the driver's executemany.
+        Drivers that cannot report an accurate rowcount for executemany are assumed to
+        have updated one row per parameter set, since updates are keyed by primary key.
+        """
+        if len(batch) == 1:
+            results: LegacyCursorResult = connection.execute(update_stmt, batch[0])
+            return results.rowcount
+
+        results = connection.execute(update_stmt, batch)
+        if connection.dialect.supports_sane_multi_rowcount and results.rowcount >= 0:
+            return results.rowcount
+        return len(batch)
+
     def close(self) -> None:
         """Close any held resources"""
+        if self.db_client and self.registered_client:
+            # The registry disposes of the engine once it's been idle for a while
+            sql_engine_registry.release(self.db_client)
+            self.db_client = None
+            self.registered_client = False
+            return
         if self.db_client:
             logger.debug(" disposing of {}", self.__class__)
             self.db_client.dispose()
         if self.ssh_server:
             self.ssh_server.stop()
 
+    # Overrides BaseConnector.client
+    def client(self) -> Engine:
+        """
+        Returns the SQLAlchemy Engine for this connection config. Unless disabled by
+        CONFIG.execution.sql_engine_reuse, the engine is shared with the other connectors
+        for the same connection config in this process, so that its pooled connections
+        are reused across Request Tasks.
+        """
+        if not self.db_client:
+            if CONFIG.execution.sql_engine_reuse:
+                self.db_client = sql_engine_registry.acquire(
+                    self.configuration, self._create_registered_client
+                )
+                self.registered_client = True
+            else:
+                self.db_client = self.create_client()
+        return self.db_client
+
+    def _create_registered_client(
+        self,
+    ) -> Tuple[Engine, Optional[sshtunnel.SSHTunnelForwarder]]:
+        """
+        Creates an engine to be held by the SQL engine registry, handing it the SSH tunnel
+        the engine connects through so the tunnel stays open after this connector is closed
+        """
+        engine = self.create_client()
+        ssh_server, self.ssh_server = self.ssh_server, None
+        return engine, ssh_server
+
+    @staticmethod
+    def get_pool_args() -> Dict[str, Any]:
+        """Connection pool arguments for the engine"""
+        return {
+            "pool_size": CONFIG.execution.sql_engine_pool_size,
+            "max_overflow": CONFIG.execution.sql_engine_max_overflow,
+            # Reused engines can hold connections the server has since closed
+            "pool_pre_ping": True,
+        }
+
     def create_client(self) -> Engine:
         """Returns a SQLAlchemy Engine that can be used to interact with a database"""
         uri = (self.configuration.secrets or {}).get("url") or self.build_uri()
@@ -205,6 +374,7 @@ class SQLConnector(BaseConnector[Engine]):
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
             connect_args=self.get_connect_args(),
+            **self.get_pool_args(),
         )
 
     def get_connect_args(self) -> Dict[str, Any]:
@@ -293,6 +463,7 @@ class PostgreSQLConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.get_pool_args(),
         )
 
     def set_schema(self, connection: Connection) -> None:
@@ -365,6 +536,7 @@ class MySQLConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.get_pool_args(),
         )
 
     def query_config(self, node: ExecutionNode) -> SQLQueryConfig:
@@ -372,11 +544,13 @@ class MySQLConnector(SQLConnector):
         return MySQLQueryConfig(node)
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, row_tuples: Optional[Iterable[Any]] = None
+    ) -> List[Row]:
         """
         Convert SQLAlchemy results to a list of dictionaries
         """
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, row_tuples)
 
 
 class MariaDBConnector(SQLConnector):
@@ -401,11 +575,13 @@ class MariaDBConnector(SQLConnector):
         return url
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, row_tuples: Optional[Iterable[Any]] = None
+    ) -> List[Row]:
         """
         Convert SQLAlchemy results to a list of dictionaries
         """
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, row_tuples)
 
 
 class RedshiftConnector(SQLConnector):
@@ -456,6 +632,7 @@ class RedshiftConnector(SQLConnector):
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
             connect_args=connect_args,
+            **self.get_pool_args(),
         )
 
     def set_schema(self, connection: Connection) -> None:
@@ -503,6 +680,7 @@ class BigQueryConnector(SQLConnector):
             credentials_info=credentials_info,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.get_pool_args(),
         )
 
     # Overrides SQLConnector.query_config
@@ -622,11 +800,13 @@ class MicrosoftSQLServerConnector(SQLConnector):
         return MicrosoftSQLServerQueryConfig(node)
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, row_tuples: Optional[Iterable[Any]] = None
+    ) -> List[Row]:
         """
         Convert SQLAlchemy results to a list of dictionaries
         """
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, row_tuples)
 
 
 class GoogleCloudSQLMySQLConnector(SQLConnector):
@@ -657,12 +837,16 @@ class GoogleCloudSQLMySQLConnector(SQLConnector):
             )
             return conn
 
-        return create_engine("mysql+pymysql://", creator=getconn)
+        return create_engine(
+            "mysql+pymysql://", creator=getconn, **self.get_pool_args()
+        )
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, row_tuples: Optional[Iterable[Any]] = None
+    ) -> List[Row]:
         """results to a list of dictionaries"""
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, row_tuples)
 
     def build_uri(self) -> None:
         """
@@ -698,12 +882,16 @@ class GoogleCloudSQLPostgresConnector(SQLConnector):
             )
             return conn
 
-        return create_engine("postgresql+pg8000://", creator=getconn)
+        return create_engine(
+            "postgresql+pg8000://", creator=getconn, **self.get_pool_args()
+        )
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, row_tuples: Optional[Iterable[Any]] = None
+    ) -> List[Row]:
         """results to a list of dictionaries"""
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, row_tuples)
 
     def build_uri(self) -> None:
         """
@@ -0,0 +1,254 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import sshtunnel  # type: ignore
+from loguru import logger
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from fides.api.models.connectionconfig import ConnectionConfig
+from fides.config import CONFIG
+
+# The engine created for a connection config, along with the SSH tunnel it connects
+# through, if any
+EngineFactory = Callable[[], Tuple[Engine, Optional[sshtunnel.SSHTunnelForwarder]]]
+
+
+class RegisteredEngine:
+    """An engine held by the registry, and how it's being used"""
+
+    def __init__(
+        self,
+        connection_key: str,
+        engine: Engine,
+        ssh_server: Optional[sshtunnel.SSHTunnelForwarder],
+    ) -> None:
+        self.connection_key = connection_key
+        self.engine = engine
+        self.ssh_server = ssh_server
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        # The number of connectors currently using the engine
+        self.in_use = 0
+        # The number of times the engine was handed out after being created
+        self.reuses = 0
+
+    def dispose(self) -> None:
+        """Closes the engine's pooled connections and the SSH tunnel"""
+        logger.debug(
+            "Disposing of the SQL engine for connection config {}", self.connection_key
+        )
+        self.engine.dispose()
+        if self.ssh_server:
+            self.ssh_server.stop()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Usage and connection pool metrics for the engine"""
+        pool = self.engine.pool
+        metrics: Dict[str, Any] = {
+            "connection_key": self.connection_key,
+            "in_use": self.in_use,
+            "reuses": self.reuses,
+            "age_seconds": time.monotonic() - self.created_at,
+            "idle_seconds": time.monotonic() - self.last_used,
+            "pool_status": pool.status(),
+        }
+        # Only queue pools track their connections
+        if isinstance(pool, QueuePool):
+            metrics["pool_size"] = pool.size()
+            metrics["pool_checked_in"] = pool.checkedin()
+            metrics["pool_checked_out"] = pool.checkedout()
+            metrics["pool_overflow"] = pool.overflow()
+        return metrics
+
+
+class SQLEngineRegistry:
+    """
+    A process-wide registry of the SQLAlchemy engines used by SQL connectors.
+
+    Engines are keyed by connection config key and a hash of the config's secrets, so
+    that each Request Task run in a worker process can reuse the pooled connections
+    (and SSH tunnel) of the tasks before it instead of connecting again. Engines that
+    haven't been used for CONFIG.execution.sql_engine_idle_timeout seconds are disposed,
+    as are engines whose connection config is updated or deleted.
+    """
+
+    def __init__(self) -> None:
+        self._engines: Dict[Tuple[str, str], RegisteredEngine] = {}
+        # Engines whose connection config changed while they were in use, which are
+        # disposed as soon as they're released
+        self._stale_engines: List[RegisteredEngine] = []
+        self._lock = threading.Lock()
+
+    def acquire(
+        self, connection_config: ConnectionConfig, create_engine: EngineFactory
+    ) -> Engine:
+        """
+        Returns the engine for the connection config, creating it with create_engine if
+        there isn't one yet. Each call should be matched by a call to release.
+        """
+        self.evict_idle()
+        registry_key = (connection_config.key, get_secrets_hash(connection_config))
+        with self._lock:
+            registered = self._engines.get(registry_key)
+            if registered:
+                registered.in_use += 1
+                registered.reuses += 1
+                registered.last_used = time.monotonic()
+                return registered.engine
+
+        # Engines are created outside of the lock since opening an SSH tunnel can be slow
+        engine, ssh_server = create_engine()
+        created = RegisteredEngine(connection_config.key, engine, ssh_server)
+        created.in_use = 1
+        to_dispose: List[RegisteredEngine] = []
+        with self._lock:
+            registered = self._engines.get(registry_key)
+            if registered:
+                # Another thread registered an engine for the same config first
+                registered.in_use += 1
+                registered.reuses += 1
+                registered.last_used = time.monotonic()
+                to_dispose.append(created)
+                engine = registered.engine
+            else:
+                # The config's secrets have changed, so its other engines won't be used again
+                to_dispose.extend(self._remove_engines(connection_config.key))
+                self._engines[registry_key] = created
+        for registered in to_dispose:
+            registered.dispose()
+        return engine
+
+    def release(self, engine: Engine) -> None:
+        """
+        Marks an engine returned by acquire as no longer in use by the caller, and
+        disposes of the engines that have been idle for too long
+        """
+        to_dispose: Optional[RegisteredEngine] = None
+        with self._lock:
+            released = False
+            for registered in self._engines.values():
+                if registered.engine is engine:
+                    registered.in_use = max(registered.in_use - 1, 0)
+                    registered.last_used = time.monotonic()
+                    released = True
+                    break
+            if not released:
+                for registered in self._stale_engines:
+                    if registered.engine is engine:
+                        registered.in_use -= 1
+                        if registered.in_use <= 0:
+                            self._stale_engines.remove(registered)
+                            to_dispose = registered
+                        break
+        if to_dispose:
+            to_dispose.dispose()
+        self.evict_idle()
+
+    def invalidate(self, connection_key: str) -> None:
+        """
+        Disposes of the engines for the connection config. Engines that are in use are
+        disposed once they've been released.
+        """
+        with self._lock:
+            to_dispose = self._remove_engines(connection_key)
+        for registered in to_dispose:
+            registered.dispose()
+
+    def evict_idle(self) -> None:
+        """Disposes of the engines that haven't been used within the idle timeout"""
+        idle_before = time.monotonic() - CONFIG.execution.sql_engine_idle_timeout
+        with self._lock:
+            idle_keys = [
+                registry_key
+                for registry_key, registered in self._engines.items()
+                if not registered.in_use and registered.last_used < idle_before
+            ]
+            to_dispose = [self._engines.pop(registry_key) for registry_key in idle_keys]
+        for registered in to_dispose:
+            logger.debug(
+                "Evicting idle SQL engine: {}", json.dumps(registered.get_metrics())
+            )
+            registered.dispose()
+
+    def get_metrics(self) -> List[Dict[str, Any]]:
+        """Usage and connection pool metrics for each registered engine"""
+        with self._lock:
+            return [registered.get_metrics() for registered in self._engines.values()]
+
+    def clear(self) -> None:
+        """Disposes of every registered engine"""
+        with self._lock:
+            to_dispose = list(self._engines.values()) + self._stale_engines
+            self._engines = {}
+            self._stale_engines = []
+        for registered in to_dispose:
+            registered.dispose()
+
+    def _reset_after_fork(self) -> None:
+        """
+        Forgets the engines inherited from the parent process without disposing of them,
+        since their connections belong to the parent
+        """
+        self._engines = {}
+        self._stale_engines = []
+        self._lock = threading.Lock()
+
+    def _remove_engines(self, connection_key: str) -> List[RegisteredEngine]:
+        """
+        Removes the connection config's engines and returns the ones that aren't in use
+        to be disposed. Engines that are in use are disposed once they're released.
+        Must be called while holding the lock.
+        """
+        to_dispose = []
+        for registry_key, registered in list(self._engines.items()):
+            if registered.connection_key != connection_key:
+                continue
+            del self._engines[registry_key]
+            if registered.in_use:
+                self._stale_engines.append(registered)
+            else:
+                to_dispose.append(registered)
+        return to_dispose
+
+
+def get_secrets_hash(connection_config: ConnectionConfig) -> str:
+    """A hash of the connection config's secrets, which are never stored in the registry itself"""
+    return hashlib.sha256(
+        json.dumps(connection_config.secrets or {}, sort_keys=True, default=str).encode(
+            "utf-8"
+        )
+    ).hexdigest()
+
+
+sql_engine_registry = SQLEngineRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        after_in_child=sql_engine_registry._reset_after_fork  # pylint: disable=protected-access
+    )
+
+
+@event.listens_for(ConnectionConfig, "after_update")
+def invalidate_updated_connection_config_engines(
+    _mapper: Any, _connection: Any, target: ConnectionConfig
+) -> None:
+    """Disposes of the engines for a connection config when its key or secrets change"""
+    state = inspect(target)
+    key_history = state.attrs.key.history
+    if key_history.has_changes() or state.attrs.secrets.history.has_changes():
+        for connection_key in set(key_history.deleted or []) | {target.key}:
+            sql_engine_registry.invalidate(connection_key)
+
+
+@event.listens_for(ConnectionConfig, "after_delete")
+def invalidate_deleted_connection_config_engines(
+    _mapper: Any, _connection: Any, target: ConnectionConfig
+) -> None:
+    """Disposes of the engines for a connection config when it's deleted"""
+    sql_engine_registry.invalidate(target.key)
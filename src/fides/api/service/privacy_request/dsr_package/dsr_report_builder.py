@@ -1,16 +1,19 @@
 import json
 import os
 import zipfile
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BytesIO
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Deque, Dict, Iterable, List, Optional, Tuple
 
 import jinja2
 from jinja2 import Environment, FileSystemLoader
 
 from fides.api.models.privacy_request import PrivacyRequest
 from fides.api.schemas.policy import ActionType
+from fides.api.util.collection_util import chunks
 from fides.api.util.storage_util import storage_json_encoder
 
 DSR_DIRECTORY = Path(__file__).parent.resolve()
@@ -19,6 +22,11 @@ TEXT_COLOR = "#4A5568"
 HEADER_COLOR = "#F7FAFC"
 BORDER_COLOR = "#E2E8F0"
 
+# The number of item links listed on each page of a collection's index
+COLLECTION_INDEX_PAGE_SIZE = 1000
+# The number of threads rendering item pages
+RENDER_WORKERS = 4
+
 
 # pylint: disable=too-many-instance-attributes
 class DsrReportBuilder:
@@ -26,14 +34,18 @@ class DsrReportBuilder:
         self,
         privacy_request: PrivacyRequest,
         dsr_data: Dict[str, Any],
+        fileobj: Optional[IO[bytes]] = None,
     ):
         """
         Manages populating HTML templates from the given data and adding the generated
         pages to a zip file in a way that the pages can be navigated between.
+
+        Pages are written to the zip file as they're rendered, so the zip can be
+        streamed to the given file instead of an in-memory buffer.
         """
 
         # zip file variables
-        self.baos = BytesIO()
+        self.baos: IO[bytes] = fileobj if fileobj is not None else BytesIO()
 
         # we close this in the finally block of generate()
         # pylint: disable=consider-using-with
@@ -66,12 +78,14 @@ class DsrReportBuilder:
         heading: Optional[str] = None,
         description: Optional[str] = None,
         data: Optional[Dict[str, Any]] = None,
+        pagination: Optional[Dict[str, Any]] = None,
     ) -> str:
         """Generates a file from the template and data"""
         report_data = {
             "heading": heading,
             "description": description,
             "data": data,
+            "pagination": pagination,
             "request": self.request_data,
         }
         report_data.update(self.template_data)
@@ -84,7 +98,12 @@ class DsrReportBuilder:
         if filename and contents:
             self.out.writestr(f"{filename}", contents.encode("utf-8"))
 
-    def _add_dataset(self, dataset_name: str, collections: Dict[str, Any]) -> None:
+    def _add_dataset(
+        self,
+        executor: ThreadPoolExecutor,
+        dataset_name: str,
+        collections: Dict[str, Iterable[Dict[str, Any]]],
+    ) -> None:
         """
         Generates a page for each collection in the dataset and an index page for the dataset.
         Tracks the generated links to build a root level index after each collection has been processed.
@@ -93,7 +112,7 @@ class DsrReportBuilder:
         collection_links = {}
         for collection_name, rows in collections.items():
             collection_url = f"{collection_name}/index.html"
-            self._add_collection(rows, dataset_name, collection_name)
+            self._add_collection(executor, rows, dataset_name, collection_name)
             collection_links[collection_name] = collection_url
 
         # generate dataset index page
@@ -107,39 +126,87 @@ class DsrReportBuilder:
             ),
         )
 
+    def _render_item(self, collection_name: str, index: int, item: Any) -> str:
+        return self._populate_template(
+            "templates/item.html",
+            f"{collection_name} (item #{index})",
+            None,
+            item,
+        )
+
     def _add_collection(
-        self, rows: List[Dict[str, Any]], dataset_name: str, collection_name: str
+        self,
+        executor: ThreadPoolExecutor,
+        rows: Iterable[Dict[str, Any]],
+        dataset_name: str,
+        collection_name: str,
     ) -> None:
+        """
+        Renders the detail pages for the collection's rows on the executor, adding them
+        to the zip file in order as they finish. Only a few pages per worker are held in
+        memory at once. The links to the detail pages are split across index pages of
+        COLLECTION_INDEX_PAGE_SIZE items.
+        """
         # track links to detail pages
         detail_links = {}
+        pending: Deque[Tuple[int, Future]] = deque()
+        max_pending = RENDER_WORKERS * 2
         for index, item in enumerate(rows, 1):
-            detail_url = f"{index}.html"
+            pending.append(
+                (
+                    index,
+                    executor.submit(self._render_item, collection_name, index, item),
+                )
+            )
+            if len(pending) >= max_pending:
+                self._add_item_page(dataset_name, collection_name, *pending.popleft())
+            detail_links[f"item #{index}"] = f"{index}.html"
+        while pending:
+            self._add_item_page(dataset_name, collection_name, *pending.popleft())
+
+        # generate detail index pages, splitting very large collections across several pages
+        index_pages = list(
+            chunks(detail_links.items(), COLLECTION_INDEX_PAGE_SIZE)
+        ) or [[]]
+        for page, page_links in enumerate(index_pages, 1):
             self._add_file(
-                f"data/{dataset_name}/{collection_name}/{index}.html",
+                f"data/{dataset_name}/{collection_name}/{_collection_index_page(page)}",
                 self._populate_template(
-                    "templates/item.html",
-                    f"{collection_name} (item #{index})",
+                    "templates/collection_index.html",
+                    collection_name,
                     None,
-                    item,
+                    dict(page_links),
+                    {
+                        "page": page,
+                        "pages": len(index_pages),
+                        "previous": (
+                            _collection_index_page(page - 1) if page > 1 else None
+                        ),
+                        "next": (
+                            _collection_index_page(page + 1)
+                            if page < len(index_pages)
+                            else None
+                        ),
+                    },
                 ),
             )
-            detail_links[f"item #{index}"] = detail_url
 
-        # generate detail index page
+    def _add_item_page(
+        self,
+        dataset_name: str,
+        collection_name: str,
+        index: int,
+        rendered_page: "Future[str]",
+    ) -> None:
         self._add_file(
-            f"data/{dataset_name}/{collection_name}/index.html",
-            self._populate_template(
-                "templates/collection_index.html",
-                collection_name,
-                None,
-                detail_links,
-            ),
+            f"data/{dataset_name}/{collection_name}/{index}.html",
+            rendered_page.result(),
         )
 
-    def generate(self) -> BytesIO:
+    def generate(self) -> IO[bytes]:
         """
         Processes the request and DSR data to build zip file containing the DSR report.
-        Returns the zip file as an in-memory byte array.
+        Returns the zip file, which is an in-memory byte array unless a file was given.
         """
         try:
             # all the css for the pages is in main.css
@@ -154,18 +221,31 @@ class DsrReportBuilder:
                 ),
             )
 
-            # pre-process data to split the dataset:collection keys
-            datasets: Dict[str, Any] = defaultdict(lambda: defaultdict(list))
-            for key, rows in self.dsr_data.items():
+            # pre-process data to split the dataset:collection keys. Only the keys are
+            # grouped, the rows are read from the DSR data as the pages are rendered.
+            datasets: Dict[str, Dict[str, List[str]]] = defaultdict(
+                lambda: defaultdict(list)
+            )
+            for key in self.dsr_data:
                 parts = key.split(":", 1)
                 dataset_name, collection_name = (
                     parts if len(parts) > 1 else ("manual", parts[0])
                 )
-                datasets[dataset_name][collection_name].extend(rows)
+                datasets[dataset_name][collection_name].append(key)
 
-            for dataset_name, collections in datasets.items():
-                self._add_dataset(dataset_name, collections)
-                self.main_links[dataset_name] = f"data/{dataset_name}/index.html"
+            with ThreadPoolExecutor(max_workers=RENDER_WORKERS) as executor:
+                for dataset_name, collections in datasets.items():
+                    self._add_dataset(
+                        executor,
+                        dataset_name,
+                        {
+                            collection_name: chain.from_iterable(
+                                self.dsr_data[key] for key in keys
+                            )
+                            for collection_name, keys in collections.items()
+                        },
+                    )
+                    self.main_links[dataset_name] = f"data/{dataset_name}/index.html"
 
             # create the main index once all the datasets have been added
             self._add_file(
@@ -183,6 +263,11 @@ class DsrReportBuilder:
         return self.baos
 
 
+def _collection_index_page(page: int) -> str:
+    """The file name of a page of a collection's index"""
+    return "index.html" if page == 1 else f"index-{page}.html"
+
+
 def _map_privacy_request(privacy_request: PrivacyRequest) -> Dict[str, Any]:
     """Creates a map with a subset of values from the privacy request"""
     request_data: Dict[str, Any] = {}
@@ -1,6 +1,6 @@
 import secrets
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 import requests
 from loguru import logger
@@ -35,6 +35,7 @@ from fides.api.models.privacy_request import (
     PrivacyRequest,
     PrivacyRequestStatus,
     ProvidedIdentityType,
+    RequestTaskResults,
     can_run_checkpoint,
 )
 from fides.api.schemas.base_class import FidesSchema
@@ -205,7 +206,7 @@ def run_webhooks_and_report_status(
 def upload_access_results(  # pylint: disable=R0912
     session: Session,
     policy: Policy,
-    access_result: Dict[str, List[Row]],
+    access_result: Mapping[str, List[Row]],
     dataset_graph: DatasetGraph,
     privacy_request: PrivacyRequest,
     manual_data: Dict[str, List[Dict[str, Optional[Any]]]],
@@ -216,10 +217,13 @@ def upload_access_results(  # pylint: disable=R0912
     if not access_result:
         logger.info("No results returned for access request {}", privacy_request.id)
 
+    access_rules = policy.get_rules_for_action(action_type=ActionType.access)
+    if access_rules and isinstance(access_result, RequestTaskResults):
+        # Decode the Request Task results on worker threads before they're filtered for each rule
+        access_result.prefetch()
+
     rule_filtered_results: Dict[str, Dict[str, List[Row]]] = {}
-    for rule in policy.get_rules_for_action(  # pylint: disable=R1702
-        action_type=ActionType.access
-    ):
+    for rule in access_rules:  # pylint: disable=R1702
         storage_destination = rule.get_storage_destination(session)
 
         target_categories: Set[str] = {target.data_category for target in rule.targets}  # type: ignore[attr-defined]
@@ -397,7 +401,7 @@ def run_privacy_request(
 
             # Upload Access Results CHECKPOINT
             access_result_urls: List[str] = []
-            raw_access_results: Dict = privacy_request.get_raw_access_results()
+            raw_access_results: Mapping = privacy_request.get_raw_access_results()
             if (
                 policy.get_rules_for_action(action_type=ActionType.access)
                 or policy.get_rules_for_action(
@@ -17,6 +17,7 @@ from fides.api.models.privacy_request import (
     ExecutionLogStatus,
     PrivacyRequest,
     PrivacyRequestStatus,
+    ProvidedIdentity,
 )
 from fides.api.schemas.drp_privacy_request import DrpPrivacyRequestCreate
 from fides.api.schemas.masking.masking_secrets import MaskingSecretCache
@@ -31,6 +32,10 @@ from fides.config import CONFIG
 
 PRIVACY_REQUEST_STATUS_CHANGE_POLL = "privacy_request_status_change_poll"
 DSR_DATA_REMOVAL = "dsr_data_removal"
+IDENTITY_LOOKUP_HASH_BACKFILL = "identity_lookup_hash_backfill"
+
+# The number of provided identities whose lookup hashes are backfilled per transaction
+IDENTITY_LOOKUP_HASH_BACKFILL_BATCH_SIZE = 1000
 
 
 def build_required_privacy_request_kwargs(
@@ -316,3 +321,70 @@ def remove_saved_dsr_data(self: DatabaseTask) -> None:
         )
 
         db.commit()
+
+
+def initiate_identity_lookup_hash_backfill() -> None:
+    """Initiates scheduler to backfill the lookup hashes of existing provided identities"""
+
+    if CONFIG.test_mode:
+        return
+
+    assert (
+        scheduler.running
+    ), "Scheduler is not running! Cannot add identity lookup hash backfill job."
+
+    logger.info("Initiating scheduler for Identity Lookup Hash Backfill")
+    scheduler.add_job(
+        func=backfill_identity_lookup_hashes,
+        kwargs={},
+        id=IDENTITY_LOOKUP_HASH_BACKFILL,
+        coalesce=True,
+        replace_existing=True,
+        trigger="interval",
+        minutes=10,
+        next_run_time=datetime.now(),
+    )
+
+
+@celery_app.task(base=DatabaseTask, bind=True)
+def backfill_identity_lookup_hashes(self: DatabaseTask) -> int:
+    """
+    Computes the lookup hashes of provided identities saved before lookup hashes were
+    introduced, so that they can be found without computing their bcrypt hashed_value.
+
+    Identities are updated in batches, each in its own transaction, walking the table in
+    id order. Returns the number of identities updated.
+    """
+    with self.get_new_session() as db:
+        backfilled = 0
+        last_id = ""
+        while True:
+            identities: List[ProvidedIdentity] = (
+                db.query(ProvidedIdentity)
+                .filter(
+                    ProvidedIdentity.id > last_id,
+                    ProvidedIdentity.lookup_hash.is_(None),
+                    ProvidedIdentity.hashed_value.isnot(None),
+                    ProvidedIdentity.encrypted_value.isnot(None),
+                )
+                .order_by(ProvidedIdentity.id)
+                .limit(IDENTITY_LOOKUP_HASH_BACKFILL_BATCH_SIZE)
+                .all()
+            )
+            if not identities:
+                break
+
+            for identity in identities:
+                # Identities without a value were hashed as the string "None", so their
+                # lookup hash is too, which also keeps them from being backfilled again
+                value = identity.encrypted_value.get("value")  # type: ignore[union-attr]
+                identity.lookup_hash = ProvidedIdentity.lookup_hash_value(value)
+                backfilled += 1
+            last_id = identities[-1].id
+            db.commit()
+
+        if backfilled:
+            logger.info(
+                "Backfilled the lookup hashes of {} provided identities", backfilled
+            )
+        return backfilled
@@ -1,10 +1,12 @@
 # pylint: disable=too-many-lines
 import json
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Set
 
 import networkx
 from loguru import logger
 from networkx import NetworkXNoCycle
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Query, Session
 
 from fides.api.common_exceptions import TraversalError
@@ -177,9 +179,14 @@ def base_task_data(
     privacy_request: PrivacyRequest,
     node: CollectionAddress,
     traversal_nodes: Dict[CollectionAddress, TraversalNode],
+    descendants: Optional[Set[CollectionAddress]] = None,
 ) -> Dict:
     """Build a dictionary of common RequestTask attributes that are shared for building
-    access, consent, and erasure tasks"""
+    access, consent, and erasure tasks
+
+    The descendants of the node can be passed in if they've already been calculated,
+    otherwise they are looked up in the graph.
+    """
     collection_representation: Optional[Dict] = None
     traversal_details = {}
 
@@ -194,6 +201,9 @@ def base_task_data(
         # and input keys, also useful for building the Execution Node
         traversal_details = traversal_nodes[node].format_traversal_details_for_save()
 
+    if descendants is None:
+        descendants = networkx.descendants(graph, node)
+
     return {
         "privacy_request_id": privacy_request.id,
         "upstream_tasks": sorted(
@@ -202,9 +212,7 @@ def base_task_data(
         "downstream_tasks": sorted(
             [downstream.value for downstream in graph.successors(node)]
         ),
-        "all_descendant_tasks": sorted(
-            [descend.value for descend in list(networkx.descendants(graph, node))]
-        ),
+        "all_descendant_tasks": sorted([descend.value for descend in descendants]),
         "collection_address": node.value,
         "dataset_name": node.dataset,
         "collection_name": node.collection,
@@ -218,6 +226,83 @@ def base_task_data(
     }
 
 
+def _get_all_descendants(
+    graph: networkx.DiGraph, sorted_nodes: List[CollectionAddress]
+) -> Dict[CollectionAddress, Set[CollectionAddress]]:
+    """Calculate the descendants of every node in a single pass over the graph in reverse
+    topological order, instead of searching the graph again from every node"""
+    descendants: Dict[CollectionAddress, Set[CollectionAddress]] = {}
+    for node in reversed(sorted_nodes):
+        node_descendants: Set[CollectionAddress] = set()
+        for child in graph.successors(node):
+            node_descendants.add(child)
+            node_descendants.update(descendants[child])
+        descendants[node] = node_descendants
+    return descendants
+
+
+def bulk_create_request_tasks(  # pylint: disable=too-many-arguments
+    session: Session,
+    privacy_request: PrivacyRequest,
+    action_type: ActionType,
+    graph: networkx.DiGraph,
+    dataset_graph: DatasetGraph,
+    traversal_nodes: Dict[CollectionAddress, TraversalNode],
+    root_access_data: Optional[List[Dict[str, Any]]] = None,
+) -> None:
+    """
+    Build a RequestTask row for every node in the graph that doesn't already have a task for this
+    action type, and insert them all in one bulk INSERT rather than one ORM create per task.
+
+    If root_access_data is supplied, it is saved as the access data of the root task and every
+    other task starts with empty access data.
+    """
+    existing_addresses: Set[str] = {
+        address
+        for (address,) in session.query(RequestTask.collection_address).filter(
+            RequestTask.privacy_request_id == privacy_request.id,
+            RequestTask.action_type == action_type,
+        )
+    }
+    sorted_nodes: List[CollectionAddress] = list(networkx.topological_sort(graph))
+    descendants: Dict[CollectionAddress, Set[CollectionAddress]] = _get_all_descendants(
+        graph, sorted_nodes
+    )
+
+    # Tasks are listed in order of creation. The created_at server default would give every
+    # row of one INSERT the same timestamp, so the timestamps are staggered from the database's
+    # clock instead to keep the tasks in topological order
+    created_at: datetime = session.query(func.now()).scalar()
+    rows: List[Dict[str, Any]] = []
+    for node in sorted_nodes:
+        if node.value in existing_addresses:
+            continue
+
+        row: Dict[str, Any] = {
+            **base_task_data(
+                graph,
+                dataset_graph,
+                privacy_request,
+                node,
+                traversal_nodes,
+                descendants[node],
+            ),
+            "action_type": action_type,
+            "created_at": created_at + timedelta(microseconds=len(rows)),
+            "updated_at": created_at + timedelta(microseconds=len(rows)),
+        }
+        if root_access_data is not None:
+            row["access_data"] = (
+                root_access_data if node == ROOT_COLLECTION_ADDRESS else []
+            )
+        rows.append(row)
+
+    if rows:
+        # Executed as a multi-row INSERT, in pages, by the psycopg2 dialect
+        session.execute(insert(RequestTask.__table__), rows)
+        session.commit()
+
+
 def persist_new_access_request_tasks(
     session: Session,
     privacy_request: PrivacyRequest,
@@ -237,25 +322,17 @@ def persist_new_access_request_tasks(
         traversal_nodes, end_nodes, traversal
     )
 
-    for node in list(networkx.topological_sort(graph)):
-        if privacy_request.get_existing_request_task(
-            session, action_type=ActionType.access, collection_address=node
-        ):
-            continue
-
-        RequestTask.create(
-            session,
-            data={
-                **base_task_data(
-                    graph, dataset_graph, privacy_request, node, traversal_nodes
-                ),
-                "access_data": (
-                    [traversal.seed_data] if node == ROOT_COLLECTION_ADDRESS else []
-                ),  # For consistent treatment of nodes, add the seed data to the root node.  Subsequent
-                # tasks will save the data collected on the same field.
-                "action_type": ActionType.access,
-            },
-        )
+    bulk_create_request_tasks(
+        session,
+        privacy_request,
+        ActionType.access,
+        graph,
+        dataset_graph,
+        traversal_nodes,
+        # For consistent treatment of nodes, add the seed data to the root node.  Subsequent
+        # tasks will save the data collected on the same field.
+        root_access_data=[traversal.seed_data],
+    )
 
     root_task: RequestTask = privacy_request.get_root_task_by_action(ActionType.access)
 
@@ -281,21 +358,14 @@ def persist_initial_erasure_request_tasks(
     )
     graph: networkx.DiGraph = build_erasure_networkx_digraph(traversal_nodes, end_nodes)
 
-    for node in list(networkx.topological_sort(graph)):
-        if privacy_request.get_existing_request_task(
-            session, action_type=ActionType.erasure, collection_address=node
-        ):
-            continue
-
-        RequestTask.create(
-            session,
-            data={
-                **base_task_data(
-                    graph, dataset_graph, privacy_request, node, traversal_nodes
-                ),
-                "action_type": ActionType.erasure,
-            },
-        )
+    bulk_create_request_tasks(
+        session,
+        privacy_request,
+        ActionType.erasure,
+        graph,
+        dataset_graph,
+        traversal_nodes,
+    )
 
     # If a policy has an erasure rule, this method is run immediately after creating the access tasks, so their
     # nodes in the database are the same.  There are no "ready" tasks yet, because we need to wait for the
@@ -349,7 +419,7 @@ def update_erasure_tasks_with_access_data(
         retrieved_task_data = _get_data_for_erasures(
             session, privacy_request, request_task
         )
-        request_task.data_for_erasures = retrieved_task_data
+        request_task.set_data_for_erasures(retrieved_task_data)
         request_task.save(session)
 
 
@@ -369,22 +439,16 @@ def persist_new_consent_request_tasks(
     """
     graph: networkx.DiGraph = build_consent_networkx_digraph(traversal_nodes)
 
-    for node in list(networkx.topological_sort(graph)):
-        if privacy_request.get_existing_request_task(
-            session, action_type=ActionType.consent, collection_address=node
-        ):
-            continue
-        RequestTask.create(
-            session,
-            data={
-                **base_task_data(
-                    graph, dataset_graph, privacy_request, node, traversal_nodes
-                ),
-                # Consent nodes take in identity data from their upstream root node
-                "access_data": ([identity] if node == ROOT_COLLECTION_ADDRESS else []),
-                "action_type": ActionType.consent,
-            },
-        )
+    bulk_create_request_tasks(
+        session,
+        privacy_request,
+        ActionType.consent,
+        graph,
+        dataset_graph,
+        traversal_nodes,
+        # Consent nodes take in identity data from their upstream root node
+        root_access_data=[identity],
+    )
 
     root_task: RequestTask = privacy_request.get_root_task_by_action(ActionType.consent)
 
@@ -431,11 +495,11 @@ def run_access_request(
         logger.info("Building access graph for {}", privacy_request.id)
         traversal: Traversal = Traversal(graph, identity)
 
-        # Traversal.traverse populates traversal_nodes in place, adding parents and children to each traversal_node.
-        traversal_nodes: Dict[CollectionAddress, TraversalNode] = {}
-        end_nodes: List[CollectionAddress] = traversal.traverse(
-            traversal_nodes, collect_tasks_fn
-        )
+        # Links parents and children to each traversal_node, reusing the cached traversal plan
+        # if the same graph has already been traversed with the same identity types.
+        traversal_nodes: Dict[CollectionAddress, TraversalNode]
+        end_nodes: List[CollectionAddress]
+        traversal_nodes, end_nodes = traversal.traverse_and_collect_nodes()
         # Save Access Request Tasks to the database
         ready_tasks = persist_new_access_request_tasks(
             session, privacy_request, traversal, traversal_nodes, end_nodes, graph
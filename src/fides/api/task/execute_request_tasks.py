@@ -1,6 +1,8 @@
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
+from celery import group
 from celery.app.task import Task
+from celery.result import GroupResult
 from loguru import logger
 from sqlalchemy.orm import Query, Session
 
@@ -162,11 +164,12 @@ def queue_downstream_tasks(
 
     If we've reached the terminator task, restart the privacy request from the appropriate checkpoint.
     """
-    pending_downstream: Query = request_task.get_pending_downstream_tasks(session)
-    for downstream_task in pending_downstream:
-        if downstream_task.can_queue_request_task(session, should_log=True):
-            log_task_queued(downstream_task, request_task.collection_address)
-            queue_request_task(downstream_task, privacy_request_proceed)
+    ready_downstream: List[RequestTask] = request_task.get_ready_downstream_tasks(
+        session
+    )
+    for downstream_task in ready_downstream:
+        log_task_queued(downstream_task, request_task.collection_address)
+    queue_request_tasks(ready_downstream, privacy_request_proceed)
 
     if (
         request_task.request_task_address == TERMINATOR_ADDRESS
@@ -378,18 +381,10 @@ def _order_tasks_by_input_key(
     Data being passed to GraphTask.access_request is expected to have the same order
     as input keys so we know which data belongs to which upstream collection
     """
-    tasks: List[Optional[RequestTask]] = []
-    for key in input_keys:
-        task = next(
-            (
-                upstream
-                for upstream in upstream_tasks
-                if upstream.collection_address == key.value
-            ),
-            None,
-        )
-        tasks.append(task)
-    return tasks
+    tasks_by_address: Dict[str, RequestTask] = {
+        upstream.collection_address: upstream for upstream in upstream_tasks
+    }
+    return [tasks_by_address.get(key.value) for key in input_keys]
 
 
 mapping = {
@@ -409,7 +404,30 @@ def queue_request_task(
         privacy_request_task_id=request_task.id,
         privacy_request_proceed=privacy_request_proceed,
     )
-    cache_task_tracking_key(request_task.id, celery_task.task_id)
+    cache_task_tracking_key(
+        request_task.id, celery_task.task_id, request_task.privacy_request_id
+    )
+
+
+def queue_request_tasks(
+    request_tasks: List[RequestTask], privacy_request_proceed: bool = True
+) -> None:
+    """Queues the RequestTasks in Celery with a single group dispatch and caches their Celery Task IDs"""
+    if not request_tasks:
+        return
+
+    group_result: GroupResult = group(
+        mapping[request_task.action_type].si(
+            privacy_request_id=request_task.privacy_request_id,
+            privacy_request_task_id=request_task.id,
+            privacy_request_proceed=privacy_request_proceed,
+        )
+        for request_task in request_tasks
+    ).apply_async()
+    for request_task, celery_task in zip(request_tasks, group_result.results):
+        cache_task_tracking_key(
+            request_task.id, celery_task.task_id, request_task.privacy_request_id
+        )
 
 
 def log_task_queued(request_task: RequestTask, location: str) -> None:
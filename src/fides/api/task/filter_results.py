@@ -1,6 +1,5 @@
-import itertools
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Union
 
 from loguru import logger
 
@@ -10,7 +9,7 @@ from fides.api.util.collection_util import Row
 
 
 def filter_data_categories(
-    access_request_results: Dict[str, List[Dict[str, Optional[Any]]]],
+    access_request_results: Mapping[str, List[Dict[str, Optional[Any]]]],
     target_categories: Set[str],
     dataset_graph: DatasetGraph,
     rule_key: str = "",
@@ -33,68 +32,120 @@ def filter_data_categories(
         "Filtering Access Request results to return fields associated with data categories"
     )
     filtered_access_results: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-    for node_address, results in access_request_results.items():
-        if not results:
-            continue
+    target_category_prefixes = tuple(target_categories)
+    # Results are only read for the collections that have data to return, since
+    # the access results may be decoded lazily
+    for node_address in access_request_results:
+        collection_address = CollectionAddress.from_string(node_address)
 
         # Results from fides connectors are a special case:
         # they've already been filtered and stored in a dict keyed by rule key.
         # So here, we simply find the results corresponding to our current rule
         # and unpack the result so that its stored at the "top level"
         # of the results dict
-        if fides_connector_datasets and (
-            CollectionAddress.from_string(node_address).dataset
-            in fides_connector_datasets
+        if (
+            fides_connector_datasets
+            and collection_address.dataset in fides_connector_datasets
         ):
-            unpack_fides_connector_results(
-                results, filtered_access_results, rule_key, node_address
-            )
+            results = access_request_results[node_address]
+            if results:
+                unpack_fides_connector_results(
+                    results, filtered_access_results, rule_key, node_address
+                )
             # do not do any further processing on fides connector results
             # as they have already been pre-filtered
             continue
 
         # Gets all FieldPaths on this traversal_node associated with the requested data
         # categories and sub data categories
-        target_field_paths: Set[FieldPath] = set(
-            itertools.chain(
-                *[
-                    field_paths
-                    for cat, field_paths in dataset_graph.data_category_field_mapping[
-                        CollectionAddress.from_string(node_address)
-                    ].items()
-                    if any(cat.startswith(tar) for tar in target_categories)
-                ]
+        target_field_paths: Set[FieldPath] = (
+            dataset_graph.data_category_index.field_paths_for_categories(
+                collection_address, target_categories
             )
         )
 
         collection_data_categories = set(
-            dataset_graph.nodes[
-                CollectionAddress.from_string(node_address)
-            ].collection.data_categories
-            or []
+            dataset_graph.nodes[collection_address].collection.data_categories or []
         )
 
         if collection_data_categories:
             if any(
-                collection_category.startswith(tuple(target_categories))
+                collection_category.startswith(target_category_prefixes)
                 for collection_category in collection_data_categories
             ):
-                filtered_access_results[node_address].extend(results)
+                results = access_request_results[node_address]
+                if results:
+                    filtered_access_results[node_address].extend(results)
                 continue
 
         if not target_field_paths:
             continue
 
-        for row in results:
-            filtered_results: Dict[str, Any] = {}
-            for field_path in target_field_paths:
-                select_and_save_field(filtered_results, row, field_path)
-            remove_empty_containers(filtered_results)
-            filtered_access_results[node_address].append(filtered_results)
+        results = access_request_results[node_address]
+        if not results:
+            continue
+
+        projector = RowProjector(target_field_paths)
+        filtered_access_results[node_address].extend(
+            projector.project(row) for row in results
+        )
 
     return filtered_access_results
 
 
+# Marks a projected value that is empty and should be left out of its parent
+_EMPTY = object()
+
+
+class RowProjector:
+    """Projects rows onto a set of target field paths in a single pass.
+
+    The field paths are compiled into a tree keyed by field name, so each row is walked
+    once no matter how many field paths there are. The result is the same as selecting
+    every field path with `select_and_save_field` and then calling `remove_empty_containers`:
+
+    - scalar values along a field path are kept, even if the field path continues
+    - arrays are projected element by element, keeping scalar elements
+    - objects and arrays that end up empty are left out rather than created and removed
+    """
+
+    def __init__(self, field_paths: Iterable[FieldPath]) -> None:
+        self.children: Dict[str, RowProjector] = {}
+        for field_path in field_paths:
+            projector = self
+            for level in field_path.levels:
+                if level not in projector.children:
+                    projector.children[level] = RowProjector([])
+                projector = projector.children[level]
+
+    def project(self, row: Row) -> Dict[str, Any]:
+        """Returns the data in the row along the target field paths"""
+        projected = self.project_value(row)
+        return {} if projected is _EMPTY else projected
+
+    def project_value(self, value: Any) -> Any:
+        """Returns the value projected onto this subtree of field paths, or `_EMPTY`
+        if nothing along the field paths is left"""
+        if isinstance(value, dict):
+            projected_dict: Dict[str, Any] = {}
+            for key, child in self.children.items():
+                if key in value:
+                    projected_value = child.project_value(value[key])
+                    if projected_value is not _EMPTY:
+                        projected_dict[key] = projected_value
+            return projected_dict or _EMPTY
+
+        if isinstance(value, list):
+            projected_list: List[Any] = []
+            for elem in value:
+                projected_elem = self.project_value(elem)
+                if projected_elem is not _EMPTY:
+                    projected_list.append(projected_elem)
+            return projected_list or _EMPTY
+
+        return value
+
+
 def select_and_save_field(saved: Any, row: Row, target_path: FieldPath) -> Dict:
     """Extract the data located along the given `target_path` from the row and add to the "saved" dictionary.
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 from loguru import logger
 from sqlalchemy.orm import Session
@@ -34,7 +34,7 @@ def use_dsr_3_0_scheduler(
     """
     use_dsr_3_0 = CONFIG.execution.use_dsr_3_0
 
-    prev_results: Dict[str, Optional[List[Row]]] = (
+    prev_results: Mapping[str, Optional[List[Row]]] = (
         privacy_request.get_raw_access_results()
     )
     existing_tasks_count: int = privacy_request.get_tasks_by_action(action_type).count()
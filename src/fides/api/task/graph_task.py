@@ -4,7 +4,7 @@ import traceback
 from abc import ABC
 from functools import wraps
 from time import sleep
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 from loguru import logger
 from ordered_set import OrderedSet
@@ -41,6 +41,9 @@ from fides.api.models.privacy_request import (
     ExecutionLogStatus,
     PrivacyRequest,
     RequestTask,
+    RequestTaskDataType,
+    RequestTaskDataWriter,
+    RequestTaskResults,
 )
 from fides.api.schemas.policy import ActionType
 from fides.api.service.connectors.base_connector import BaseConnector
@@ -486,34 +489,70 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         return out
 
     def access_results_post_processing(
-        self, formatted_input_data: NodeInput, output: List[Row]
+        self, formatted_input_data: NodeInput, output_chunks: Iterable[List[Row]]
     ) -> List[Row]:
         """
         Completes post-processing filtering of access request results.
 
+        Results are consumed chunk by chunk as the connector retrieves them. For DSR 3.0, each processed
+        chunk is saved on the Request Task as soon as it's built, so only one chunk of results is held in memory.
+
         By default, if an array field was an entry point into the node, return only array elements that *match* the
         condition.  Specifying return_all_elements = true on the field's config will instead return *all* array elements.
 
-        Caches the data in TWO separate formats: 1) erasure format, *replaces* unmatched array elements with placeholder
+        Saves the data in TWO separate formats: 1) erasure format, *replaces* unmatched array elements with placeholder
         text, and 2) access request format, which *removes* unmatched array elements altogether.  If no data was filtered
-        out, both cached versions will be the same.
+        out, both saved versions will be the same.
+
+        For DSR 3.0, the results are read back from the Request Task rather than returned, so an empty list is returned.
         """
         post_processed_node_input_data: FieldPathNodeInput = (
             self.post_process_input_data(formatted_input_data)
         )
 
-        # For erasures: cache results with non-matching array elements *replaced* with placeholder text
-        placeholder_output: List[Row] = copy.deepcopy(output)
-        for row in placeholder_output:
-            filter_element_match(
-                row, query_paths=post_processed_node_input_data, delete_elements=False
+        # For DSR 3.0, save data directly on the Request Task.
+        # TODO Remove the in-memory lists when we stop support for DSR 2.0
+        dsr_3_0: bool = bool(self.request_task.id)
+        placeholder_output: List[Row] = []
+        output: List[Row] = []
+        if dsr_3_0:
+            placeholder_writer = RequestTaskDataWriter(
+                self.request_task, RequestTaskDataType.data_for_erasures
+            )
+            access_data_writer = RequestTaskDataWriter(
+                self.request_task, RequestTaskDataType.access_data
             )
 
-        # For DSR 3.0, save data to build masking requests directly
-        # on the Request Task.
-        # Results saved with matching array elements preserved
-        if self.request_task.id:
-            self.request_task.data_for_erasures = placeholder_output
+        for chunk in output_chunks:
+            # For erasures: save results with non-matching array elements *replaced* with placeholder text
+            placeholder_chunk: List[Row] = copy.deepcopy(chunk)
+            for row in placeholder_chunk:
+                filter_element_match(
+                    row,
+                    query_paths=post_processed_node_input_data,
+                    delete_elements=False,
+                )
+
+            # For access request results, save results with non-matching array elements *removed*
+            for row in chunk:
+                logger.info(
+                    "Filtering row in {} for matching array elements.",
+                    self.execution_node.address,
+                )
+                filter_element_match(row, post_processed_node_input_data)
+
+            if dsr_3_0:
+                # Results saved with matching array elements preserved
+                placeholder_writer.write(placeholder_chunk)
+                access_data_writer.write(chunk)
+            else:
+                placeholder_output.extend(placeholder_chunk)
+                output.extend(chunk)
+
+        if dsr_3_0:
+            placeholder_writer.close()
+            access_data_writer.close()
+            return []
 
         # TODO Remove when we stop support for DSR 2.0
         # Save data to build masking requests for DSR 2.0 in Redis.
@@ -522,18 +561,6 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
             f"access_request__{self.key}", placeholder_output
         )
 
-        # For access request results, cache results with non-matching array elements *removed*
-        for row in output:
-            logger.info(
-                "Filtering row in {} for matching array elements.",
-                self.execution_node.address,
-            )
-            filter_element_match(row, post_processed_node_input_data)
-
-        if self.request_task.id:
-            # Saves intermediate access results for DSR 3.0 directly on the Request Task
-            self.request_task.access_data = output
-
         # TODO Remove when we stop support for DSR 2.0
         # Saves intermediate access results for DSR 2.0 in Redis
         self.resources.cache_object(f"access_request__{self.key}", output)
@@ -573,7 +600,7 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         formatted_input_data: NodeInput = self.pre_process_input_data(
             *inputs, group_dependent_fields=True
         )
-        output: List[Row] = self.connector.retrieve_data(
+        output_chunks: Iterable[List[Row]] = self.connector.retrieve_data_in_chunks(
             self.execution_node,
             self.resources.policy,
             self.resources.request,
@@ -581,7 +608,8 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
             formatted_input_data,
         )
         filtered_output: List[Row] = self.access_results_post_processing(
-            self.pre_process_input_data(*inputs, group_dependent_fields=False), output
+            self.pre_process_input_data(*inputs, group_dependent_fields=False),
+            output_chunks,
         )
         self.log_end(ActionType.access)
         return filtered_output
@@ -717,9 +745,12 @@ def start_function(seed: List[Dict[str, Any]]) -> Callable[[], List[Dict[str, An
 
 
 def filter_by_enabled_actions(
-    access_results: Dict[str, Any], connection_configs: List[ConnectionConfig]
-) -> Dict[str, Any]:
-    """Removes any access results that are associated with a connection config that doesn't have the access action enabled."""
+    access_results: Mapping[str, Any], connection_configs: List[ConnectionConfig]
+) -> Mapping[str, Any]:
+    """Removes any access results that are associated with a connection config that doesn't have the access action enabled.
+
+    Request Task results are filtered without decoding them.
+    """
 
     # create a map between the dataset and its connection config's enabled actions
     dataset_enabled_actions = {}
@@ -728,14 +759,16 @@ def filter_by_enabled_actions(
             dataset_enabled_actions[dataset.fides_key] = config.enabled_actions
 
     # use the enabled actions map to filter out the access results
-    filtered_access_results = {}
-    for key, value in access_results.items():
+    filtered_keys = []
+    for key in access_results:
         dataset_name = key.split(":")[0]
         enabled_action = dataset_enabled_actions.get(dataset_name)
         if enabled_action is None or ActionType.access in enabled_action:
-            filtered_access_results[key] = value
+            filtered_keys.append(key)
 
-    return filtered_access_results
+    if isinstance(access_results, RequestTaskResults):
+        return access_results.select(filtered_keys)
+    return {key: access_results[key] for key in filtered_keys}
 
 
 def get_cached_data_for_erasures(
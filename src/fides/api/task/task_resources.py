@@ -27,8 +27,9 @@ from fides.api.service.connectors import (
 )
 from fides.api.service.connectors.base_email_connector import BaseEmailConnector
 from fides.api.service.connectors.s3_connector import S3Connector
-from fides.api.util.cache import get_cache
+from fides.api.util.cache import get_cache, get_privacy_request_cache_index_key
 from fides.api.util.collection_util import Row, extract_key_for_address
+from fides.api.util.encryption.secrets_util import SecretsUtil
 
 
 class Connections:
@@ -107,6 +108,7 @@ class TaskResources:
      - the request task
      - the policy
      - configurations to any outside resources the task will require to run
+     - the masking secrets of the privacy request, loaded once from the cache
     """
 
     def __init__(
@@ -131,6 +133,7 @@ class TaskResources:
 
     def __enter__(self) -> "TaskResources":
         """Support 'with' usage for closing resources"""
+        SecretsUtil.register_request_masking_secrets(self.request.id)
         return self
 
     def __exit__(self, _type: Any, value: Any, traceback: Any) -> None:
@@ -143,13 +146,19 @@ class TaskResources:
         stored in redis under 'PLACEHOLDER_RESULTS__PRIVACY_REQUEST_ID__TYPE__COLLECTION_ADDRESS
         """
         self.cache.set_encoded_object(
-            f"PLACEHOLDER_RESULTS__{self.request.id}__{key}", value
+            f"PLACEHOLDER_RESULTS__{self.request.id}__{key}",
+            value,
+            index_key=get_privacy_request_cache_index_key(self.request.id),
         )
 
     # TODO Remove when we stop support for DSR 2.0
     def cache_object(self, key: str, value: Any) -> None:
         """Store in cache. Object will be stored in redis under 'REQUEST_ID__TYPE__ADDRESS'"""
-        self.cache.set_encoded_object(f"{self.request.id}__{key}", value)
+        self.cache.set_encoded_object(
+            f"{self.request.id}__{key}",
+            value,
+            index_key=get_privacy_request_cache_index_key(self.request.id),
+        )
 
     # TODO Remove when we stop support for DSR 2.0
     def get_all_cached_objects(self) -> Dict[str, Optional[List[Row]]]:
@@ -170,7 +179,9 @@ class TaskResources:
         'REQUEST_ID__erasure_request__ADDRESS
         '"""
         self.cache.set_encoded_object(
-            f"{self.request.id}__erasure_request__{key}", value
+            f"{self.request.id}__erasure_request__{key}",
+            value,
+            index_key=get_privacy_request_cache_index_key(self.request.id),
         )
 
     # TODO Remove when we stop support for DSR 2.0
@@ -198,3 +209,4 @@ class TaskResources:
         """
         logger.debug("Closing all task resources for {}", self.request.id)
         self.connections.close()
+        SecretsUtil.unregister_request_masking_secrets(self.request.id)
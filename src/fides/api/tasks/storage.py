@@ -4,11 +4,15 @@ import json
 import os
 import secrets
 import zipfile
-from io import BytesIO
-from typing import Any, Dict, Optional, Set, Union
+from base64 import b64encode
+from contextlib import contextmanager
+from io import BufferedWriter, BytesIO, RawIOBase
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, Dict, Iterator, Mapping, Optional, Set, Union
 
 import pandas as pd
 from botocore.exceptions import ClientError, ParamValidationError
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from loguru import logger
 
 from fides.api.cryptography.cryptographic_util import bytes_to_b64_str
@@ -20,32 +24,47 @@ from fides.api.service.privacy_request.dsr_package.dsr_report_builder import (
 )
 from fides.api.util.aws_util import get_aws_session
 from fides.api.util.cache import get_cache, get_encryption_cache_key
+from fides.api.util.collection_util import chunks
 from fides.api.util.encryption.aes_gcm_encryption_scheme import (
     encrypt_to_bytes_verify_secrets_length,
+    verify_encryption_key,
+    verify_nonce,
 )
 from fides.api.util.storage_util import storage_json_encoder
 from fides.config import CONFIG
 
 LOCAL_FIDES_UPLOAD_DIRECTORY = "fides_uploads"
 
+# Access results are written to a temporary file on disk once they grow past this size
+UPLOAD_SPOOL_MAX_SIZE_BYTES = 8 * 1024 * 1024
+# Size of the batches that access results are written to their file in
+RESULTS_WRITE_BUFFER_SIZE_BYTES = 64 * 1024
+# Number of rows serialized at a time when writing JSON access results
+RESULTS_WRITE_BATCH_ROWS = 500
 
-def encrypt_access_request_results(data: Union[str, bytes], request_id: str) -> str:
-    """Encrypt data with encryption key if provided, otherwise return unencrypted data"""
+
+def get_encryption_key(request_id: str) -> Optional[bytes]:
+    """Returns the encryption key cached for the privacy request, if one was provided"""
     cache = get_cache()
     encryption_cache_key = get_encryption_cache_key(
         privacy_request_id=request_id,
         encryption_attr="key",
     )
+    encryption_key: str | None = cache.get(encryption_cache_key)
+    if not encryption_key:
+        return None
+    return encryption_key.encode(encoding=CONFIG.security.encoding)
+
+
+def encrypt_access_request_results(data: Union[str, bytes], request_id: str) -> str:
+    """Encrypt data with encryption key if provided, otherwise return unencrypted data"""
     if isinstance(data, bytes):
         data = data.decode(CONFIG.security.encoding)
 
-    encryption_key: str | None = cache.get(encryption_cache_key)
-    if not encryption_key:
+    bytes_encryption_key = get_encryption_key(request_id)
+    if not bytes_encryption_key:
         return data
 
-    bytes_encryption_key: bytes = encryption_key.encode(
-        encoding=CONFIG.security.encoding
-    )
     nonce: bytes = secrets.token_bytes(CONFIG.security.aes_gcm_nonce_length)
     # b64encode the entire nonce and the encrypted message together
     return bytes_to_b64_str(
@@ -54,53 +73,195 @@ def encrypt_access_request_results(data: Union[str, bytes], request_id: str) ->
     )
 
 
-def write_to_in_memory_buffer(
-    resp_format: str, data: Dict[str, Any], privacy_request: PrivacyRequest
-) -> BytesIO:
-    """Write JSON/CSV data to in-memory file-like object to be passed to S3. Encrypt data if encryption key/nonce
+class EncryptedResultsWriter(RawIOBase):
+    """
+    A writable stream that encrypts everything written to it on the way to the
+    underlying file.
+
+    The output is the same as encrypt_access_request_results: the base64 encoded nonce,
+    AES-GCM ciphertext and tag. The ciphertext is produced incrementally, so only a
+    small buffer is held in memory no matter how much is written.
+    """
+
+    def __init__(self, fileobj: IO[bytes], key: bytes) -> None:
+        super().__init__()
+        nonce: bytes = secrets.token_bytes(CONFIG.security.aes_gcm_nonce_length)
+        verify_nonce(nonce)
+        verify_encryption_key(key)
+        self._fileobj = fileobj
+        self._encryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).encryptor()
+        self._encryptor.authenticate_additional_data(nonce)
+        # Bytes waiting to be base64 encoded, which is done in multiples of 3 bytes
+        # so the encoded chunks can be concatenated
+        self._pending = nonce
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._encode(self._encryptor.update(bytes(data)))
+        return len(data)
+
+    def finish(self) -> None:
+        """Writes out the rest of the ciphertext and the tag. The underlying file is left open."""
+        self._encode(self._encryptor.finalize() + self._encryptor.tag)
+        self._fileobj.write(b64encode(self._pending))
+        self._pending = b""
+        self.close()
+
+    def _encode(self, data: bytes) -> None:
+        self._pending += data
+        encodable_length = len(self._pending) - len(self._pending) % 3
+        if encodable_length:
+            self._fileobj.write(b64encode(self._pending[:encodable_length]))
+            self._pending = self._pending[encodable_length:]
+
+
+@contextmanager
+def open_results_writer(
+    fileobj: IO[bytes], encryption_key: Optional[bytes]
+) -> Iterator[IO[bytes]]:
+    """
+    Yields a stream to write access results to. Results are encrypted on the way to the
+    file if an encryption key is given.
+    """
+    if not encryption_key:
+        yield fileobj
+        return
+
+    writer = EncryptedResultsWriter(fileobj, encryption_key)
+    yield writer  # type: ignore[misc]
+    writer.finish()
+
+
+def write_json(
+    fileobj: IO[bytes], data: Mapping[str, Any], encryption_key: Optional[bytes]
+) -> None:
+    """
+    Writes the results as the same indented JSON document json.dumps would build,
+    serializing a batch of rows at a time instead of the whole package at once
+    """
+    encoding = CONFIG.security.encoding
+    encoder = json.JSONEncoder(indent=2, default=storage_json_encoder)
+
+    def indent(encoded: str) -> bytes:
+        # JSON strings can't contain raw newlines, so every newline in the
+        # encoded output is indentation that can be shifted a level deeper
+        return encoded.replace("\n", "\n  ").encode(encoding)
+
+    with open_results_writer(fileobj, encryption_key) as writer:
+        # Small pieces are batched into larger writes
+        buffered_writer = BufferedWriter(writer, RESULTS_WRITE_BUFFER_SIZE_BYTES)  # type: ignore[arg-type]
+        if not data:
+            buffered_writer.write(b"{}")
+        else:
+            buffered_writer.write(b"{")
+            for key_index, key in enumerate(data):
+                buffered_writer.write(b",\n  " if key_index else b"\n  ")
+                buffered_writer.write(encoder.encode(key).encode(encoding) + b": ")
+                rows = data[key]
+                if not isinstance(rows, list) or not rows:
+                    buffered_writer.write(indent(encoder.encode(rows)))
+                    continue
+
+                buffered_writer.write(b"[")
+                for batch_index, batch in enumerate(
+                    chunks(rows, RESULTS_WRITE_BATCH_ROWS)
+                ):
+                    if batch_index:
+                        buffered_writer.write(b",")
+                    # The rows of the encoded batch, without the list's brackets
+                    buffered_writer.write(indent("\n" + encoder.encode(batch)[2:-2]))
+                buffered_writer.write(b"\n  ]")
+            buffered_writer.write(b"\n}")
+        buffered_writer.flush()
+        buffered_writer.detach()
+
+
+def write_csvs(
+    fileobj: IO[bytes], data: Mapping[str, Any], encryption_key: Optional[bytes]
+) -> None:
+    """Writes a zip file with a CSV for each collection, one collection at a time"""
+    with zipfile.ZipFile(fileobj, "w") as f:
+        for key in data:
+            df = pd.json_normalize(data[key])
+            with f.open(f"{key}.csv", "w") as csv_file:
+                with open_results_writer(csv_file, encryption_key) as writer:
+                    df.to_csv(writer, index=False, encoding=CONFIG.security.encoding)
+
+
+def write_results(
+    fileobj: IO[bytes],
+    resp_format: str,
+    data: Mapping[str, Any],
+    privacy_request: PrivacyRequest,
+) -> None:
+    """Write JSON/CSV/HTML data to a file-like object. Encrypt data if encryption key/nonce
     has been cached for the given privacy request id
 
+    :param fileobj: A writable binary file-like object
     :param resp_format: str, should be one of ResponseFormat
     :param data: Dict
-    :param request_id: str, The privacy request id
+    :param privacy_request: The privacy request
     """
-    logger.info("Writing data to in-memory buffer")
-
     if resp_format == ResponseFormat.json.value:
-        json_str = json.dumps(data, indent=2, default=storage_json_encoder)
-        return BytesIO(
-            encrypt_access_request_results(json_str, privacy_request.id).encode(
-                CONFIG.security.encoding
-            )
-        )
+        write_json(fileobj, data, get_encryption_key(privacy_request.id))
+        return
 
     if resp_format == ResponseFormat.csv.value:
-        zipped_csvs = BytesIO()
-        with zipfile.ZipFile(zipped_csvs, "w") as f:
-            for key in data:
-                df = pd.json_normalize(data[key])
-                buffer = BytesIO()
-                df.to_csv(buffer, index=False, encoding=CONFIG.security.encoding)
-                buffer.seek(0)
-                f.writestr(
-                    f"{key}.csv",
-                    encrypt_access_request_results(
-                        buffer.getvalue(), privacy_request.id
-                    ),
-                )
-
-        zipped_csvs.seek(0)
-        return zipped_csvs
+        write_csvs(fileobj, data, get_encryption_key(privacy_request.id))
+        return
 
     if resp_format == ResponseFormat.html.value:
-        return DsrReportBuilder(
+        DsrReportBuilder(
             privacy_request=privacy_request,
-            dsr_data=data,
+            dsr_data=data,  # type: ignore[arg-type]
+            fileobj=fileobj,
         ).generate()
+        return
 
     raise NotImplementedError(f"No handling for response format {resp_format}.")
 
 
+def write_to_in_memory_buffer(
+    resp_format: str, data: Dict[str, Any], privacy_request: PrivacyRequest
+) -> BytesIO:
+    """Write JSON/CSV data to in-memory file-like object. Encrypt data if encryption key/nonce
+    has been cached for the given privacy request id
+
+    :param resp_format: str, should be one of ResponseFormat
+    :param data: Dict
+    :param request_id: str, The privacy request id
+    """
+    logger.info("Writing data to in-memory buffer")
+
+    buffer = BytesIO()
+    write_results(buffer, resp_format, data, privacy_request)
+    buffer.seek(0)
+    return buffer
+
+
+def write_to_spooled_file(
+    resp_format: str, data: Mapping[str, Any], privacy_request: PrivacyRequest
+) -> IO[bytes]:
+    """Write JSON/CSV data to a temporary file, which is kept in memory until it grows past
+    UPLOAD_SPOOL_MAX_SIZE_BYTES. Encrypt data if encryption key/nonce has been cached for
+    the given privacy request id.
+    """
+    logger.info("Writing data to spooled temporary file")
+
+    spooled_file = SpooledTemporaryFile(  # pylint: disable=consider-using-with
+        max_size=UPLOAD_SPOOL_MAX_SIZE_BYTES
+    )
+    try:
+        write_results(spooled_file, resp_format, data, privacy_request)
+    except Exception:
+        spooled_file.close()
+        raise
+    spooled_file.seek(0)
+    return spooled_file  # type: ignore[return-value]
+
+
 def create_presigned_url_for_s3(s3_client: Any, bucket_name: str, file_key: str) -> str:
     """ "Generate a presigned URL to share an S3 object
 
@@ -137,13 +298,16 @@ def upload_to_s3(  # pylint: disable=R0913
         my_session = get_aws_session(auth_method, storage_secrets)
         s3_client = my_session.client("s3")
 
-        # handles file chunking
+        # handles file chunking, with a multipart upload for large files
         try:
-            s3_client.upload_fileobj(
-                Fileobj=write_to_in_memory_buffer(resp_format, data, privacy_request),
-                Bucket=bucket_name,
-                Key=file_key,
-            )
+            with write_to_spooled_file(
+                resp_format, data, privacy_request
+            ) as results_file:
+                s3_client.upload_fileobj(
+                    Fileobj=results_file,
+                    Bucket=bucket_name,
+                    Key=file_key,
+                )
         except Exception as e:
             logger.error("Encountered error while uploading s3 object: {}", e)
             raise e
@@ -175,9 +339,7 @@ def upload_to_local(
         os.makedirs(LOCAL_FIDES_UPLOAD_DIRECTORY)
 
     filename = f"{LOCAL_FIDES_UPLOAD_DIRECTORY}/{file_key}"
-    in_memory_file = write_to_in_memory_buffer(resp_format, data, privacy_request)
-
     with open(filename, "wb") as file:
-        file.write(in_memory_file.getvalue())
+        write_results(file, resp_format, data, privacy_request)
 
     return "your local fides_uploads folder"
@@ -1,10 +1,9 @@
 import json
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 from urllib.parse import unquote_to_bytes
 
 from loguru import logger
 from redis import Redis
-from redis.client import Script  # type: ignore
 from redis.exceptions import ConnectionError as ConnectionErrorFromRedis
 from redis.exceptions import DataError
 
@@ -15,6 +14,12 @@ from fides.api.tasks import (
     PRIVACY_PREFERENCES_QUEUE_NAME,
     celery_app,
 )
+from fides.api.util.cache_codec import (
+    MSGPACK_CACHE_CODEC,
+    get_cache_codec,
+    is_msgpack_encoded,
+)
+from fides.api.util.collection_util import chunks
 from fides.api.util.custom_json_encoder import CustomJSONEncoder, _custom_decoder
 from fides.config import CONFIG
 
@@ -36,13 +41,24 @@ class FidesopsRedis(Redis):
         key: str,
         value: RedisValue,
         expire_time: int = CONFIG.redis.default_ttl_seconds,
+        index_key: Optional[str] = None,
     ) -> Optional[bool]:
-        """Call the connection class' default set method with ex= our default TTL"""
+        """Call the connection class' default set method with ex= our default TTL
+
+        If an index_key is supplied, the key is also added to that index set in the
+        same round trip so it can later be removed with delete_indexed_keys."""
         if not expire_time:
             # We have to check this condition for the edge case where `None` is explicitly
             # passed to this method.
             expire_time = CONFIG.redis.default_ttl_seconds
-        return self.set(key, value, ex=expire_time)
+        if not index_key:
+            return self.set(key, value, ex=expire_time)
+
+        pipe = self.pipeline()
+        pipe.set(key, value, ex=expire_time)
+        pipe.sadd(index_key, key)
+        pipe.expire(index_key, max(expire_time, CONFIG.redis.default_ttl_seconds))
+        return pipe.execute()[0]
 
     def get_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> List[str]:
         """Retrieve all keys that match a given prefix."""
@@ -55,12 +71,30 @@ class FidesopsRedis(Redis):
             out.extend(keys)
         return out
 
-    def delete_keys_by_prefix(self, prefix: str) -> None:
-        """Delete all keys starting with a given prefix"""
-        s: Script = self.register_script(
-            f"for _,k in ipairs(redis.call('keys','{prefix}*')) do redis.call('del',k) end"
+    def delete_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> None:
+        """Delete all keys starting with a given prefix.
+
+        Walks the keyspace incrementally with SCAN and unlinks matches in batches of
+        at most chunk_size keys, so other clients are not blocked while the keyspace
+        is searched and the memory is reclaimed in the background."""
+        self._unlink_in_batches(
+            self.scan_iter(match=f"{prefix}*", count=chunk_size), chunk_size
         )
-        s()
+
+    def delete_indexed_keys(self, index_key: str, chunk_size: int = 1000) -> None:
+        """Delete every key recorded in the given index set, followed by the index itself.
+
+        Unlike delete_keys_by_prefix this never searches the keyspace, it only reads
+        the members of the index."""
+        self._unlink_in_batches(
+            self.sscan_iter(index_key, count=chunk_size), chunk_size
+        )
+        self.unlink(index_key)
+
+    def _unlink_in_batches(self, keys: Iterable[str], chunk_size: int) -> None:
+        """Unlink the given keys, sending at most chunk_size keys per command"""
+        for batch in chunks(keys, chunk_size):
+            self.unlink(*batch)
 
     def get_values(self, keys: List[str]) -> Dict[str, Optional[Any]]:
         """Retrieve all values corresponding to the set of input keys and return them as a
@@ -69,10 +103,15 @@ class FidesopsRedis(Redis):
         values = self.mget(keys)
         return {x[0]: x[1] for x in zip(keys, values)}
 
-    def set_encoded_object(self, key: str, obj: Any) -> Optional[bool]:
-        """Set an object in redis in an encoded form. This object should be retrieved via
-        get_objects_by_prefix or processed with decode_obj."""
-        return self.set_with_autoexpire(f"EN_{key}", FidesopsRedis.encode_obj(obj))
+    def set_encoded_object(
+        self, key: str, obj: Any, index_key: Optional[str] = None
+    ) -> Optional[bool]:
+        """Set an object in redis in an encoded form, using the configured cache codec.
+        This object should be retrieved via get_objects_by_prefix or processed with decode_obj.
+        """
+        return self.set_with_autoexpire(
+            f"EN_{key}", get_cache_codec().encode(obj), index_key=index_key
+        )
 
     def get_encoded_by_key(self, key: str) -> Optional[Any]:
         """Returns cached obj decoded from base64"""
@@ -96,11 +135,14 @@ class FidesopsRedis(Redis):
 
     @staticmethod
     def decode_obj(bs: Optional[str]) -> Optional[Dict[str, Any]]:
-        """Decode an object from its JSON.
+        """Decode an object from its JSON, or from its msgpack encoding if it was
+        written with the msgpack cache codec.
 
         Since Redis may not contain a value
         for a given key it's possible we may try to decode an empty object."""
         if bs:
+            if is_msgpack_encoded(bs):
+                return get_cache_codec(MSGPACK_CACHE_CODEC).decode(bs)
             try:
                 result = json.loads(bs, object_hook=_custom_decoder)
             except json.decoder.JSONDecodeError:
@@ -158,6 +200,11 @@ def get_cache(should_log: Optional[bool] = False) -> FidesopsRedis:
     return _connection
 
 
+def get_privacy_request_cache_index_key(privacy_request_id: str) -> str:
+    """Return the key of the set indexing the cache keys written for this PrivacyRequest"""
+    return f"id-{privacy_request_id}-cache-index"
+
+
 def get_identity_cache_key(privacy_request_id: str, identity_attribute: str) -> str:
     """Return the key at which to save this PrivacyRequest's identity for the passed in attribute"""
     # TODO: Remove this prefix
@@ -195,16 +242,34 @@ def get_masking_secret_cache_key(
 def get_all_cache_keys_for_privacy_request(privacy_request_id: str) -> List[Any]:
     """Returns all cache keys related to this privacy request's cached identities"""
     cache: FidesopsRedis = get_cache()
-    return cache.keys(f"{privacy_request_id}-*") + cache.keys(
-        f"id-{privacy_request_id}-*"
-    )
+    return cache.get_keys_by_prefix(
+        f"{privacy_request_id}-"
+    ) + cache.get_keys_by_prefix(f"id-{privacy_request_id}-")
+
+
+def clear_cache_for_privacy_request(privacy_request_id: str) -> None:
+    """Deletes the cache keys written for this privacy request.
+
+    Keys are found through the privacy request's cache index. Requests cached before
+    the index existed fall back to an incremental scan of the privacy request's prefixes.
+    """
+    cache: FidesopsRedis = get_cache()
+    index_key = get_privacy_request_cache_index_key(privacy_request_id)
+    if cache.exists(index_key):
+        cache.delete_indexed_keys(index_key)
+        return
+
+    cache.delete_keys_by_prefix(f"{privacy_request_id}-")
+    cache.delete_keys_by_prefix(f"id-{privacy_request_id}-")
 
 
 def get_async_task_tracking_cache_key(privacy_request_id: str) -> str:
     return f"id-{privacy_request_id}-async-execution"
 
 
-def cache_task_tracking_key(request_id: str, celery_task_id: str) -> None:
+def cache_task_tracking_key(
+    request_id: str, celery_task_id: str, privacy_request_id: Optional[str] = None
+) -> None:
     """
     Cache the celery task id created to run the Privacy Request or Request Task.
 
@@ -214,16 +279,24 @@ def cache_task_tracking_key(request_id: str, celery_task_id: str) -> None:
     :param request_id: Can be the Privacy Request Id or a Request Task ID - these are cached in the same place.
     :param celery_task_id: The id of the Celery task itself that was queued to run the
     Privacy Request or the Request Task
+    :param privacy_request_id: The id of the Request Task's Privacy Request, whose cache
+    index the tracking key is added to so it's cleared along with the Privacy Request.
+    Defaults to the request_id.
     :return: None
     """
 
     cache: FidesopsRedis = get_cache()
 
     try:
-        cache.set(
-            get_async_task_tracking_cache_key(request_id),
-            celery_task_id,
+        tracking_key = get_async_task_tracking_cache_key(request_id)
+        index_key = get_privacy_request_cache_index_key(
+            privacy_request_id or request_id
         )
+        pipe = cache.pipeline()
+        pipe.set(tracking_key, celery_task_id)
+        pipe.sadd(index_key, tracking_key)
+        pipe.expire(index_key, CONFIG.redis.default_ttl_seconds)
+        pipe.execute()
     except DataError:
         logger.debug(
             "Error tracking task_id for privacy request or request task with id {}",
@@ -233,16 +306,23 @@ def cache_task_tracking_key(request_id: str, celery_task_id: str) -> None:
 
 def celery_tasks_in_flight(celery_task_ids: List[str]) -> bool:
     """Returns True if supplied Celery Tasks appear to be in-flight"""
+    return bool(get_celery_task_ids_in_flight(celery_task_ids))
+
+
+def get_celery_task_ids_in_flight(celery_task_ids: List[str]) -> Set[str]:
+    """Returns the supplied Celery Task IDs that appear to be in-flight, querying the
+    workers once for all of them"""
     if not celery_task_ids:
-        return False
+        return set()
 
     queried_tasks = celery_app.control.inspect().query_task(*celery_task_ids)
     if not queried_tasks:
-        return False
+        return set()
 
+    in_flight: Set[str] = set()
     # Expected format: {HOSTNAME: {TASK_ID: [STATE, TASK_INFO]}}
     for _, task_details in queried_tasks.items():
-        for _, state_array in task_details.items():
+        for task_id, state_array in task_details.items():
             state: str = state_array[0]
             # Note, not positive of states here,
             # some seen in testing, some from here:
@@ -257,9 +337,9 @@ def celery_tasks_in_flight(celery_task_ids: List[str]) -> bool:
                 "scheduled",
                 "started",
             ]:
-                return True
+                in_flight.add(task_id)
 
-    return False
+    return in_flight
 
 
 def get_queue_counts() -> Dict[str, int]:
@@ -0,0 +1,162 @@
+"""
+Codecs used to serialize objects, such as access results, that are stored in the Redis cache.
+
+Values written by the msgpack codec are prefixed with a version tag so they can be
+told apart from the JSON written by earlier versions of fides, which is always
+decoded with the JSON codec.
+"""
+
+import json
+import zlib
+from abc import ABC, abstractmethod
+from base64 import b64decode, b64encode
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Optional, Union
+
+import msgpack
+from bson.objectid import ObjectId
+
+from fides.api.util.custom_json_encoder import CustomJSONEncoder, _custom_decoder
+from fides.config import CONFIG
+
+JSON_CACHE_CODEC = "json"
+MSGPACK_CACHE_CODEC = "msgpack"
+
+# Version tags prefixed to msgpack encoded values. JSON documents never start with
+# these, so values written before the codec was introduced still decode.
+MSGPACK_VERSION_TAG = "mp1:"
+MSGPACK_COMPRESSED_VERSION_TAG = "mp1z:"
+
+# msgpack extension type codes. bytes don't need an extension type since msgpack
+# has a native binary type.
+DATETIME_EXT_TYPE = 1
+DATE_EXT_TYPE = 2
+MONGO_OBJECT_ID_EXT_TYPE = 3
+
+
+class CacheCodec(ABC):
+    """Serializes objects to strings that can be stored in the Redis cache and back"""
+
+    name: str
+
+    @abstractmethod
+    def encode(self, obj: Any) -> str:
+        """Encode an object to a string that can be stored in Redis"""
+
+    @abstractmethod
+    def decode(self, value: Union[str, bytes]) -> Any:
+        """Decode an object encoded by this codec"""
+
+
+class JSONCacheCodec(CacheCodec):
+    """Encodes objects as JSON using the CustomJSONEncoder"""
+
+    name = JSON_CACHE_CODEC
+
+    def encode(self, obj: Any) -> str:
+        return json.dumps(obj, cls=CustomJSONEncoder)
+
+    def decode(self, value: Union[str, bytes]) -> Any:
+        return json.loads(value, object_hook=_custom_decoder)
+
+
+class MsgpackCacheCodec(CacheCodec):
+    """
+    Encodes objects with msgpack, using extension types for datetimes, dates and
+    Mongo ObjectIds. Payloads larger than the compression threshold are compressed.
+
+    The cache connection decodes responses to strings, so the binary payload is
+    base64 encoded before being stored. Objects msgpack can't represent, such as
+    integers wider than 64 bits, are encoded as JSON instead.
+    """
+
+    name = MSGPACK_CACHE_CODEC
+
+    def __init__(self, compression_threshold_bytes: int) -> None:
+        self.compression_threshold_bytes = compression_threshold_bytes
+
+    def encode(self, obj: Any) -> str:
+        try:
+            payload: bytes = msgpack.packb(
+                obj, default=_msgpack_default, use_bin_type=True
+            )
+        except OverflowError:
+            return JSONCacheCodec().encode(obj)
+        tag = MSGPACK_VERSION_TAG
+        if len(payload) > self.compression_threshold_bytes:
+            payload = zlib.compress(payload)
+            tag = MSGPACK_COMPRESSED_VERSION_TAG
+        return tag + b64encode(payload).decode("ascii")
+
+    def decode(self, value: Union[str, bytes]) -> Any:
+        if isinstance(value, bytes):
+            value = value.decode("ascii")
+        if value.startswith(MSGPACK_COMPRESSED_VERSION_TAG):
+            payload = zlib.decompress(
+                b64decode(value[len(MSGPACK_COMPRESSED_VERSION_TAG) :])
+            )
+        else:
+            payload = b64decode(value[len(MSGPACK_VERSION_TAG) :])
+        return msgpack.unpackb(
+            payload, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False
+        )
+
+
+def _msgpack_default(o: Any) -> Any:
+    """
+    Converts types msgpack can't serialize natively, mirroring the fallbacks
+    of the CustomJSONEncoder
+    """
+    if isinstance(o, Enum):
+        return o.value
+    if isinstance(o, int):
+        # msgpack only calls the default for integers that don't fit in 64 bits
+        raise OverflowError(f"Integer {o} is too large to encode with msgpack")
+    if isinstance(o, datetime):
+        return msgpack.ExtType(DATETIME_EXT_TYPE, o.isoformat().encode("utf-8"))
+    if isinstance(o, date):
+        return msgpack.ExtType(DATE_EXT_TYPE, o.isoformat().encode("utf-8"))
+    if isinstance(o, ObjectId):
+        return msgpack.ExtType(MONGO_OBJECT_ID_EXT_TYPE, o.binary)
+    if hasattr(o, "__dict__"):
+        return o.__dict__
+    return str(o)
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    """Restores the values encoded as msgpack extension types by _msgpack_default"""
+    if code == DATETIME_EXT_TYPE:
+        return datetime.fromisoformat(data.decode("utf-8"))
+    if code == DATE_EXT_TYPE:
+        return date.fromisoformat(data.decode("utf-8"))
+    if code == MONGO_OBJECT_ID_EXT_TYPE:
+        return ObjectId(data)
+    return msgpack.ExtType(code, data)
+
+
+def is_msgpack_encoded(value: Union[str, bytes]) -> bool:
+    """Whether the cached value was written by the msgpack codec"""
+    if isinstance(value, bytes):
+        return value.startswith(
+            (MSGPACK_VERSION_TAG.encode(), MSGPACK_COMPRESSED_VERSION_TAG.encode())
+        )
+    return value.startswith((MSGPACK_VERSION_TAG, MSGPACK_COMPRESSED_VERSION_TAG))
+
+
+def decode_with_codec(value: Union[str, bytes]) -> Any:
+    """Decodes a value written by either codec, telling them apart by the msgpack version tag"""
+    if is_msgpack_encoded(value):
+        return get_cache_codec(MSGPACK_CACHE_CODEC).decode(value)
+    return JSONCacheCodec().decode(value)
+
+
+def get_cache_codec(codec_name: Optional[str] = None) -> CacheCodec:
+    """
+    Returns the codec with the given name, defaulting to the one configured by
+    CONFIG.redis.cache_codec.
+    """
+    codec_name = codec_name or CONFIG.redis.cache_codec
+    if codec_name == MSGPACK_CACHE_CODEC:
+        return MsgpackCacheCodec(CONFIG.redis.cache_compression_threshold_bytes)
+    return JSONCacheCodec()
@@ -1,5 +1,15 @@
 from functools import reduce
-from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 import immutables
 from ordered_set import OrderedSet
@@ -95,6 +105,23 @@ def partition(_iterable: Iterable[T], extractor: Callable[[T], U]) -> Dict[U, Li
     return out
 
 
+def chunks(_iterable: Iterable[T], size: int) -> Generator[List[T], None, None]:
+    """Split an iterable into consecutive lists of at most `size` elements.
+
+    list(chunks([1, 2, 3, 4, 5], 2)) => [[1, 2], [3, 4], [5]]
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be a positive integer")
+    chunk: List[T] = []
+    for t in _iterable:
+        chunk.append(t)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
 def filter_nonempty_values(d: Optional[Dict[Any, Any]]) -> Dict[Any, Any]:
     """Return the input map with empty values removed. On an input of None
     will return an empty Dict."""
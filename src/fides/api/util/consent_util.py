@@ -205,10 +205,7 @@ def get_fides_user_device_id_provided_identity(
                 ProvidedIdentity.field_name
                 == ProvidedIdentityType.fides_user_device_id.value
             )
-            & (
-                ProvidedIdentity.hashed_value
-                == ProvidedIdentity.hash_value(fides_user_device_id)
-            )
+            & ProvidedIdentity.lookup_filter(db, fides_user_device_id)
             & (ProvidedIdentity.privacy_request_id.is_(None))
         ),
     ).first()
@@ -240,6 +237,9 @@ def get_or_create_fides_user_device_id_provided_identity(
                 "hashed_value": ProvidedIdentity.hash_value(
                     identity_data.fides_user_device_id
                 ),
+                "lookup_hash": ProvidedIdentity.lookup_hash_value(
+                    identity_data.fides_user_device_id
+                ),
                 "encrypted_value": {"value": identity_data.fides_user_device_id},
             },
         )
@@ -1,5 +1,6 @@
 import secrets
-from typing import Dict, List, Optional, TypeVar
+import threading
+from typing import Any, Dict, List, Optional, TypeVar
 
 from loguru import logger
 
@@ -8,12 +9,90 @@ from fides.api.schemas.masking.masking_secrets import (
     MaskingSecretMeta,
     SecretType,
 )
-from fides.api.util.cache import get_cache, get_masking_secret_cache_key
+from fides.api.util.cache import FidesopsRedis, get_cache, get_masking_secret_cache_key
 
 T = TypeVar("T")
 
 
+class RequestMaskingSecrets:
+    """
+    In-memory copy of the masking secrets cached for a privacy request.
+
+    The secrets of a masking strategy are loaded from Redis with a single MGET the first
+    time one of them is requested, so masking many values only reads each strategy's
+    secrets once. A strategy whose secrets aren't in Redis yet is read again on its
+    next request.
+    """
+
+    def __init__(self, privacy_request_id: str) -> None:
+        self.privacy_request_id = privacy_request_id
+        self._secrets: Dict[str, Dict[SecretType, Any]] = {}
+        # The number of open TaskResources using these secrets
+        self.registrations = 0
+
+    def get_secret(
+        self, secret_type: SecretType, masking_secret_meta: MaskingSecretMeta[T]
+    ) -> Optional[T]:
+        """Returns the cached secret, loading the strategy's secrets if needed"""
+        strategy_secrets = self._secrets.get(masking_secret_meta.masking_strategy)
+        if strategy_secrets is None:
+            strategy_secrets = self._load_strategy_secrets(
+                masking_secret_meta.masking_strategy
+            )
+            if strategy_secrets:
+                self._secrets[masking_secret_meta.masking_strategy] = strategy_secrets
+        return strategy_secrets.get(secret_type)
+
+    def _load_strategy_secrets(self, masking_strategy: str) -> Dict[SecretType, Any]:
+        keys: Dict[SecretType, str] = {
+            secret_type: get_masking_secret_cache_key(
+                privacy_request_id=self.privacy_request_id,
+                masking_strategy=masking_strategy,
+                secret_type=secret_type,
+            )
+            for secret_type in SecretType
+        }
+        values = get_cache().get_values(list(keys.values()))
+        return {
+            secret_type: FidesopsRedis.decode_obj(values[key])
+            for secret_type, key in keys.items()
+            if values[key]
+        }
+
+
+# Masking secrets of the privacy requests that are being processed by this worker,
+# registered for the lifetime of their TaskResources
+_request_masking_secrets: Dict[str, RequestMaskingSecrets] = {}
+_request_masking_secrets_lock = threading.Lock()
+
+
 class SecretsUtil:
+    @staticmethod
+    def register_request_masking_secrets(privacy_request_id: str) -> None:
+        """
+        Serve the privacy request's masking secrets from memory instead of Redis. Tasks
+        of the same privacy request that run at the same time share the secrets.
+        """
+        with _request_masking_secrets_lock:
+            request_masking_secrets = _request_masking_secrets.setdefault(
+                privacy_request_id, RequestMaskingSecrets(privacy_request_id)
+            )
+            request_masking_secrets.registrations += 1
+
+    @staticmethod
+    def unregister_request_masking_secrets(privacy_request_id: str) -> None:
+        """
+        Stop serving the privacy request's masking secrets from memory once none of
+        its tasks are using them
+        """
+        with _request_masking_secrets_lock:
+            request_masking_secrets = _request_masking_secrets.get(privacy_request_id)
+            if not request_masking_secrets:
+                return
+            request_masking_secrets.registrations -= 1
+            if request_masking_secrets.registrations <= 0:
+                del _request_masking_secrets[privacy_request_id]
+
     @staticmethod
     def get_or_generate_secret(
         privacy_request_id: Optional[str],
@@ -21,9 +100,15 @@ class SecretsUtil:
         masking_secret_meta: MaskingSecretMeta[T],
     ) -> Optional[T]:
         if privacy_request_id is not None:
-            secret = SecretsUtil._get_secret_from_cache(
-                privacy_request_id, secret_type, masking_secret_meta
-            )
+            request_masking_secrets = _request_masking_secrets.get(privacy_request_id)
+            if request_masking_secrets:
+                secret = request_masking_secrets.get_secret(
+                    secret_type, masking_secret_meta
+                )
+            else:
+                secret = SecretsUtil._get_secret_from_cache(
+                    privacy_request_id, secret_type, masking_secret_meta
+                )
             if not secret:
                 logger.warning(
                     "Secret type {} expected from cache but was not present for masking strategy {}",
@@ -56,6 +56,65 @@ class ExecutionSettings(FidesSettings):
         default=30,
         description="Seconds between polling for Privacy Requests that should change state",
     )
+    sql_masking_batch_size: int = Field(
+        default=500,
+        gt=0,
+        description="The maximum number of rows masked per batched UPDATE when running erasures against SQL datastores.",
+    )
+    sql_in_clause_chunk_size: int = Field(
+        default=1000,
+        gt=0,
+        description="The maximum number of input values matched by a single SQL retrieval query. Larger inputs are split across multiple queries, or matched with an array parameter on PostgreSQL.",
+    )
+    sql_retrieval_chunk_size: int = Field(
+        default=1000,
+        gt=0,
+        description="The number of rows fetched at a time from SQL datastores when streaming access request results.",
+    )
+    mongo_masking_batch_size: int = Field(
+        default=500,
+        gt=0,
+        description="The maximum number of document updates sent in each unordered bulk write when running erasures against MongoDB.",
+    )
+    mongo_retrieval_batch_size: int = Field(
+        default=1000,
+        gt=0,
+        description="The number of documents fetched per round trip from MongoDB when retrieving access request results.",
+    )
+    sql_engine_reuse: bool = Field(
+        default=True,
+        description="Whether SQL connectors reuse the engines, and their pooled connections, of earlier Request Tasks run in the same worker process for the same connection config.",
+    )
+    sql_engine_pool_size: int = Field(
+        default=5,
+        gt=0,
+        description="The number of connections kept open by each SQL connector's connection pool.",
+    )
+    sql_engine_max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="The number of connections each SQL connector's connection pool can open beyond sql_engine_pool_size.",
+    )
+    sql_engine_idle_timeout: int = Field(
+        default=300,
+        gt=0,
+        description="Seconds after which a reused SQL engine that hasn't been used is disposed of, closing its pooled connections.",
+    )
+    request_task_data_chunk_size: int = Field(
+        default=1000,
+        gt=0,
+        description="The maximum number of rows stored in each encrypted, compressed chunk of a DSR 3.0 request task's access and erasure data.",
+    )
+    request_task_results_decode_workers: int = Field(
+        default=4,
+        gt=0,
+        description="The maximum number of threads used to decrypt and decode the access results of a DSR 3.0 privacy request's request tasks before they are uploaded.",
+    )
+    saas_max_concurrent_requests: int = Field(
+        default=1,
+        gt=0,
+        description="The maximum number of independent read requests sent concurrently for a single SaaS collection. Pagination for a given request is always followed in order. Can be overridden per connector with the max_concurrent_requests field of the SaaS config.",
+    )
     use_dsr_3_0: bool = Field(
         default=False,
         description="Temporary flag to switch to using DSR 3.0 to process your tasks.",
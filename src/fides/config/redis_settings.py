@@ -11,6 +11,15 @@ ENV_PREFIX = "FIDES__REDIS__"
 class RedisSettings(FidesSettings):
     """Configuration settings for Redis."""
 
+    cache_codec: str = Field(
+        default="msgpack",
+        description="The format used to serialize objects such as access results in the cache. Accepts 'msgpack' or 'json'. Values written in either format can always be read back.",
+    )
+    cache_compression_threshold_bytes: int = Field(
+        default=1024,
+        description="Objects cached with the 'msgpack' cache codec are compressed when their serialized size exceeds this number of bytes.",
+        ge=0,
+    )
     charset: str = Field(
         default="utf8",
         description="Character set to use for Redis, defaults to 'utf8'. Not recommended to change.",
@@ -70,6 +79,18 @@ class RedisSettings(FidesSettings):
         exclude=True,
     )
 
+    @validator("cache_codec", pre=True)
+    @classmethod
+    def validate_cache_codec(cls, value: str) -> str:
+        """Ensure the provided cache codec is supported"""
+        value = value.lower()
+        valid_values = ["msgpack", "json"]
+        if value not in valid_values:
+            raise ValueError(
+                f"Invalid cache_codec provided '{value}', must be one of: {', '.join(valid_values)}"
+            )
+        return value
+
     @validator("connection_url", pre=True)
     @classmethod
     def assemble_connection_url(
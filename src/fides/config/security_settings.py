@@ -50,6 +50,10 @@ class SecuritySettings(FidesSettings):
         default="dev",
         description="The default, `dev`, does not apply authentication to endpoints typically used by the CLI. The other option, `prod`, requires authentication for _all_ endpoints that may contain sensitive information.",
     )
+    identity_lookup_hash_key: Optional[str] = Field(
+        default=None,
+        description="The secret key used to compute the keyed HMAC-SHA256 lookup hashes of provided identities. Defaults to a key derived from app_encryption_key. Changing it requires the lookup hashes of existing identities to be recomputed.",
+    )
     identity_verification_attempt_limit: int = Field(
         default=3,
         description="The number of times identity verification will be attempted before raising an error.",
@@ -4,6 +4,7 @@ from functools import update_wrapper
 from typing import Any, Callable, Dict, List, Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from fideslang.models import (
     Dataset,
@@ -12,6 +13,7 @@ from fideslang.models import (
     System,
     SystemMetadata,
 )
+from joblib import Parallel, delayed
 from loguru import logger
 
 from fides.connectors.models import (
@@ -21,15 +23,26 @@ from fides.connectors.models import (
 )
 from fides.core.utils import generate_unique_fides_key
 
+# Throttled requests are retried with client-side rate limiting, which slows the
+# client down as AWS throttles it
+AWS_CLIENT_CONFIG = Config(retries={"max_attempts": 10, "mode": "adaptive"})
+
+# The number of DynamoDB tables described and sampled at a time
+DYNAMODB_DISCOVERY_THREADS = 8
+
 
 def get_aws_client(service: str, aws_config: Optional[AWSConfig]) -> Any:
     """
     Creates boto3 client for a given service. A config is optional
     to allow for environment variable configuration.
+
+    Clients are created from their own session, since the default boto3 session
+    isn't thread-safe. The clients themselves can be shared across threads.
     """
     config_dict = aws_config.dict() if aws_config else {}
-    service_client = boto3.client(
+    service_client = boto3.session.Session().client(
         service,
+        config=AWS_CLIENT_CONFIG,
         **config_dict,
     )  # type: ignore
     return service_client
@@ -74,40 +87,50 @@ def validate_credentials(aws_config: Optional[AWSConfig]) -> None:
 @handle_common_aws_errors
 def describe_redshift_clusters(client: Any) -> Dict[str, List[Dict]]:  # type: ignore
     """
-    Returns describe_clusters response given a 'redshift' boto3 client.
+    Returns describe_clusters response given a 'redshift' boto3 client,
+    with the clusters of every page.
     """
-    describe_clusters = client.describe_clusters()
+    paginator = client.get_paginator("describe_clusters")
+    describe_clusters = paginator.paginate().build_full_result()
     return describe_clusters
 
 
 @handle_common_aws_errors
 def describe_rds_clusters(client: Any) -> Dict[str, List[Dict]]:  # type: ignore
     """
-    Returns describe_db_clusters response given a rds boto3 client.
+    Returns describe_db_clusters response given a rds boto3 client,
+    with the clusters of every page.
     """
-    describe_clusters = client.describe_db_clusters()
+    paginator = client.get_paginator("describe_db_clusters")
+    describe_clusters = paginator.paginate().build_full_result()
     return describe_clusters
 
 
 @handle_common_aws_errors
 def describe_rds_instances(client: Any) -> Dict[str, List[Dict]]:  # type: ignore
     """
-    Returns describe_db_instances response given a 'rds' boto3 client.
+    Returns describe_db_instances response given a 'rds' boto3 client,
+    with the instances of every page.
     """
-    describe_instances = client.describe_db_instances()
+    paginator = client.get_paginator("describe_db_instances")
+    describe_instances = paginator.paginate().build_full_result()
     return describe_instances
 
 
 @handle_common_aws_errors
 def describe_dynamo_tables(client: Any, table_names: List[str]) -> List[Dict]:  # type: ignore
     """
-    Returns describe_table response given a 'dynamodb' boto3 client.
+    Returns describe_table responses given a 'dynamodb' boto3 client,
+    describing and sampling up to DYNAMODB_DISCOVERY_THREADS tables at a time.
     """
-    describe_tables = []
-    for table_name in table_names:
-        described_table = describe_dynamo_table(client, table_name)
-        if isinstance(described_table, dict):
-            describe_tables.append(described_table)
+    described_tables = Parallel(n_jobs=DYNAMODB_DISCOVERY_THREADS, backend="threading")(
+        delayed(describe_dynamo_table)(client, table_name) for table_name in table_names
+    )
+    describe_tables = [
+        described_table
+        for described_table in described_tables
+        if isinstance(described_table, dict)
+    ]
 
     return describe_tables
 
@@ -126,18 +149,12 @@ def describe_dynamo_table(client: Any, table_name: str) -> Dict:  # type: ignore
 @handle_common_aws_errors
 def get_dynamo_tables(client: Any) -> List[str]:  # type: ignore
     """
-    Returns a list of table names response given a 'rds' boto3 client.
+    Returns a list of table names response given a 'dynamodb' boto3 client.
     """
-    list_tables = client.list_tables()
-    table_names = list_tables["TableNames"]
-    next_page_exists = "LastEvaluatedTableName" in list_tables
-    while next_page_exists:
-        last_evaluated_table_name = list_tables["LastEvaluatedTableName"]
-        list_tables = client.list_tables(
-            ExclusiveStartTableName=last_evaluated_table_name
-        )
-        table_names.extend(list_tables["TableNames"])
-        next_page_exists = "LastEvaluatedTableName" in list_tables
+    paginator = client.get_paginator("list_tables")
+    table_names = [
+        table_name for page in paginator.paginate() for table_name in page["TableNames"]
+    ]
     return table_names
 
 
@@ -1,6 +1,6 @@
 """Module that adds functionality for generating or scanning datasets."""
 
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import sqlalchemy
 from fideslang import manifests
@@ -22,7 +22,12 @@ from fides.connectors.bigquery import get_bigquery_engine
 from fides.connectors.models import AWSConfig, BigQueryConfig
 from fides.core.api_helpers import list_server_resources
 from fides.core.parse import parse
-from fides.core.utils import check_fides_key, generate_unique_fides_key, get_db_engine
+from fides.core.utils import (
+    check_fides_key,
+    generate_unique_fides_key,
+    get_all_level_field_paths,
+    get_db_engine,
+)
 
 SCHEMA_EXCLUSION = {
     "postgresql": ["information_schema"],
@@ -32,6 +37,43 @@ SCHEMA_EXCLUSION = {
     "redshift": ["information_schema"],
 }
 
+# Only base tables are included, matching the tables returned by the sqlalchemy inspector
+INFORMATION_SCHEMA_COLUMNS_QUERY = """
+SELECT c.TABLE_NAME, c.COLUMN_NAME
+FROM INFORMATION_SCHEMA.COLUMNS c
+JOIN INFORMATION_SCHEMA.TABLES t
+    ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
+WHERE c.TABLE_SCHEMA = :schema_name AND t.TABLE_TYPE = 'BASE TABLE'
+ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+"""
+
+# information_schema only lists the columns the role has privileges on in Postgres and
+# Redshift, so their columns are read from pg_catalog, as the sqlalchemy inspector does.
+# Ordinary and partitioned tables are included, matching the inspector's table names.
+PG_CATALOG_COLUMNS_QUERY = """
+SELECT c.relname, a.attname
+FROM pg_catalog.pg_attribute a
+JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname = :schema_name
+    AND c.relkind IN ('r', 'p')
+    AND a.attnum > 0
+    AND NOT a.attisdropped
+ORDER BY c.relname, a.attnum
+"""
+
+# The query reading the columns of a schema in each database that supports one
+SCHEMA_COLUMNS_QUERIES = {
+    "postgresql": PG_CATALOG_COLUMNS_QUERY,
+    "redshift": PG_CATALOG_COLUMNS_QUERY,
+    "mysql": INFORMATION_SCHEMA_COLUMNS_QUERY,
+    "mssql": INFORMATION_SCHEMA_COLUMNS_QUERY,
+    "snowflake": INFORMATION_SCHEMA_COLUMNS_QUERY,
+}
+
+# The number of schemas introspected at a time
+SCHEMA_INTROSPECTION_THREADS = 4
+
 
 def get_all_server_datasets(
     url: AnyHttpUrl, headers: Dict[str, str], exclude_datasets: List[Dataset]
@@ -71,20 +113,71 @@ def get_db_schemas(
     """
     Extract the schema, table and column names from a database given a sqlalchemy engine
     """
-    if engine.dialect.name != "snowflake":
-        inspector = sqlalchemy.inspect(engine)
-        db_schemas: Dict[str, Dict[str, List]] = {}
-        for schema in inspector.get_schema_names():
-            if include_dataset_schema(schema=schema, database_type=engine.dialect.name):
-                db_schemas[schema] = {}
-                for table in inspector.get_table_names(schema=schema):
-                    db_schemas[schema][table] = [
-                        column["name"]
-                        for column in inspector.get_columns(table, schema=schema)
-                    ]
-    else:
-        db_schemas = get_snowflake_schemas(engine=engine)
-    return db_schemas
+    if engine.dialect.name == "snowflake":
+        return get_snowflake_schemas(engine=engine)
+
+    inspector = sqlalchemy.inspect(engine)
+    db_schemas = [
+        schema
+        for schema in inspector.get_schema_names()
+        if include_dataset_schema(schema=schema, database_type=engine.dialect.name)
+    ]
+    if engine.dialect.name in SCHEMA_COLUMNS_QUERIES:
+        return get_schemas_in_parallel(
+            engine=engine,
+            db_schemas=db_schemas,
+            get_schema_tables=get_catalog_schema_tables,
+        )
+    return get_schemas_in_parallel(
+        engine=engine,
+        db_schemas=db_schemas,
+        get_schema_tables=get_inspector_schema_tables,
+    )
+
+
+def get_schemas_in_parallel(
+    engine: Engine,
+    db_schemas: List[str],
+    get_schema_tables: Callable[[Engine, str], Dict[str, List[str]]],
+) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Returns the tables and columns of each schema, introspecting up to
+    SCHEMA_INTROSPECTION_THREADS schemas at a time.
+    """
+    schema_tables = Parallel(n_jobs=SCHEMA_INTROSPECTION_THREADS, backend="threading")(
+        delayed(get_schema_tables)(engine, schema) for schema in db_schemas
+    )
+    return dict(zip(db_schemas, schema_tables))
+
+
+def get_catalog_schema_tables(engine: Engine, schema: str) -> Dict[str, List[str]]:
+    """
+    Returns the column names of each table in a schema, read from the database's
+    catalog in a single query rather than a query per table.
+    Column names keep the casing they were defined with.
+    """
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text(SCHEMA_COLUMNS_QUERIES[engine.dialect.name]), {"schema_name": schema}
+        )
+        db_tables: Dict[str, List[str]] = {}
+        for table_name, column_name in rows:
+            db_tables.setdefault(table_name, []).append(column_name)
+    return db_tables
+
+
+def get_inspector_schema_tables(engine: Engine, schema: str) -> Dict[str, List[str]]:
+    """
+    Returns the column names of each table in a schema using the sqlalchemy
+    inspector, for databases without a catalog query to read from.
+    """
+    inspector = sqlalchemy.inspect(engine)
+    return {
+        table: [
+            column["name"] for column in inspector.get_columns(table, schema=schema)
+        ]
+        for table in inspector.get_table_names(schema=schema)
+    }
 
 
 def create_db_datasets(db_schemas: Dict[str, Dict[str, List[str]]]) -> List[Dataset]:
@@ -147,6 +240,23 @@ def make_dataset_key_unique(
     return dataset
 
 
+def get_categorized_field_paths(dataset: Dataset) -> Dict[str, Set[str]]:
+    """
+    Returns the paths of the categorized fields in each collection of a dataset,
+    keyed by collection name. Only the first collection with a given name is used.
+    """
+    categorized_field_paths: Dict[str, Set[str]] = {}
+    for collection in dataset.collections:
+        if collection.name in categorized_field_paths:
+            continue
+        categorized_field_paths[collection.name] = {
+            field_path
+            for field_path, field in get_all_level_field_paths(collection.fields)
+            if field.data_categories
+        }
+    return categorized_field_paths
+
+
 def find_uncategorized_dataset_fields(
     existing_dataset: Optional[Dataset], source_dataset: Dataset
 ) -> Tuple[List[str], int]:
@@ -157,36 +267,24 @@ def find_uncategorized_dataset_fields(
     """
     uncategorized_fields = []
     total_field_count = 0
+    categorized_field_paths = (
+        get_categorized_field_paths(existing_dataset) if existing_dataset else {}
+    )
 
     for source_dataset_collection in source_dataset.collections:
-        existing_dataset_collection = (
-            next(
-                (
-                    existing_dataset_collection
-                    for existing_dataset_collection in existing_dataset.collections
-                    if existing_dataset_collection.name
-                    == source_dataset_collection.name
-                ),
-                None,
-            )
-            if existing_dataset
-            else None
+        existing_collection_field_paths = categorized_field_paths.get(
+            source_dataset_collection.name, set()
         )
-
-        for db_dataset_field in source_dataset_collection.fields:
+        for field_path, field in get_all_level_field_paths(
+            source_dataset_collection.fields
+        ):
+            # Object fields are categorized through their sub-fields
+            if field.fields:
+                continue
             total_field_count += 1
-            field_uncategorized = (
-                all(
-                    field.name != db_dataset_field.name or not field.data_categories
-                    for field in existing_dataset_collection.fields
-                )
-                if existing_dataset_collection
-                else True
-            )
-
-            if field_uncategorized:
+            if field_path not in existing_collection_field_paths:
                 uncategorized_fields.append(
-                    f"{source_dataset.name}.{source_dataset_collection.name}.{db_dataset_field.name}"
+                    f"{source_dataset.name}.{source_dataset_collection.name}.{field_path}"
                 )
     return uncategorized_fields, total_field_count
 
@@ -200,21 +298,19 @@ def find_all_uncategorized_dataset_fields(
     """
     uncategorized_fields = []
     total_field_count = 0
-    for source_dataset in source_datasets:
-        existing_dataset = next(
-            (
-                existing_dataset
-                for existing_dataset in existing_datasets
-                if existing_dataset.name == source_dataset.name
-            ),
-            None,
-        )
 
+    # The first existing dataset with a given name is compared against
+    existing_datasets_by_name: Dict[Optional[str], Dataset] = {}
+    for existing_dataset in existing_datasets:
+        existing_datasets_by_name.setdefault(existing_dataset.name, existing_dataset)
+
+    for source_dataset in source_datasets:
         (
             current_uncategorized_keys,
             current_field_count,
         ) = find_uncategorized_dataset_fields(
-            existing_dataset=existing_dataset, source_dataset=source_dataset
+            existing_dataset=existing_datasets_by_name.get(source_dataset.name),
+            source_dataset=source_dataset,
         )
         total_field_count += current_field_count
         uncategorized_fields += current_uncategorized_keys
@@ -407,35 +503,18 @@ def get_snowflake_schemas(
 
     Reference: https://github.com/snowflakedb/snowflake-sqlalchemy/issues/157
 
-    Due to performance issues resulting in FastAPI timeouts, parallelization is
-    now used. The default number of threads to be used is 4 to cover most existing
-    use cases, bumping to 8 when the number of tables is over 250.
+    Due to performance issues resulting in FastAPI timeouts, the columns of each
+    schema are read from information_schema in a single query, and schemas are
+    introspected in parallel.
     """
     schema_cursor = engine.execute(text("SHOW SCHEMAS"))
-    db_schemas = [row[1] for row in schema_cursor]
-    metadata: Dict[str, Dict[str, List]] = {}
-    for schema in db_schemas:
-        if include_dataset_schema(schema=schema, database_type=engine.dialect.name):
-            metadata[schema] = {}
-            table_cursor = engine.execute(text(f'SHOW TABLES IN "{schema}"'))
-            db_tables = [row[1] for row in table_cursor]
-            number_of_threads = 8 if len(db_tables) > 250 else 4
-            fields = Parallel(n_jobs=number_of_threads, backend="threading")(
-                delayed(get_snowflake_table_fields)(engine, schema, table)
-                for table in db_tables
-            )
-            for table, columns in fields:
-                metadata[schema][table] = columns
-    return metadata
-
-
-def get_snowflake_table_fields(
-    engine: Engine, schema: str, table: str
-) -> Tuple[str, List]:
-    """
-    Returns fields for a Snowflake table, ideally in parallel. Part of the
-    workaround strategy to improve performance when generating a Snowflake schema
-    """
-    column_cursor = engine.execute(text(f'SHOW COLUMNS IN "{schema}"."{table}"'))
-    columns = [row[2] for row in column_cursor]
-    return table, columns
+    db_schemas = [
+        row[1]
+        for row in schema_cursor
+        if include_dataset_schema(schema=row[1], database_type=engine.dialect.name)
+    ]
+    return get_schemas_in_parallel(
+        engine=engine,
+        db_schemas=db_schemas,
+        get_schema_tables=get_catalog_schema_tables,
+    )
@@ -7,6 +7,7 @@ from fideslang.default_taxonomy import DEFAULT_TAXONOMY
 from fideslang.models import (
     Dataset,
     Evaluation,
+    FidesModel,
     MatchesEnum,
     Policy,
     PolicyRule,
@@ -18,7 +19,6 @@ from fideslang.models import (
     ViolationAttributes,
 )
 from fideslang.relationships import get_referenced_missing_keys
-from fideslang.utils import get_resource_by_fides_key
 from fideslang.validation import FidesKey
 from pydantic import AnyHttpUrl
 
@@ -106,34 +106,77 @@ def validate_policies_exist(policies: List[Policy], evaluate_fides_key: str) ->
         raise SystemExit(1)
 
 
+class TaxonomyIndex:
+    """
+    Lookups into a taxonomy by fides_key, built once per evaluation.
+
+    Resolving a fides_key by scanning the taxonomy is linear in its size, and
+    an evaluation resolves the same data categories, uses and subjects for every
+    policy rule, system and declaration. The index maps each fides_key to its
+    resource up front and memoizes the parent hierarchy of each key it resolves.
+    """
+
+    def __init__(self, taxonomy: Taxonomy) -> None:
+        self.taxonomy = taxonomy
+        # Mirrors get_resource_by_fides_key, where the last matching resource wins
+        self.resources: Dict[str, FidesModel] = {}
+        for resource_type in taxonomy.__fields_set__:
+            for resource in getattr(taxonomy, resource_type) or []:
+                self.resources[resource.fides_key] = resource
+
+        self.datasets: Dict[str, Dataset] = {}
+        for dataset in getattr(taxonomy, "dataset") or []:
+            self.datasets.setdefault(dataset.fides_key, dataset)
+
+        self._parent_hierarchies: Dict[str, List[FidesKey]] = {}
+
+    def get_parent_hierarchy(self, fides_key: str) -> List[FidesKey]:
+        """
+        Returns the hierarchy of parents for a given fides key, starting
+        with the given fides key.
+        """
+        if fides_key in self._parent_hierarchies:
+            return self._parent_hierarchies[fides_key]
+
+        current_key = fides_key
+        fides_key_parent_hierarchy = []
+        while True:
+            fides_key_parent_hierarchy.append(FidesKey(current_key))
+            found_resource = self.resources.get(current_key)
+            if not found_resource:
+                echo_red(
+                    "Found missing key ({}) referenced in taxonomy".format(current_key)
+                )
+                raise SystemExit(1)
+            if "parent_key" not in found_resource.__fields_set__:
+                break
+            current_key = getattr(found_resource, "parent_key")
+            if not current_key:
+                break
+            if current_key in self._parent_hierarchies:
+                fides_key_parent_hierarchy += self._parent_hierarchies[current_key]
+                break
+
+        self._parent_hierarchies[fides_key] = fides_key_parent_hierarchy
+        return fides_key_parent_hierarchy
+
+    def get_dataset(self, fides_key: str) -> Optional[Dataset]:
+        """
+        Returns a dataset within the taxonomy for a given fides key
+        """
+        return self.datasets.get(fides_key)
+
+
 def get_fides_key_parent_hierarchy(
     taxonomy: Taxonomy, fides_key: str
 ) -> List[FidesKey]:
     """
     Traverses a hierarchy of parents for a given fides key and returns
     the hierarchy starting with the given fides key.
+
+    Use a TaxonomyIndex when resolving more than a few keys from the same taxonomy.
     """
-    current_key = fides_key
-    fides_key_parent_hierarchy = []
-    while True:
-        fides_key_parent_hierarchy.append(FidesKey(current_key))
-        found_resource_map = get_resource_by_fides_key(
-            taxonomy=taxonomy, fides_key=current_key
-        )
-        if found_resource_map:
-            found_resource = list(found_resource_map.values())[-1]
-            if found_resource and "parent_key" in found_resource.__fields_set__:
-                current_key = getattr(found_resource, "parent_key")
-                if not current_key:
-                    break
-            else:
-                break
-        else:
-            echo_red(
-                "Found missing key ({}) referenced in taxonomy".format(current_key)
-            )
-            raise SystemExit(1)
-    return fides_key_parent_hierarchy
+    return TaxonomyIndex(taxonomy).get_parent_hierarchy(fides_key)
 
 
 def compare_rule_to_declaration(
@@ -147,11 +190,12 @@ def compare_rule_to_declaration(
     field to determine whether the rule is triggered or not. Returns the offending
     keys, prioritizing the first descendant in the hierarchy.
     """
+    rule_type_set = set(rule_types)
     matched_declaration_types = set()
     mismatched_declaration_types = set()
     for declaration_type_hierarchy in declaration_type_hierarchies:
         declared_declaration_type = declaration_type_hierarchy[0]
-        if len(set(declaration_type_hierarchy).intersection(set(rule_types))) > 0:
+        if not rule_type_set.isdisjoint(declaration_type_hierarchy):
             matched_declaration_types.add(declared_declaration_type)
         else:
             mismatched_declaration_types.add(declared_declaration_type)
@@ -179,7 +223,7 @@ def compare_rule_to_declaration(
 
 
 def evaluate_policy_rule(
-    taxonomy: Taxonomy,
+    taxonomy_index: TaxonomyIndex,
     policy_rule: PolicyRule,
     data_subjects: List[str],
     data_categories: List[str],
@@ -192,9 +236,7 @@ def evaluate_policy_rule(
     policy rule
     """
     category_hierarchies = [
-        get_fides_key_parent_hierarchy(
-            taxonomy=taxonomy, fides_key=declaration_category
-        )
+        taxonomy_index.get_parent_hierarchy(declaration_category)
         for declaration_category in data_categories
     ]
     data_category_violations = compare_rule_to_declaration(
@@ -204,9 +246,7 @@ def evaluate_policy_rule(
     )
 
     # A declaration only has one data use, so its hierarchy gets put in a list
-    data_use_hierarchies = [
-        get_fides_key_parent_hierarchy(taxonomy=taxonomy, fides_key=data_use)
-    ]
+    data_use_hierarchies = [taxonomy_index.get_parent_hierarchy(data_use)]
     data_use_violations = compare_rule_to_declaration(
         rule_types=policy_rule.data_uses.values,
         declaration_type_hierarchies=data_use_hierarchies,
@@ -265,7 +305,7 @@ def get_dataset_by_fides_key(taxonomy: Taxonomy, fides_key: str) -> Optional[Dat
 
 
 def evaluate_dataset_reference(
-    taxonomy: Taxonomy,
+    taxonomy_index: TaxonomyIndex,
     policy: Policy,
     system: System,
     policy_rule: PolicyRule,
@@ -287,7 +327,7 @@ def evaluate_dataset_reference(
         )
 
         dataset_result_violations = evaluate_policy_rule(
-            taxonomy=taxonomy,
+            taxonomy_index=taxonomy_index,
             policy_rule=policy_rule,
             data_subjects=[str(x) for x in privacy_declaration.data_subjects],
             data_categories=[str(x) for x in dataset.data_categories],
@@ -308,7 +348,7 @@ def evaluate_dataset_reference(
 
         if collection.data_categories:
             dataset_collection_result_violations = evaluate_policy_rule(
-                taxonomy=taxonomy,
+                taxonomy_index=taxonomy_index,
                 policy_rule=policy_rule,
                 data_subjects=[str(x) for x in privacy_declaration.data_subjects],
                 data_categories=[str(x) for x in collection.data_categories],
@@ -329,7 +369,7 @@ def evaluate_dataset_reference(
 
             if field.data_categories:
                 field_result_violations = evaluate_policy_rule(
-                    taxonomy=taxonomy,
+                    taxonomy_index=taxonomy_index,
                     policy_rule=policy_rule,
                     data_subjects=[str(x) for x in privacy_declaration.data_subjects],
                     data_categories=[str(x) for x in field.data_categories],
@@ -343,7 +383,7 @@ def evaluate_dataset_reference(
 
 
 def evaluate_privacy_declaration(
-    taxonomy: Taxonomy,
+    taxonomy_index: TaxonomyIndex,
     policy: Policy,
     system: System,
     policy_rule: PolicyRule,
@@ -365,7 +405,7 @@ def evaluate_privacy_declaration(
     )
 
     declaration_result_violations = evaluate_policy_rule(
-        taxonomy=taxonomy,
+        taxonomy_index=taxonomy_index,
         policy_rule=policy_rule,
         data_subjects=[str(x) for x in privacy_declaration.data_subjects],
         data_categories=[str(x) for x in privacy_declaration.data_categories],
@@ -376,12 +416,10 @@ def evaluate_privacy_declaration(
     evaluation_violation_list += declaration_result_violations
 
     for dataset_reference in privacy_declaration.dataset_references or []:
-        dataset = get_dataset_by_fides_key(
-            taxonomy=taxonomy, fides_key=dataset_reference
-        )
+        dataset = taxonomy_index.get_dataset(dataset_reference)
         if dataset:
             evaluation_violation_list += evaluate_dataset_reference(
-                taxonomy=taxonomy,
+                taxonomy_index=taxonomy_index,
                 policy=policy,
                 system=system,
                 policy_rule=policy_rule,
@@ -406,12 +444,13 @@ def execute_evaluation(taxonomy: Taxonomy) -> Evaluation:
     evaluation_violation_list = []
     taxonomy.policy = getattr(taxonomy, "policy") or []
     taxonomy.system = getattr(taxonomy, "system") or []
+    taxonomy_index = TaxonomyIndex(taxonomy)
     for policy in taxonomy.policy:
         for rule in policy.rules:
             for system in taxonomy.system:
                 for declaration in system.privacy_declarations:
                     evaluation_violation_list += evaluate_privacy_declaration(
-                        taxonomy=taxonomy,
+                        taxonomy_index=taxonomy_index,
                         policy=policy,
                         system=system,
                         policy_rule=rule,
@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 
 from fideslang import manifests
 from fideslang.models import Organization, System
+from joblib import Parallel, delayed
 from pydantic import AnyHttpUrl
 
 from fides.common.utils import echo_green, echo_red, handle_cli_response
@@ -121,10 +122,15 @@ def generate_aws_systems(
         generate_resource_tagging_systems,
     ]
 
-    aws_systems = [
-        found_system
+    # Each AWS service is discovered concurrently
+    generated_systems = Parallel(
+        n_jobs=len(generate_system_functions), backend="threading"
+    )(
+        delayed(generate_function)(organization.fides_key, aws_config)
         for generate_function in generate_system_functions
-        for found_system in generate_function(organization.fides_key, aws_config)
+    )
+    aws_systems = [
+        found_system for systems in generated_systems for found_system in systems
     ]
 
     filtered_aws_systems = filter_aws_systems(
@@ -4,7 +4,7 @@ from hashlib import sha1
 from os import getenv
 from os.path import isfile
 from pathlib import Path
-from typing import Any, Dict, Iterator, List
+from typing import Any, Dict, Iterator, List, Tuple
 
 import sqlalchemy
 import toml
@@ -79,16 +79,26 @@ def get_all_level_fields(fields: list) -> Iterator[DatasetField]:
     Traverses all levels of fields that exist in a dataset
     returning them for individual evaluation.
     """
-    for field in fields:
+    for _, field in get_all_level_field_paths(fields):
         yield field
+
+
+def get_all_level_field_paths(
+    fields: list, parent_path: str = ""
+) -> Iterator[Tuple[str, DatasetField]]:
+    """
+    Traverses all levels of fields that exist in a dataset, returning
+    each field along with its dot-separated path from the top level.
+    """
+    for field in fields:
         if isinstance(field, dict):
-            if field["fields"]:
-                for nested_field in get_all_level_fields(field["fields"]):
-                    yield nested_field
+            name, nested_fields = field["name"], field["fields"]
         else:
-            if field.fields:
-                for nested_field in get_all_level_fields(field.fields):
-                    yield nested_field
+            name, nested_fields = field.name, field.fields
+        field_path = f"{parent_path}.{name}" if parent_path else name
+        yield field_path, field
+        if nested_fields:
+            yield from get_all_level_field_paths(nested_fields, field_path)
 
 
 def get_manifest_list(manifests_dir: str) -> List[str]:
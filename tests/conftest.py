@@ -38,6 +38,7 @@ from fides.api.models.sql_models import Cookies, DataUse, PrivacyDeclaration
 from fides.api.oauth.jwt import generate_jwe
 from fides.api.oauth.roles import APPROVER, CONTRIBUTOR, OWNER, VIEWER_AND_APPROVER
 from fides.api.schemas.messaging.messaging import MessagingServiceType
+from fides.api.service.connectors.sql_engine_registry import sql_engine_registry
 from fides.api.task.graph_runners import access_runner, consent_runner, erasure_runner
 from fides.api.tasks import celery_app
 from fides.api.util.cache import get_cache
@@ -336,6 +337,14 @@ def clear_get_config_cache() -> None:
     get_config.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_sql_engine_registry():
+    """Disposes of the SQL engines registered during a test, so that each test
+    connects with the engine it creates or patches in"""
+    yield
+    sql_engine_registry.clear()
+
+
 @pytest.fixture(scope="session")
 def test_config_path():
     yield TEST_CONFIG_PATH
@@ -1,8 +1,10 @@
 # pylint: disable=missing-docstring, redefined-outer-name
 import os
-from typing import Generator
+from typing import Dict, Generator
+from unittest.mock import MagicMock
 
 import pytest
+from botocore.exceptions import ClientError
 from fideslang.models import System, SystemMetadata
 from py._path.local import LocalPath
 
@@ -188,6 +190,52 @@ def test_transform_rds_systems(
     assert actual_result == rds_systems
 
 
+@pytest.mark.unit
+def test_get_aws_client_retries_adaptively() -> None:
+    client = aws_connector.get_aws_client(
+        service="dynamodb",
+        aws_config=AWSConfig(
+            region_name="us-east-1",
+            aws_access_key_id="test_access_key",
+            aws_secret_access_key="test_secret_key",
+        ),
+    )
+    assert client.meta.config.retries["mode"] == "adaptive"
+
+
+@pytest.mark.unit
+def test_get_dynamo_tables_paginates() -> None:
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"TableNames": ["table_1", "table_2"], "LastEvaluatedTableName": "table_2"},
+        {"TableNames": ["table_3"]},
+    ]
+    actual_result = aws_connector.get_dynamo_tables(client)
+    client.get_paginator.assert_called_once_with("list_tables")
+    assert actual_result == ["table_1", "table_2", "table_3"]
+
+
+@pytest.mark.unit
+def test_describe_dynamo_tables() -> None:
+    client = MagicMock()
+
+    def describe_table(TableName: str) -> Dict:
+        if TableName == "denied_table":
+            raise ClientError(
+                {"Error": {"Code": "AccessDeniedException", "Message": "Denied"}},
+                "DescribeTable",
+            )
+        return {"Table": {"TableName": TableName}}
+
+    client.describe_table.side_effect = describe_table
+    client.scan.return_value = {"Items": [{"id": {"S": "1"}}]}
+    table_names = [f"table_{i}" for i in range(20)] + ["denied_table"]
+
+    actual_result = aws_connector.describe_dynamo_tables(client, table_names)
+    assert [table["TableName"] for table in actual_result] == table_names[:-1]
+    assert all(table["Fields"] == ["id"] for table in actual_result)
+
+
 # Integration
 @pytest.mark.external
 def test_describe_redshift_clusters(
@@ -541,6 +541,32 @@ def test_get_fides_key_parent_hierarchy_missing_parent() -> None:
         )
 
 
+@pytest.mark.unit
+def test_taxonomy_index_memoizes_parent_hierarchies(
+    evaluation_hierarchical_key_basic_taxonomy: Taxonomy,
+) -> None:
+    taxonomy_index = evaluate.TaxonomyIndex(evaluation_hierarchical_key_basic_taxonomy)
+    result = taxonomy_index.get_parent_hierarchy("data_category.parent.child")
+    assert result == [
+        "data_category.parent.child",
+        "data_category.parent",
+        "data_category",
+    ]
+    assert taxonomy_index.get_parent_hierarchy("data_category.parent.child") is result
+    assert taxonomy_index.get_parent_hierarchy("data_category.parent") == [
+        "data_category.parent",
+        "data_category",
+    ]
+
+
+@pytest.mark.unit
+def test_taxonomy_index_get_dataset() -> None:
+    dataset = Dataset(fides_key="dataset_1", collections=[])
+    taxonomy_index = evaluate.TaxonomyIndex(Taxonomy(dataset=[dataset]))
+    assert taxonomy_index.get_dataset("dataset_1") == dataset
+    assert taxonomy_index.get_dataset("dataset_2") is None
+
+
 @pytest.mark.unit
 def test_failed_evaluation_error_message(
     test_config: FidesConfig, capsys: pytest.CaptureFixture
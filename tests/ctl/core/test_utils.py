@@ -62,6 +62,29 @@ def test_nested_fields_unpacked(
     assert len(collected_field_names) == 5
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("as_dict", [True, False])
+def test_nested_field_paths_unpacked(
+    test_nested_collection_fields: DatasetCollection, as_dict: bool
+) -> None:
+    """
+    Tests unpacking fields from a data collection returns the
+    dot-separated path of each field.
+    """
+    collection = test_nested_collection_fields
+    fields = collection.dict()["fields"] if as_dict else collection.fields
+    field_paths = [
+        field_path for field_path, _ in core_utils.get_all_level_field_paths(fields)
+    ]
+    assert field_paths == [
+        "top_level_field_1",
+        "top_level_field_2",
+        "top_level_field_2.first_nested_level",
+        "top_level_field_2.first_nested_level.second_nested_level",
+        "top_level_field_2.first_nested_level.second_nested_level.third_nested_level",
+    ]
+
+
 @pytest.mark.unit
 def test_get_manifest_list(tmp_path: PosixPath) -> None:
     """Test that the correct number of yml files are returned."""
@@ -2609,6 +2609,7 @@ def custom_provided_identity(db):
         "field_name": "customer_id",
         "field_label": "Customer ID",
         "hashed_value": ProvidedIdentity.hash_value("123"),
+        "lookup_hash": ProvidedIdentity.lookup_hash_value("123"),
         "encrypted_value": {"value": "123"},
     }
     provided_identity = ProvidedIdentity.create(
@@ -2633,6 +2634,7 @@ def provided_identity_and_consent_request(
         "privacy_request_id": None,
         "field_name": "email",
         "hashed_value": ProvidedIdentity.hash_value(provided_identity_value),
+        "lookup_hash": ProvidedIdentity.lookup_hash_value(provided_identity_value),
         "encrypted_value": {"value": provided_identity_value},
     }
     provided_identity = ProvidedIdentity.create(db, data=provided_identity_data)
@@ -2671,6 +2673,9 @@ def fides_user_provided_identity(db):
         "hashed_value": ProvidedIdentity.hash_value(
             "051b219f-20e4-45df-82f7-5eb68a00889f"
         ),
+        "lookup_hash": ProvidedIdentity.lookup_hash_value(
+            "051b219f-20e4-45df-82f7-5eb68a00889f"
+        ),
         "encrypted_value": {"value": "051b219f-20e4-45df-82f7-5eb68a00889f"},
     }
     provided_identity = ProvidedIdentity.create(db, data=provided_identity_data)
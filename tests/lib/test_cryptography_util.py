@@ -10,6 +10,7 @@ from fides.api.cryptography.cryptographic_util import (
     generate_salt,
     generate_secure_random_string,
     hash_with_salt,
+    hmac_sha256_hash,
     str_to_b64_str,
 )
 
@@ -95,3 +96,17 @@ def test_str_to_b64_str() -> None:
 )
 def test_decode_password(password, expected):
     assert decode_password(password) == expected
+
+
+def test_hmac_sha256_hash(encoding: str = "UTF-8") -> None:
+    plain_text = "This is Plaintext. Not hashed. or salted. or chopped. or grilled."
+    key = "secret-key"
+
+    expected_hash = "c7ea115df58c602ad2459974540d64ce3947e43da193aa3363b7d9502ccc4803"
+    hashed = hmac_sha256_hash(
+        plain_text.encode(encoding),
+        key.encode(encoding),
+    )
+
+    assert hashed == expected_hash
+    assert hmac_sha256_hash(plain_text.encode(encoding), b"other-key") != hashed
@@ -1,4 +1,5 @@
 import json
+from unittest import mock
 
 import pydantic
 import pytest
@@ -354,6 +355,17 @@ class TestCollection:
                 FieldPath("f4", "f2")
             ],  # Applies to a nested field
         }
+        # Memoized, and read-only since it's shared
+        with mock.patch.object(
+            Collection, "field_dict", new_callable=mock.PropertyMock
+        ) as field_dict:
+            assert ds.field_paths_by_category["test_category_apple"] == [
+                FieldPath("f1"),
+                FieldPath("f3"),
+            ]
+            field_dict.assert_not_called()
+        with pytest.raises(TypeError):
+            ds.field_paths_by_category["test_category_cherry"] = []  # type: ignore
 
     def test_collection_json(self):
         json_collection = json.loads(collection_to_serialize.json())
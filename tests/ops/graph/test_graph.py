@@ -59,6 +59,54 @@ class TestNode:
         assert node.collection.contains_field(lambda f: f.identity == "ssn")
 
 
+class TestDataCategoryIndex:
+    def test_field_paths_for_categories(self) -> None:
+        categorized = Collection(
+            name="categorized",
+            fields=[
+                ScalarField(name="id", data_categories=["system.operations"]),
+                ScalarField(name="email", data_categories=["user.contact.email"]),
+                ScalarField(name="city", data_categories=["user.contact.address.city"]),
+                ObjectField(
+                    name="profile",
+                    fields={
+                        "name": ScalarField(name="name", data_categories=["user.name"])
+                    },
+                ),
+            ],
+        )
+        categorized_graph = DatasetGraph(
+            GraphDataset(
+                name="s2",
+                collections=[categorized],
+                connection_key="mock_connection_config_key",
+            )
+        )
+        address = CollectionAddress("s2", "categorized")
+        index = categorized_graph.data_category_index
+
+        assert index.field_paths_for_categories(address, {"user.contact"}) == {
+            FieldPath("email"),
+            FieldPath("city"),
+        }
+        assert index.field_paths_for_categories(address, {"user.name", "system"}) == {
+            FieldPath("profile", "name"),
+            FieldPath("id"),
+        }
+        assert index.field_paths_for_categories(address, {"user"}) == {
+            FieldPath("email"),
+            FieldPath("city"),
+            FieldPath("profile", "name"),
+        }
+        assert index.field_paths_for_categories(address, {"user.sensor"}) == set()
+        assert (
+            index.field_paths_for_categories(
+                CollectionAddress("s2", "unknown"), {"user"}
+            )
+            == set()
+        )
+
+
 def test_retry_decorator(privacy_request, policy, db):
     input_data = {"test": "data"}
     graph: DatasetGraph = integration_db_graph("postgres_example")
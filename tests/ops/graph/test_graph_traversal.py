@@ -1,6 +1,7 @@
 import pytest
 
 from fides.api.graph.graph import *
+from fides.api.util.cache import get_cache
 
 from .graph_test_util import *
 
@@ -692,3 +693,38 @@ def test_different_seed_alters_traversal() -> None:
         len(Traversal(graph, {"ssn": "1", "email": 1, "user_id": 1}).root_node.children)
         == 4
     )
+
+
+def test_traversal_plan_is_cached() -> None:
+    t = generate_fully_connected_resources(5)
+    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    field(t, "dr_2", "ds_2", "f1").identity = "user_id"
+    graph = DatasetGraph(*t)
+    get_cache().delete(Traversal(graph, {"email": "X"}).plan_cache_key())
+
+    traversal = Traversal(graph, {"email": "X"})
+    assert traversal.cached_plan is None
+    traversal_nodes, end_nodes = traversal.traverse_and_collect_nodes()
+
+    # Another traversal with the same identity types reuses the plan
+    cached_traversal = Traversal(graph, {"email": "Y"})
+    assert cached_traversal.cached_plan is not None
+    cached_nodes, cached_end_nodes = cached_traversal.traverse_and_collect_nodes()
+    assert list(cached_nodes) == list(traversal_nodes)
+    assert cached_end_nodes == end_nodes
+    assert len(cached_traversal.root_node.children) == 1
+    for address, traversal_node in traversal_nodes.items():
+        assert cached_nodes[address].incoming_edges() == traversal_node.incoming_edges()
+        assert cached_nodes[address].outgoing_edges() == traversal_node.outgoing_edges()
+        assert cached_nodes[address].input_keys() == traversal_node.input_keys()
+
+    # Different identity types and different graphs have different plans
+    assert (
+        Traversal(graph, {"email": "X", "user_id": "1"}).plan_cache_key()
+        != traversal.plan_cache_key()
+    )
+    field(t, "dr_3", "ds_3", "f1").identity = "email"
+    assert (
+        Traversal(DatasetGraph(*t), {"email": "X"}).plan_cache_key()
+        != traversal.plan_cache_key()
+    )
@@ -25,6 +25,7 @@ from fides.api.service.connectors.limiter.rate_limiter import (
     RateLimiterTimeoutException,
 )
 from fides.api.task.graph_runners import access_runner
+from fides.api.util.cache import get_cache
 from fides.api.util.saas_util import (
     load_config_with_replacement,
     load_dataset_with_replacement,
@@ -218,6 +219,107 @@ def test_limiter_times_out_when_bucket_full() -> None:
             time.sleep(0.002)
 
 
+@pytest.mark.integration
+def test_limiter_reserves_all_buckets_or_none() -> None:
+    """A breached limit must not consume capacity from the other buckets in the same reservation"""
+    limiter: RateLimiter = RateLimiter()
+    redis = get_cache()
+    open_request = RateLimiterRequest(
+        key=f"open_bucket_{random.randint(0, 100000)}",
+        rate_limit=100,
+        period=RateLimiterPeriod.HOUR,
+    )
+    full_request = RateLimiterRequest(
+        key=f"full_bucket_{random.randint(0, 100000)}",
+        rate_limit=1,
+        period=RateLimiterPeriod.HOUR,
+    )
+    current_seconds = int(time.time())
+
+    assert limiter.reserve(redis, current_seconds, [open_request, full_request]) == []
+    assert limiter.reserve(redis, current_seconds, [open_request, full_request]) == [
+        full_request
+    ]
+
+    open_bucket = limiter.build_redis_key(current_seconds, open_request)
+    full_bucket = limiter.build_redis_key(current_seconds, full_request)
+    assert int(redis.get(open_bucket)) == 1
+    assert int(redis.get(full_bucket)) == 1
+
+    assert limiter.get_metrics(open_request.key, open_request.period) == {
+        "reservations": 1
+    }
+    assert limiter.get_metrics(full_request.key, full_request.period) == {
+        "reservations": 1,
+        "breaches": 1,
+    }
+
+
+@pytest.mark.integration
+def test_limiter_records_metrics_per_period() -> None:
+    """Limits on the same key with different periods each record their own metrics"""
+    limiter: RateLimiter = RateLimiter()
+    redis = get_cache()
+    key = f"multi_period_bucket_{random.randint(0, 100000)}"
+    minute_request = RateLimiterRequest(
+        key=key, rate_limit=100, period=RateLimiterPeriod.MINUTE
+    )
+    day_request = RateLimiterRequest(
+        key=key, rate_limit=1, period=RateLimiterPeriod.DAY
+    )
+    current_seconds = int(time.time())
+
+    assert limiter.reserve(redis, current_seconds, [minute_request, day_request]) == []
+    assert limiter.reserve(redis, current_seconds, [minute_request, day_request]) == [
+        day_request
+    ]
+
+    assert limiter.get_metrics(key, RateLimiterPeriod.MINUTE) == {"reservations": 1}
+    assert limiter.get_metrics(key, RateLimiterPeriod.DAY) == {
+        "reservations": 1,
+        "breaches": 1,
+    }
+
+
+@pytest.mark.integration
+def test_limiter_records_timeout_metrics() -> None:
+    """A full bucket which won't free up before the timeout fails immediately and records a timeout"""
+    limiter: RateLimiter = RateLimiter()
+    request = RateLimiterRequest(
+        key=f"timeout_bucket_{random.randint(0, 100000)}",
+        rate_limit=1,
+        period=RateLimiterPeriod.DAY,
+    )
+    limiter.limit(requests=[request], timeout_seconds=1)
+
+    start_time = time.time()
+    with pytest.raises(RateLimiterTimeoutException):
+        limiter.limit(requests=[request], timeout_seconds=10)
+    assert time.time() - start_time < 1
+
+    metrics = limiter.get_metrics(request.key, request.period)
+    assert metrics["reservations"] == 1
+    assert metrics["timeouts"] == 1
+    assert "waits" not in metrics
+
+
+@pytest.mark.integration
+def test_seconds_until_available() -> None:
+    """The wait is until the latest of the breached buckets rolls over"""
+    second_request = RateLimiterRequest(
+        key="second", rate_limit=1, period=RateLimiterPeriod.SECOND
+    )
+    minute_request = RateLimiterRequest(
+        key="minute", rate_limit=1, period=RateLimiterPeriod.MINUTE
+    )
+    assert RateLimiter.seconds_until_available(
+        120.25, [second_request]
+    ) == pytest.approx(0.75)
+    assert RateLimiter.seconds_until_available(
+        150.5, [second_request, minute_request]
+    ) == pytest.approx(29.5)
+
+
 @pytest.mark.integration_saas
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
@@ -495,6 +495,7 @@ def create_privacy_preference_history(
             "privacy_request_id": None,
             "field_name": "email",
             "hashed_value": ProvidedIdentity.hash_value(email_identity),
+            "lookup_hash": ProvidedIdentity.lookup_hash_value(email_identity),
             "encrypted_value": {"value": email_identity},
         },
     )
@@ -1062,6 +1062,51 @@ class TestRetrievingData:
             }
         ]
 
+    def test_retrieving_data_in_chunks(
+        self,
+        privacy_request,
+        db,
+        connector,
+        execution_node,
+        postgres_integration_db,
+    ):
+        execution_node.incoming_edges = {
+            Edge(
+                FieldAddress("fake_dataset", "fake_collection", "email"),
+                FieldAddress("postgres_example_test_dataset", "customer", "email"),
+            )
+        }
+        input_data = {"email": ["customer-1@example.com", "customer-2@example.com"]}
+
+        original_chunk_size = CONFIG.execution.sql_retrieval_chunk_size
+        CONFIG.execution.sql_retrieval_chunk_size = 1
+        try:
+            chunks = list(
+                connector.retrieve_data_in_chunks(
+                    execution_node,
+                    Policy(),
+                    privacy_request,
+                    RequestTask(),
+                    input_data,
+                )
+            )
+        finally:
+            CONFIG.execution.sql_retrieval_chunk_size = original_chunk_size
+
+        assert [len(chunk) for chunk in chunks] == [1, 1]
+        assert sorted(row["email"] for chunk in chunks for row in chunk) == [
+            "customer-1@example.com",
+            "customer-2@example.com",
+        ]
+        assert sorted(
+            (row for chunk in chunks for row in chunk), key=lambda row: row["id"]
+        ) == sorted(
+            connector.retrieve_data(
+                execution_node, Policy(), privacy_request, RequestTask(), input_data
+            ),
+            key=lambda row: row["id"],
+        )
+
     def test_retrieving_data_no_input(
         self,
         privacy_request,
@@ -1129,7 +1174,9 @@ class TestRetrievingData:
 @pytest.mark.integration_postgres
 @pytest.mark.integration
 class TestRetryIntegration:
-    @mock.patch("fides.api.service.connectors.sql_connector.SQLConnector.retrieve_data")
+    @mock.patch(
+        "fides.api.service.connectors.sql_connector.SQLConnector.retrieve_data_in_chunks"
+    )
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "dsr_version",
@@ -8,9 +8,18 @@ from fides.api.graph.config import (
     TERMINATOR_ADDRESS,
     CollectionAddress,
 )
-from fides.api.models.privacy_request import ExecutionLogStatus, RequestTask
+from fides.api.models.privacy_request import (
+    ExecutionLogStatus,
+    RequestTask,
+    RequestTaskDataChunk,
+    RequestTaskDataType,
+    RequestTaskDataWriter,
+    RequestTaskResults,
+)
 from fides.api.schemas.policy import ActionType
 from fides.api.util.cache import FidesopsRedis, cache_task_tracking_key, get_cache
+from fides.api.util.cache_codec import decode_with_codec
+from fides.config import CONFIG
 
 
 class TestRequestTask:
@@ -166,6 +175,31 @@ class TestRequestTask:
         assert terminator_task.upstream_tasks_complete(db)
         assert terminator_task.can_queue_request_task(db)
 
+    @mock.patch("fides.api.util.cache.celery_app.control.inspect.query_task")
+    def test_get_ready_downstream_tasks(self, query_task_mock, db, request_task):
+        root_task = request_task.get_tasks_with_same_action_type(
+            db, ROOT_COLLECTION_ADDRESS.value
+        ).first()
+        terminator_task = request_task.get_tasks_with_same_action_type(
+            db, TERMINATOR_ADDRESS.value
+        ).first()
+
+        # The Root Task is complete so the Request Task is ready
+        assert root_task.get_ready_downstream_tasks(db) == [request_task]
+
+        # The Request Task is pending so the Terminator Task isn't ready
+        assert request_task.get_ready_downstream_tasks(db) == []
+        request_task.update_status(db, ExecutionLogStatus.complete)
+        assert request_task.get_ready_downstream_tasks(db) == [terminator_task]
+
+        # Terminator Task is already in-flight in another celery task
+        cache_task_tracking_key(terminator_task.id, "test_5678")
+        query_task_mock.return_value = {"@celery1234": {"test_5678": ["reserved", {}]}}
+        assert request_task.get_ready_downstream_tasks(db) == []
+
+        query_task_mock.return_value = {"@celery1234": {}}
+        assert request_task.get_ready_downstream_tasks(db) == [terminator_task]
+
     def test_update_status(self, db, request_task):
         assert request_task.status == ExecutionLogStatus.pending
         request_task.update_status(db, ExecutionLogStatus.complete)
@@ -225,6 +259,35 @@ class TestGetRawAccessResults:
             ]
         }
 
+    def test_chunked_results_decoded_lazily(self, db, privacy_request, request_task):
+        original_value = CONFIG.execution.request_task_data_chunk_size
+        CONFIG.execution.request_task_data_chunk_size = 2
+        rows = [{"id": i, "name": f"Jane {i}"} for i in range(5)]
+        request_task.set_access_data(rows)
+        request_task.update_status(db, ExecutionLogStatus.complete)
+        CONFIG.execution.request_task_data_chunk_size = original_value
+
+        results = privacy_request.get_raw_access_results()
+        assert isinstance(results, RequestTaskResults)
+        assert list(results) == ["test_dataset:test_collection"]
+
+        with (
+            mock.patch.object(
+                RequestTaskDataChunk, "get_rows", side_effect=AssertionError
+            ),
+            mock.patch(
+                "fides.api.models.privacy_request.decode_with_codec",
+                wraps=decode_with_codec,
+            ) as mock_decode,
+        ):
+            assert len(results) == 1
+            assert mock_decode.call_count == 0
+
+            results.prefetch(max_workers=2)
+            assert mock_decode.call_count == 3
+            assert results["test_dataset:test_collection"] == rows
+            assert mock_decode.call_count == 3
+
     def test_dsr_2_0(self, privacy_request):
         """DSR 2.0 uses the cache to store results"""
         cache: FidesopsRedis = get_cache()
@@ -315,3 +378,107 @@ class TestGetDecodedDataForErasures:
         request_task.save(db)
 
         assert request_task.get_data_for_erasures() == [{"id": 1, "name": "Jane"}]
+
+
+class TestRequestTaskDataChunks:
+    @pytest.fixture(scope="function")
+    def small_chunk_size(self):
+        original_value = CONFIG.execution.request_task_data_chunk_size
+        CONFIG.execution.request_task_data_chunk_size = 2
+        yield
+        CONFIG.execution.request_task_data_chunk_size = original_value
+
+    @pytest.mark.usefixtures("small_chunk_size")
+    def test_set_access_data(self, db, request_task):
+        rows = [{"id": i, "name": f"Jane {i}"} for i in range(5)]
+        request_task.set_access_data(rows)
+        request_task.save(db)
+
+        chunks = request_task.data_chunks.all()
+        assert [chunk.chunk_index for chunk in chunks] == [0, 1, 2]
+        assert [chunk.row_count for chunk in chunks] == [2, 2, 1]
+        assert all(
+            chunk.data_type == RequestTaskDataType.access_data for chunk in chunks
+        )
+        assert request_task.access_data is None
+
+        assert request_task.get_access_data() == rows
+        assert list(request_task.iter_access_data()) == rows
+        assert request_task.get_access_data_row_count() == 5
+        assert request_task.get_data_for_erasures() == []
+        assert request_task.get_data_for_erasures_row_count() == 0
+
+    @pytest.mark.usefixtures("small_chunk_size")
+    def test_set_data_replaces_previous_chunks(self, db, request_task):
+        request_task.set_data_for_erasures([{"id": i} for i in range(5)])
+        request_task.save(db)
+
+        request_task.set_data_for_erasures([{"id": 10}])
+        request_task.save(db)
+
+        assert request_task.data_chunks.count() == 1
+        assert request_task.get_data_for_erasures() == [{"id": 10}]
+        assert request_task.get_data_for_erasures_row_count() == 1
+
+    @pytest.mark.usefixtures("small_chunk_size")
+    def test_set_data_twice_before_flush(self, db, request_task):
+        """Chunks that haven't been flushed yet are replaced too"""
+        request_task.set_access_data([{"id": i} for i in range(5)])
+        request_task.set_access_data([{"id": 10}, {"id": 11}, {"id": 12}])
+        request_task.save(db)
+
+        assert [chunk.row_count for chunk in request_task.data_chunks] == [2, 1]
+        assert request_task.get_access_data() == [{"id": 10}, {"id": 11}, {"id": 12}]
+
+    @pytest.mark.usefixtures("small_chunk_size")
+    def test_writer_saves_full_chunks_as_rows_are_written(self, db, request_task):
+        request_task.set_access_data([{"id": 10}])
+        request_task.save(db)
+
+        writer = RequestTaskDataWriter(request_task, RequestTaskDataType.access_data)
+        writer.write([{"id": 0}])
+        assert request_task.data_chunks.count() == 0
+
+        writer.write([{"id": 1}, {"id": 2}])
+        assert [chunk.row_count for chunk in request_task.data_chunks] == [2]
+
+        writer.write([{"id": 3}, {"id": 4}])
+        writer.close()
+        request_task.save(db)
+
+        assert [chunk.chunk_index for chunk in request_task.data_chunks] == [0, 1, 2]
+        assert request_task.get_access_data() == [{"id": i} for i in range(5)]
+
+    def test_writer_without_session(self):
+        request_task = RequestTask()
+        writer = RequestTaskDataWriter(
+            request_task, RequestTaskDataType.data_for_erasures
+        )
+        writer.write([{"id": 1}])
+        writer.write([{"id": 2}])
+        writer.close()
+
+        assert request_task.data_for_erasures == [{"id": 1}, {"id": 2}]
+        assert request_task.get_data_for_erasures() == [{"id": 1}, {"id": 2}]
+
+    def test_data_saved_on_task_is_still_read(self, db, request_task):
+        request_task.access_data = [{"id": 1, "name": "Jane"}]
+        request_task.save(db)
+
+        assert request_task.data_chunks.count() == 0
+        assert request_task.get_access_data() == [{"id": 1, "name": "Jane"}]
+        assert request_task.get_access_data_row_count() == 1
+
+    def test_chunks_deleted_with_task(self, db, request_task):
+        request_task.set_access_data([{"id": 1}])
+        request_task.save(db)
+        request_task_id = request_task.id
+
+        request_task.delete(db)
+
+        assert (
+            db.query(RequestTaskDataChunk)
+            .filter(RequestTaskDataChunk.request_task_id == request_task_id)
+            .count()
+            == 0
+        )
@@ -0,0 +1,76 @@
+from unittest import mock
+
+from fideslang.models import Dataset
+from pymongo import UpdateOne
+from pymongo.results import BulkWriteResult
+
+from fides.api.graph.config import CollectionAddress
+from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.traversal import Traversal
+from fides.api.models.connectionconfig import ConnectionConfig
+from fides.api.models.datasetconfig import convert_dataset_to_graph
+from fides.api.models.privacy_request import PrivacyRequest
+from fides.api.service.connectors import MongoDBConnector
+from fides.api.util.data_category import DataCategory
+from fides.config import CONFIG
+
+
+def test_mongodb_connector_mask_data_bulk_writes_updates(
+    connection_config: ConnectionConfig,
+    integration_mongodb_config: ConnectionConfig,
+    erasure_policy,
+    example_datasets,
+):
+    """Document updates are sent as unordered bulk writes, in batches"""
+    postgres_graph = convert_dataset_to_graph(
+        Dataset(**example_datasets[0]), connection_config.key
+    )
+    mongo_graph = convert_dataset_to_graph(
+        Dataset(**example_datasets[1]), integration_mongodb_config.key
+    )
+    traversal = Traversal(
+        DatasetGraph(postgres_graph, mongo_graph), {"email": "customer-1@example.com"}
+    )
+    customer_details_node = traversal.traversal_node_dict[
+        CollectionAddress("mongo_test", "customer_details")
+    ].to_mock_execution_node()
+    erasure_policy.rules[0].targets[0].data_category = DataCategory(
+        "user.demographic.gender"
+    ).value
+
+    rows = [{"_id": i, "customer_id": i, "gender": "female"} for i in range(1, 6)] + [
+        {"_id": None, "customer_id": 6, "gender": "female"}
+    ]
+
+    collection = mock.MagicMock()
+    collection.bulk_write.side_effect = lambda batch, ordered: BulkWriteResult(
+        {"nModified": len(batch)}, acknowledged=True
+    )
+    client = mock.MagicMock()
+    client.__getitem__.return_value.__getitem__.return_value = collection
+
+    connector = MongoDBConnector(configuration=integration_mongodb_config)
+    original_batch_size = CONFIG.execution.mongo_masking_batch_size
+    CONFIG.execution.mongo_masking_batch_size = 2
+    try:
+        with mock.patch.object(MongoDBConnector, "client", return_value=client):
+            masked_count = connector.mask_data(
+                customer_details_node,
+                erasure_policy,
+                PrivacyRequest(id="test_bulk_masking"),
+                None,
+                rows,
+            )
+    finally:
+        CONFIG.execution.mongo_masking_batch_size = original_batch_size
+
+    # The document without an _id isn't updated
+    assert masked_count == 5
+    # 5 updates in batches of 2
+    assert collection.bulk_write.call_count == 3
+    first_batch = collection.bulk_write.call_args_list[0]
+    assert first_batch.kwargs == {"ordered": False}
+    assert first_batch.args[0] == [
+        UpdateOne({"_id": 1}, {"$set": {"gender": None}}, upsert=False),
+        UpdateOne({"_id": 2}, {"$set": {"gender": None}}, upsert=False),
+    ]
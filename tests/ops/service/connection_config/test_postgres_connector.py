@@ -1,7 +1,17 @@
+from unittest import mock
+
+from fideslang.models import Dataset
+from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
+from fides.api.graph.config import CollectionAddress
+from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.traversal import Traversal
 from fides.api.models.connectionconfig import ConnectionConfig
+from fides.api.models.datasetconfig import convert_dataset_to_graph
+from fides.api.models.privacy_request import PrivacyRequest
 from fides.api.service.connectors import PostgreSQLConnector
+from fides.config import CONFIG
 
 
 def test_postgres_connector_build_uri(connection_config: ConnectionConfig, db: Session):
@@ -56,3 +66,67 @@ def test_postgres_connector_build_uri(connection_config: ConnectionConfig, db: S
         connector.build_uri()
         == "postgresql://host.docker.internal:5432/postgres_example"
     )
+
+
+def test_postgres_connector_mask_data_batches_updates(
+    connection_config: ConnectionConfig, erasure_policy, example_datasets
+):
+    """Rows with the same update shape are masked together in batches inside one transaction"""
+    dataset = Dataset(**example_datasets[0])
+    graph = convert_dataset_to_graph(dataset, connection_config.key)
+    traversal = Traversal(DatasetGraph(graph), {"email": "customer-1@example.com"})
+    customer_node = traversal.traversal_node_dict[
+        CollectionAddress("postgres_example_test_dataset", "customer")
+    ].to_mock_execution_node()
+
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(
+            "CREATE TABLE customer (id INTEGER PRIMARY KEY, email TEXT, name TEXT, address_id INTEGER)"
+        )
+        for i in range(1, 6):
+            connection.execute(
+                f"INSERT INTO customer VALUES ({i}, 'customer-{i}@example.com', 'Customer {i}', {i})"
+            )
+
+    rows = [
+        {
+            "id": i,
+            "email": f"customer-{i}@example.com",
+            "name": f"Customer {i}",
+            "address_id": i,
+        }
+        for i in range(1, 6)
+    ]
+
+    connector = PostgreSQLConnector(configuration=connection_config)
+    original_batch_size = CONFIG.execution.sql_masking_batch_size
+    CONFIG.execution.sql_masking_batch_size = 2
+    try:
+        with (
+            mock.patch.object(
+                PostgreSQLConnector, "create_client", return_value=engine
+            ),
+            mock.patch.object(
+                PostgreSQLConnector,
+                "_execute_update_batch",
+                wraps=PostgreSQLConnector._execute_update_batch,
+            ) as execute_update_batch,
+        ):
+            masked_count = connector.mask_data(
+                customer_node,
+                erasure_policy,
+                PrivacyRequest(id="test_batched_masking"),
+                None,
+                rows,
+            )
+    finally:
+        CONFIG.execution.sql_masking_batch_size = original_batch_size
+
+    assert masked_count == 5
+    # 5 rows in batches of 2
+    assert execute_update_batch.call_count == 3
+    with engine.connect() as connection:
+        assert (
+            connection.execute("SELECT name FROM customer").fetchall() == [(None,)] * 5
+        )
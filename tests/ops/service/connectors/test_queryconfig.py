@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from typing import Any, Dict, Set
+from unittest import mock
 
 import pytest
 from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
@@ -21,11 +22,17 @@ from fides.api.schemas.masking.masking_configuration import HashMaskingConfigura
 from fides.api.schemas.masking.masking_secrets import MaskingSecretCache, SecretType
 from fides.api.service.connectors.query_config import (
     DynamoDBQueryConfig,
+    MicrosoftSQLServerQueryConfig,
     MongoQueryConfig,
+    PostgresQueryConfig,
     SQLQueryConfig,
 )
 from fides.api.service.masking.strategy.masking_strategy_hash import HashMaskingStrategy
+from fides.api.service.masking.strategy.masking_strategy_string_rewrite import (
+    StringRewriteMaskingStrategy,
+)
 from fides.api.util.data_category import DataCategory
+from fides.config import CONFIG
 
 from ...task.traversal_data import combined_mongo_postgresql_graph, integration_db_graph
 from ...test_helpers.cache_secrets_helper import cache_secret, clear_cache_secrets
@@ -175,6 +182,74 @@ class TestSQLQueryConfig:
             == "SELECT billing_address_id,ccn,customer_id,id,name FROM payment_card WHERE customer_id = :customer_id"
         )
 
+    @pytest.fixture(scope="function")
+    def in_clause_chunk_size(self):
+        original_value = CONFIG.execution.sql_in_clause_chunk_size
+        CONFIG.execution.sql_in_clause_chunk_size = 2
+        yield 2
+        CONFIG.execution.sql_in_clause_chunk_size = original_value
+
+    def test_generate_chunked_queries_within_chunk_size(self, in_clause_chunk_size):
+        queries = SQLQueryConfig(payment_card_node).generate_chunked_queries(
+            {"id": ["A", "A"], "customer_id": ["V"]}
+        )
+        assert [str(query) for query in queries] == [
+            "SELECT billing_address_id,ccn,customer_id,id,name FROM payment_card WHERE id = :id OR customer_id = :customer_id"
+        ]
+
+        assert SQLQueryConfig(payment_card_node).generate_chunked_queries({}) == []
+
+    def test_generate_chunked_queries(self, in_clause_chunk_size):
+        queries = SQLQueryConfig(payment_card_node).generate_chunked_queries(
+            {"id": ["A", "B", "C"], "customer_id": ["V"]}
+        )
+        # Budget of 2 values is split across both keys, so each query matches one value per key
+        assert [str(query) for query in queries] == [
+            "SELECT billing_address_id,ccn,customer_id,id,name FROM payment_card WHERE id = :id OR customer_id = :customer_id",
+            "SELECT billing_address_id,ccn,customer_id,id,name FROM payment_card WHERE id = :id",
+            "SELECT billing_address_id,ccn,customer_id,id,name FROM payment_card WHERE id = :id",
+        ]
+        assert [query.compile().params["id"] for query in queries] == ["A", "B", "C"]
+
+        queries = SQLQueryConfig(payment_card_node).generate_chunked_queries(
+            {"id": ["A", "B", "C", "D", "E"]}
+        )
+        assert [
+            sorted(param) if isinstance(param, tuple) else param
+            for param in (query.compile().params["id"] for query in queries)
+        ] == [["A", "B"], ["C", "D"], "E"]
+
+    def test_in_clause_chunk_size_capped_by_dialect(self):
+        assert (
+            SQLQueryConfig(payment_card_node).in_clause_chunk_size()
+            == CONFIG.execution.sql_in_clause_chunk_size
+        )
+        original_value = CONFIG.execution.sql_in_clause_chunk_size
+        CONFIG.execution.sql_in_clause_chunk_size = 50000
+        try:
+            assert (
+                MicrosoftSQLServerQueryConfig(payment_card_node).in_clause_chunk_size()
+                == 2000
+            )
+        finally:
+            CONFIG.execution.sql_in_clause_chunk_size = original_value
+
+    def test_postgres_large_input_uses_array_parameter(self, in_clause_chunk_size):
+        config = PostgresQueryConfig(payment_card_node)
+        queries = config.generate_chunked_queries({"id": ["A", "B", "C"]})
+        assert len(queries) == 1
+        assert (
+            str(queries[0])
+            == 'SELECT billing_address_id,ccn,customer_id,id,name FROM "payment_card" WHERE id = ANY(:id)'
+        )
+        assert sorted(queries[0].compile().params["id"]) == ["A", "B", "C"]
+
+        # Inputs within the chunk size still use an IN clause
+        assert (
+            str(config.generate_query({"id": ["A", "B"]}))
+            == 'SELECT billing_address_id,ccn,customer_id,id,name FROM "payment_card" WHERE id IN :id'
+        )
+
     def test_update_rule_target_fields(
         self, erasure_policy, example_datasets, connection_config
     ):
@@ -360,6 +435,51 @@ class TestSQLQueryConfig:
             text_clause._bindparams["email"].value == "*****"
         )  # String rewrite masking strategy
 
+    def test_update_value_maps_masks_each_column_once(
+        self, erasure_policy_two_rules, example_datasets, connection_config
+    ):
+        dataset = Dataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+        rows = [
+            {
+                "email": f"customer-{i}@example.com",
+                "name": f"Customer {i}",
+                "address_id": i,
+                "id": i,
+            }
+            for i in range(1, 4)
+        ]
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ].to_mock_execution_node()
+
+        config = SQLQueryConfig(customer_node)
+
+        with mock.patch.object(
+            StringRewriteMaskingStrategy,
+            "mask",
+            autospec=True,
+            side_effect=lambda _, values, request_id: ["*****"] * len(values),
+        ) as mock_mask:
+            value_maps = config.update_value_maps(
+                rows, erasure_policy_two_rules, privacy_request
+            )
+
+        # The email values of all of the rows are masked with a single call
+        mock_mask.assert_called_once()
+        assert mock_mask.call_args[0][1] == [row["email"] for row in rows]
+        assert value_maps == [{"name": None, "email": "*****"}] * len(rows)
+
+        update_components = config.generate_update_components_for_rows(
+            rows, erasure_policy_two_rules, privacy_request
+        )
+        assert [params for _, params in update_components] == [
+            {"name": None, "email": "*****", "id": row["id"]} for row in rows
+        ]
+
 
 class TestMongoQueryConfig:
     @pytest.fixture(scope="function")
@@ -617,6 +737,52 @@ class TestMongoQueryConfig:
             )[0]
         )
 
+    def test_generate_update_stmts(
+        self,
+        erasure_policy,
+        example_datasets,
+        integration_mongodb_config,
+        connection_config,
+    ):
+        dataset_postgres = Dataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset_postgres, connection_config.key)
+        dataset_mongo = Dataset(**example_datasets[1])
+        mongo_graph = convert_dataset_to_graph(
+            dataset_mongo, integration_mongodb_config.key
+        )
+        dataset_graph = DatasetGraph(*[graph, mongo_graph])
+
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+        customer_details = traversal.traversal_node_dict[
+            CollectionAddress("mongo_test", "customer_details")
+        ].to_mock_execution_node()
+        config = MongoQueryConfig(customer_details)
+        rows = [
+            {"_id": 1, "customer_id": 1, "gender": "male", "children": ["Kid"]},
+            {"_id": 2, "customer_id": 2},
+            {"_id": None, "customer_id": 3, "gender": "female"},
+        ]
+
+        target = erasure_policy.rules[0].targets[0]
+        target.data_category = DataCategory("user").value
+
+        mongo_statements = config.generate_update_stmts(
+            rows, erasure_policy, privacy_request
+        )
+
+        assert mongo_statements == [
+            (
+                {"_id": 1},
+                {"$set": {"customer_id": None, "gender": None, "children.0": None}},
+            ),
+            ({"_id": 2}, {"$set": {"customer_id": None}}),
+            # No primary key to update the row by
+            None,
+        ]
+        assert mongo_statements[0] == config.generate_update_stmt(
+            rows[0], erasure_policy, privacy_request
+        )
+
 
 class TestDynamoDBQueryConfig:
     @pytest.fixture(scope="function")
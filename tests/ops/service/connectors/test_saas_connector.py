@@ -528,6 +528,47 @@ class TestSaaSConnectorOutputTemplate:
             {"id": "456", "site_id": "site-2", "status": "closed"},
         ]
 
+    @mock.patch("fides.api.service.connectors.saas_connector.AuthenticatedClient.send")
+    def test_output_template_concurrent_requests(
+        self, mock_send, saas_example_config, saas_example_connection_config
+    ):
+        """Rows are returned in the order of the prepared requests when they run concurrently"""
+        mock_send().json.return_value = [{"id": "123"}, {"id": "456"}]
+
+        saas_config = SaaSConfig(**saas_example_config)
+        graph = saas_config.get_graph(saas_example_connection_config.secrets)
+        node = Node(
+            graph,
+            next(
+                collection
+                for collection in graph.collections
+                if collection.name == "complex_template_example"
+            ),
+        )
+        traversal_node = TraversalNode(node)
+        request_task = traversal_node.to_mock_request_task()
+        execution_node = ExecutionNode(request_task)
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+        connector.saas_config.max_concurrent_requests = 4
+        assert connector.get_max_concurrent_requests() == 4
+
+        assert connector.retrieve_data(
+            execution_node,
+            Policy(),
+            PrivacyRequest(id="123"),
+            request_task,
+            {"email": ["test@example.com"], "site_id": ["site-1", "site-2"]},
+        ) == [
+            {"id": "123", "site_id": "site-1", "status": "open"},
+            {"id": "456", "site_id": "site-1", "status": "open"},
+            {"id": "123", "site_id": "site-2", "status": "open"},
+            {"id": "456", "site_id": "site-2", "status": "open"},
+            {"id": "123", "site_id": "site-1", "status": "closed"},
+            {"id": "456", "site_id": "site-1", "status": "closed"},
+            {"id": "123", "site_id": "site-2", "status": "closed"},
+            {"id": "456", "site_id": "site-2", "status": "closed"},
+        ]
+
     @mock.patch("fides.api.service.connectors.saas_connector.AuthenticatedClient.send")
     def test_request_with_invalid_output_template(
         self, mock_send, saas_example_config, saas_example_connection_config
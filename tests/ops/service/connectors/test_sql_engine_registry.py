@@ -0,0 +1,134 @@
+from typing import Optional, Tuple
+from unittest import mock
+
+import pytest
+from sqlalchemy.engine import Engine, create_engine
+from sqlalchemy.orm import Session
+
+from fides.api.models.connectionconfig import ConnectionConfig
+from fides.api.service.connectors.sql_engine_registry import SQLEngineRegistry
+from fides.config import CONFIG
+
+
+def create_sqlite_engine() -> Tuple[Engine, Optional[object]]:
+    return create_engine("sqlite://"), None
+
+
+@pytest.fixture(scope="function")
+def registry() -> SQLEngineRegistry:
+    registry = SQLEngineRegistry()
+    yield registry
+    registry.clear()
+
+
+class TestSQLEngineRegistry:
+    def test_engine_reused_for_same_config(self, registry):
+        config = ConnectionConfig(key="my_postgres_db", secrets={"host": "a"})
+        factory = mock.Mock(side_effect=create_sqlite_engine)
+
+        engine = registry.acquire(config, factory)
+        registry.release(engine)
+        assert registry.acquire(config, factory) is engine
+        registry.release(engine)
+
+        assert factory.call_count == 1
+        [metrics] = registry.get_metrics()
+        assert metrics["connection_key"] == "my_postgres_db"
+        assert metrics["in_use"] == 0
+        assert metrics["reuses"] == 1
+        assert "pool_status" in metrics
+
+    def test_secrets_change_replaces_engine(self, registry):
+        config = ConnectionConfig(key="my_postgres_db", secrets={"host": "a"})
+        engine = registry.acquire(config, create_sqlite_engine)
+        registry.release(engine)
+
+        config.secrets = {"host": "b"}
+        with mock.patch.object(engine, "dispose") as dispose:
+            new_engine = registry.acquire(config, create_sqlite_engine)
+
+        assert new_engine is not engine
+        dispose.assert_called_once()
+        assert len(registry.get_metrics()) == 1
+
+    def test_invalidate_disposes_engine_once_released(self, registry):
+        config = ConnectionConfig(key="my_postgres_db", secrets={"host": "a"})
+        engine = registry.acquire(config, create_sqlite_engine)
+
+        with mock.patch.object(engine, "dispose") as dispose:
+            registry.invalidate("my_postgres_db")
+            assert registry.get_metrics() == []
+            # Still in use, so it's not disposed until it's released
+            dispose.assert_not_called()
+            registry.release(engine)
+            dispose.assert_called_once()
+
+    def test_idle_engines_evicted(self, registry):
+        config = ConnectionConfig(key="my_postgres_db", secrets={"host": "a"})
+        engine = registry.acquire(config, create_sqlite_engine)
+        registry.release(engine)
+
+        with (
+            mock.patch.object(CONFIG.execution, "sql_engine_idle_timeout", 1),
+            mock.patch(
+                "fides.api.service.connectors.sql_engine_registry.time.monotonic",
+                return_value=engine_last_used(registry) + 2,
+            ),
+        ):
+            registry.evict_idle()
+
+        assert registry.get_metrics() == []
+
+    def test_in_use_engines_not_evicted(self, registry):
+        config = ConnectionConfig(key="my_postgres_db", secrets={"host": "a"})
+        registry.acquire(config, create_sqlite_engine)
+
+        with (
+            mock.patch.object(CONFIG.execution, "sql_engine_idle_timeout", 1),
+            mock.patch(
+                "fides.api.service.connectors.sql_engine_registry.time.monotonic",
+                return_value=engine_last_used(registry) + 2,
+            ),
+        ):
+            registry.evict_idle()
+
+        assert len(registry.get_metrics()) == 1
+
+    def test_idle_engines_evicted_on_release(self, registry):
+        idle_config = ConnectionConfig(key="idle_postgres_db", secrets={"host": "a"})
+        registry.release(registry.acquire(idle_config, create_sqlite_engine))
+        idle_last_used = engine_last_used(registry)
+
+        config = ConnectionConfig(key="my_postgres_db", secrets={"host": "a"})
+        engine = registry.acquire(config, create_sqlite_engine)
+
+        with (
+            mock.patch.object(CONFIG.execution, "sql_engine_idle_timeout", 1),
+            mock.patch(
+                "fides.api.service.connectors.sql_engine_registry.time.monotonic",
+                return_value=idle_last_used + 2,
+            ),
+        ):
+            registry.release(engine)
+
+        [metrics] = registry.get_metrics()
+        assert metrics["connection_key"] == "my_postgres_db"
+
+
+def engine_last_used(registry: SQLEngineRegistry) -> float:
+    [registered] = registry._engines.values()
+    return registered.last_used
+
+
+def test_updating_connection_config_secrets_invalidates_engines(
+    db: Session, connection_config
+):
+    with mock.patch(
+        "fides.api.service.connectors.sql_engine_registry.sql_engine_registry"
+    ) as sql_engine_registry:
+        connection_config.update(db, data={"description": "Updated description"})
+        sql_engine_registry.invalidate.assert_not_called()
+
+        connection_config.secrets = {**connection_config.secrets, "host": "other"}
+        connection_config.save(db)
+        sql_engine_registry.invalidate.assert_called_once_with(connection_config.key)
@@ -12,9 +12,11 @@ from fides.api.models.privacy_request import (
     ExecutionLogStatus,
     PrivacyRequest,
     PrivacyRequestStatus,
+    ProvidedIdentity,
 )
 from fides.api.schemas.policy import ActionType
 from fides.api.service.privacy_request.request_service import (
+    backfill_identity_lookup_hashes,
     build_required_privacy_request_kwargs,
     poll_for_exited_privacy_request_tasks,
     poll_server_for_completion,
@@ -344,6 +346,118 @@ class TestRemoveSavedCustomerData:
         )
 
 
+class TestBackfillIdentityLookupHashes:
+    @pytest.fixture
+    def legacy_provided_identity(self, db):
+        """A provided identity saved before lookup hashes were introduced"""
+        provided_identity = ProvidedIdentity.create(
+            db,
+            data={
+                "privacy_request_id": None,
+                "field_name": "email",
+                "hashed_value": ProvidedIdentity.hash_value("legacy@example.com"),
+                "encrypted_value": {"value": "legacy@example.com"},
+            },
+        )
+        ProvidedIdentity._lookup_hashes_backfilled_at = None
+        yield provided_identity
+        provided_identity.delete(db)
+        ProvidedIdentity._lookup_hashes_backfilled_at = None
+
+    def test_backfill_identity_lookup_hashes(self, db, legacy_provided_identity):
+        assert legacy_provided_identity.lookup_hash is None
+        # Identities without a lookup hash are still found by their hashed_value
+        assert not ProvidedIdentity.lookup_hashes_backfilled(db)
+        assert ProvidedIdentity.filter(
+            db, conditions=ProvidedIdentity.lookup_filter(db, "legacy@example.com")
+        ).all() == [legacy_provided_identity]
+
+        assert backfill_identity_lookup_hashes.delay().get() >= 1
+
+        db.refresh(legacy_provided_identity)
+        assert legacy_provided_identity.lookup_hash == (
+            ProvidedIdentity.lookup_hash_value("legacy@example.com")
+        )
+        assert ProvidedIdentity.lookup_hashes_backfilled(db)
+        assert ProvidedIdentity.filter(
+            db, conditions=ProvidedIdentity.lookup_filter(db, "legacy@example.com")
+        ).all() == [legacy_provided_identity]
+
+        # Nothing left to backfill
+        assert backfill_identity_lookup_hashes.delay().get() == 0
+
+    def test_backfill_runs_after_lookup_hashes_backfilled(
+        self, db, legacy_provided_identity
+    ):
+        """Identities saved without a lookup hash by older versions during a rolling
+        deploy are still backfilled, and found once the backfilled flag expires"""
+        backfill_identity_lookup_hashes.delay().get()
+        assert ProvidedIdentity.lookup_hashes_backfilled(db)
+
+        rolling_deploy_identity = ProvidedIdentity.create(
+            db,
+            data={
+                "privacy_request_id": None,
+                "field_name": "email",
+                "hashed_value": ProvidedIdentity.hash_value("rolling@example.com"),
+                "encrypted_value": {"value": "rolling@example.com"},
+            },
+        )
+        ProvidedIdentity._lookup_hashes_backfilled_at = None
+        assert ProvidedIdentity.filter(
+            db, conditions=ProvidedIdentity.lookup_filter(db, "rolling@example.com")
+        ).all() == [rolling_deploy_identity]
+
+        assert backfill_identity_lookup_hashes.delay().get() == 1
+        db.refresh(rolling_deploy_identity)
+        assert rolling_deploy_identity.lookup_hash == (
+            ProvidedIdentity.lookup_hash_value("rolling@example.com")
+        )
+        rolling_deploy_identity.delete(db)
+
+    def test_lookup_filter_finds_legacy_identities_with_same_value(
+        self, db, legacy_provided_identity
+    ):
+        """Identities without a lookup hash are still found when a newer identity with
+        the same value has one"""
+        new_identity = ProvidedIdentity.create(
+            db,
+            data={
+                "privacy_request_id": None,
+                "field_name": "email",
+                "hashed_value": ProvidedIdentity.hash_value("legacy@example.com"),
+                "lookup_hash": ProvidedIdentity.lookup_hash_value("legacy@example.com"),
+                "encrypted_value": {"value": "legacy@example.com"},
+            },
+        )
+        assert {
+            identity.id
+            for identity in ProvidedIdentity.filter(
+                db,
+                conditions=ProvidedIdentity.lookup_filter(db, "legacy@example.com"),
+            )
+        } == {legacy_provided_identity.id, new_identity.id}
+        new_identity.delete(db)
+
+    def test_backfill_identities_without_a_value(self, db, legacy_provided_identity):
+        """Identities without a value are backfilled too, so that the backfill can finish"""
+        empty_identity = ProvidedIdentity.create(
+            db,
+            data={
+                "privacy_request_id": None,
+                "field_name": "phone_number",
+                "hashed_value": ProvidedIdentity.hash_value(None),
+                "encrypted_value": {"value": None},
+            },
+        )
+        backfill_identity_lookup_hashes.delay().get()
+
+        db.refresh(empty_identity)
+        assert empty_identity.lookup_hash == ProvidedIdentity.lookup_hash_value(None)
+        assert ProvidedIdentity.lookup_hashes_backfilled(db)
+        empty_identity.delete(db)
+
+
 class TestBuildPrivacyRequestRequiredKwargs:
     def test_build_required_privacy_request_kwargs_authenticated(self):
         resp = build_required_privacy_request_kwargs(
@@ -28,6 +28,7 @@ from fides.api.tasks.storage import (
     LOCAL_FIDES_UPLOAD_DIRECTORY,
     encrypt_access_request_results,
     write_to_in_memory_buffer,
+    write_to_spooled_file,
 )
 from fides.api.util.encryption.aes_gcm_encryption_scheme import (
     decrypt_combined_nonce_and_message,
@@ -366,6 +367,29 @@ class TestWriteToInMemoryBuffer:
         assert isinstance(buff, BytesIO)
         assert json.load(buff) == data
 
+    def test_json_data_matches_json_dumps(self, data, privacy_request):
+        data["mongo:empty"] = []
+        buff = write_to_in_memory_buffer("json", data, privacy_request)
+        assert buff.getvalue() == json.dumps(data, indent=2).encode(
+            CONFIG.security.encoding
+        )
+
+    def test_write_to_spooled_file(self, data, privacy_request_with_encryption_keys):
+        rows = [{"id": i, "city": "Cañon City"} for i in range(1000)]
+        with (
+            mock.patch("fides.api.tasks.storage.UPLOAD_SPOOL_MAX_SIZE_BYTES", 1024),
+            write_to_spooled_file(
+                "json", {"mongo:address": rows}, privacy_request_with_encryption_keys
+            ) as spooled_file,
+        ):
+            # The file was rolled over to disk once it grew past the max size
+            assert spooled_file._rolled
+            decrypted = decrypt_combined_nonce_and_message(
+                spooled_file.read().decode(CONFIG.security.encoding),
+                self.key.encode(CONFIG.security.encoding),
+            )
+        assert json.loads(decrypted) == {"mongo:address": rows}
+
     def test_csv_format(self, data, privacy_request):
         buff = write_to_in_memory_buffer("csv", data, privacy_request)
         assert isinstance(buff, BytesIO)
@@ -457,6 +481,31 @@ class TestWriteToInMemoryBuffer:
             "welcome.html",
         ]
 
+    @mock.patch(
+        "fides.api.service.privacy_request.dsr_package.dsr_report_builder.COLLECTION_INDEX_PAGE_SIZE",
+        1,
+    )
+    def test_html_format_paginates_collection_index(self, data, privacy_request):
+        buff = write_to_in_memory_buffer("html", data, privacy_request)
+
+        zipfile = ZipFile(buff)
+        assert {
+            "data/mongo/address/1.html",
+            "data/mongo/address/2.html",
+            "data/mongo/address/index.html",
+            "data/mongo/address/index-2.html",
+        } <= set(zipfile.namelist())
+        assert "data/mongo/foobar/index-2.html" not in zipfile.namelist()
+
+        first_page = zipfile.read("data/mongo/address/index.html").decode("utf-8")
+        assert 'href="1.html"' in first_page
+        assert 'href="2.html"' not in first_page
+        assert 'href="index-2.html"' in first_page
+
+        second_page = zipfile.read("data/mongo/address/index-2.html").decode("utf-8")
+        assert 'href="2.html"' in second_page
+        assert 'href="index.html"' in second_page
+
     def test_not_implemented(self, data, privacy_request):
         with pytest.raises(NotImplementedError):
             write_to_in_memory_buffer("not-a-valid-format", data, privacy_request)
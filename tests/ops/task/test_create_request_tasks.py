@@ -254,6 +254,33 @@ class TestPersistAccessRequestTasks:
         assert not payment_card_task.is_root_task
         assert not payment_card_task.is_terminator_task
 
+    def test_persist_access_tasks_again_skips_existing_tasks(
+        self, db, privacy_request, postgres_dataset_graph
+    ):
+        identity = {"email": "customer-1@example.com"}
+        traversal: Traversal = Traversal(postgres_dataset_graph, identity)
+        traversal_nodes = {}
+        end_nodes = traversal.traverse(traversal_nodes, collect_tasks_fn)
+
+        for _ in range(2):
+            persist_new_access_request_tasks(
+                db,
+                privacy_request,
+                traversal,
+                traversal_nodes,
+                end_nodes,
+                postgres_dataset_graph,
+            )
+            assert privacy_request.access_tasks.count() == 13
+
+        # Tasks are created in topological order
+        request_tasks = privacy_request.request_tasks.all()
+        assert request_tasks[0].collection_address == "__ROOT__:__ROOT__"
+        assert request_tasks[-1].collection_address == "__TERMINATE__:__TERMINATE__"
+        assert len({request_task.id for request_task in request_tasks}) == 13
+        # Ids are generated by the column default
+        assert all(request_task.id.startswith("req_") for request_task in request_tasks)
+
     def test_persist_access_tasks_with_object_fields_in_collection(
         self, db, privacy_request, postgres_and_mongo_dataset_graph
     ):
@@ -614,18 +641,10 @@ class TestPersistErasureRequestTasks:
             == "postgres_example_test_dataset:payment_card"
         ).first()
 
-        # access data collected for masking was added to this erasure node of the same address
-        assert payment_card_task.data_for_erasures == [
-            {
-                "billing_address_id": 1,
-                "ccn": 123456789,
-                "code": 321,
-                "customer_id": 1,
-                "id": "pay_aaa-aaa",
-                "name": "Example Card 1",
-                "preferred": True,
-            }
-        ]
+        # access data collected for masking was added to this erasure node of the same address,
+        # saved in chunks rather than on the task itself
+        assert payment_card_task.data_for_erasures is None
+        assert payment_card_task.get_data_for_erasures_row_count() == 1
         assert payment_card_task.get_data_for_erasures() == [
             {
                 "billing_address_id": 1,
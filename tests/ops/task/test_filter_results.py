@@ -9,6 +9,7 @@ from fides.api.graph.config import FieldPath
 from fides.api.graph.graph import DatasetGraph
 from fides.api.models.datasetconfig import convert_dataset_to_graph
 from fides.api.task.filter_results import (
+    RowProjector,
     filter_data_categories,
     remove_empty_containers,
     select_and_save_field,
@@ -513,6 +514,41 @@ class TestFilterResults:
         remove_empty_containers(results)
         assert results == expected
 
+    @pytest.mark.parametrize(
+        "field_paths",
+        [
+            [FieldPath("A")],
+            [FieldPath("A", "B")],
+            [FieldPath("A", "D", "F"), FieldPath("A", "D", "G")],
+            [FieldPath("A", "B"), FieldPath("A", "D"), FieldPath("E")],
+            [FieldPath("E", "F", "G"), FieldPath("H", "I")],
+            [FieldPath("J")],
+        ],
+    )
+    def test_row_projector(self, field_paths):
+        """The projector returns the same data as selecting each field path
+        and removing empty containers"""
+        row = {
+            "A": [
+                [
+                    {"B": "C", "D": [{"F": {}}, {"G": []}]},
+                    {"B": "D", "D": [{"F": "f"}, {"G": ["g", None]}]},
+                    {"B": "G"},
+                ],
+                [],
+            ],
+            "E": {"F": [{"G": "g"}, {"G": 1}, {"H": "h"}], "I": {}},
+            "H": "h",
+            "J": [],
+        }
+
+        expected = {}
+        for field_path in field_paths:
+            select_and_save_field(expected, row, field_path)
+        remove_empty_containers(expected)
+
+        assert RowProjector(field_paths).project(row) == expected
+
     def test_filter_data_categories(self):
         """Test different combinations of data categories to ensure the access_request_results are filtered properly"""
         access_request_results = {
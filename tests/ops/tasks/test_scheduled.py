@@ -14,7 +14,9 @@ from fides.api.service.privacy_request.request_runner_service import (
 )
 from fides.api.service.privacy_request.request_service import (
     DSR_DATA_REMOVAL,
+    IDENTITY_LOOKUP_HASH_BACKFILL,
     PRIVACY_REQUEST_STATUS_CHANGE_POLL,
+    initiate_identity_lookup_hash_backfill,
     initiate_poll_for_exited_privacy_request_tasks,
     initiate_scheduled_dsr_data_removal,
 )
@@ -93,3 +95,18 @@ def test_initiate_poll_for_exited_privacy_request_tasks() -> None:
     )
 
     CONFIG.test_mode = True
+
+
+def test_initiate_identity_lookup_hash_backfill() -> None:
+    """This task runs on an interval, starting right away, to backfill the lookup hashes
+    of provided identities saved without one"""
+    CONFIG.test_mode = False
+
+    initiate_identity_lookup_hash_backfill()
+    assert scheduler.running
+    job = scheduler.get_job(job_id=IDENTITY_LOOKUP_HASH_BACKFILL)
+    assert job is not None
+    assert isinstance(job.trigger, IntervalTrigger)
+    assert job.trigger.interval == datetime.timedelta(minutes=10)
+
+    CONFIG.test_mode = True
@@ -9,7 +9,12 @@ from fides.api.service.masking.strategy.masking_strategy_aes_encrypt import (
     AesEncryptionMaskingStrategy,
 )
 from fides.api.service.masking.strategy.masking_strategy_hmac import HmacMaskingStrategy
-from fides.api.util.encryption.secrets_util import SecretsUtil
+from fides.api.util.cache import get_cache, get_masking_secret_cache_key
+from fides.api.util.encryption.secrets_util import (
+    RequestMaskingSecrets,
+    SecretsUtil,
+    _request_masking_secrets,
+)
 
 from ...test_helpers.cache_secrets_helper import cache_secret, clear_cache_secrets
 
@@ -64,6 +69,95 @@ def test_get_secret_from_cache_bytes() -> None:
     clear_cache_secrets(request_id)
 
 
+def test_get_secret_from_request_masking_secrets() -> None:
+    masking_meta: Dict[SecretType, MaskingSecretMeta] = (
+        HmacMaskingStrategy._build_masking_secret_meta()
+    )
+    for secret_type, secret in [
+        (SecretType.key, "test_key"),
+        (SecretType.salt, "salt"),
+    ]:
+        cache_secret(
+            MaskingSecretCache[str](
+                secret=secret,
+                masking_strategy=HmacMaskingStrategy.name,
+                secret_type=secret_type,
+            ),
+            request_id,
+        )
+
+    SecretsUtil.register_request_masking_secrets(request_id)
+    try:
+        assert (
+            SecretsUtil.get_or_generate_secret(
+                request_id, SecretType.key, masking_meta[SecretType.key]
+            )
+            == "test_key"
+        )
+
+        # All of the strategy's secrets were loaded with the first one, so they are
+        # served from memory even once they're removed from the cache
+        get_cache().delete(
+            get_masking_secret_cache_key(
+                request_id, HmacMaskingStrategy.name, SecretType.salt
+            )
+        )
+        assert (
+            SecretsUtil.get_or_generate_secret(
+                request_id, SecretType.salt, masking_meta[SecretType.salt]
+            )
+            == "salt"
+        )
+    finally:
+        SecretsUtil.unregister_request_masking_secrets(request_id)
+
+    assert (
+        SecretsUtil.get_or_generate_secret(
+            request_id, SecretType.salt, masking_meta[SecretType.salt]
+        )
+        is None
+    )
+    clear_cache_secrets(request_id)
+
+
+def test_request_masking_secrets_not_cached_until_present() -> None:
+    masking_meta: Dict[SecretType, MaskingSecretMeta] = (
+        HmacMaskingStrategy._build_masking_secret_meta()
+    )
+    request_masking_secrets = RequestMaskingSecrets(request_id)
+    assert (
+        request_masking_secrets.get_secret(SecretType.key, masking_meta[SecretType.key])
+        is None
+    )
+
+    cache_secret(
+        MaskingSecretCache[str](
+            secret="test_key",
+            masking_strategy=HmacMaskingStrategy.name,
+            secret_type=SecretType.key,
+        ),
+        request_id,
+    )
+    assert (
+        request_masking_secrets.get_secret(SecretType.key, masking_meta[SecretType.key])
+        == "test_key"
+    )
+    clear_cache_secrets(request_id)
+
+
+def test_request_masking_secrets_shared_until_last_unregistered() -> None:
+    SecretsUtil.register_request_masking_secrets(request_id)
+    SecretsUtil.register_request_masking_secrets(request_id)
+    registered = _request_masking_secrets[request_id]
+    assert registered.registrations == 2
+
+    SecretsUtil.unregister_request_masking_secrets(request_id)
+    assert _request_masking_secrets[request_id] is registered
+
+    SecretsUtil.unregister_request_masking_secrets(request_id)
+    assert request_id not in _request_masking_secrets
+
+
 def test_generate_secret() -> None:
     # build masking secret meta for HMAC key
     masking_meta_key: Dict[SecretType, MaskingSecretMeta] = {
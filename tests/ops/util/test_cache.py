@@ -1,7 +1,7 @@
 import pickle
 import random
 from base64 import b64encode
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 from typing import Any, List
 from unittest import mock
@@ -13,6 +13,17 @@ from fides.api.util.cache import (
     FidesopsRedis,
     cache_task_tracking_key,
     celery_tasks_in_flight,
+    clear_cache_for_privacy_request,
+    get_cache,
+    get_celery_task_ids_in_flight,
+    get_privacy_request_cache_index_key,
+)
+from fides.api.util.cache_codec import (
+    MSGPACK_COMPRESSED_VERSION_TAG,
+    MSGPACK_VERSION_TAG,
+    JSONCacheCodec,
+    MsgpackCacheCodec,
+    get_cache_codec,
 )
 from fides.api.util.custom_json_encoder import (
     ENCODED_BYTES_PREFIX,
@@ -93,6 +104,61 @@ def test_scan(cache: FidesopsRedis) -> List:
     assert len(keys) == 0
 
 
+def test_delete_keys_by_prefix_in_batches(cache: FidesopsRedis) -> None:
+    prefix = f"redis_key_{random.random()}_"
+    for i in range(25):
+        cache.set_with_autoexpire(f"{prefix}{i}", i)
+    other_key = f"other_{prefix}"
+    cache.set_with_autoexpire(other_key, "keep me")
+
+    with mock.patch.object(cache, "unlink", wraps=cache.unlink) as unlink:
+        cache.delete_keys_by_prefix(prefix, chunk_size=10)
+
+    assert cache.get_keys_by_prefix(prefix) == []
+    assert all(len(call.args) <= 10 for call in unlink.call_args_list)
+    assert cache.get(other_key) == "keep me"
+
+
+def test_set_with_autoexpire_index_key(cache: FidesopsRedis) -> None:
+    index_key = f"index_{random.random()}"
+    cache.set_with_autoexpire("indexed_key_1", "a", index_key=index_key)
+    cache.set_encoded_object("indexed_key_2", {"b": 1}, index_key=index_key)
+
+    assert cache.smembers(index_key) == {"indexed_key_1", "EN_indexed_key_2"}
+    assert cache.ttl(index_key) > 0
+
+    cache.delete_indexed_keys(index_key, chunk_size=1)
+    assert cache.get("indexed_key_1") is None
+    assert cache.get("EN_indexed_key_2") is None
+    assert not cache.exists(index_key)
+
+
+class TestClearCacheForPrivacyRequest:
+    def test_clear_indexed_keys(self, cache: FidesopsRedis, privacy_request) -> None:
+        privacy_request.cache_encryption("test_encryption_key")
+        cache_task_tracking_key(privacy_request.id, "test_1234")
+        assert {
+            f"id-{privacy_request.id}-encryption-key",
+            f"id-{privacy_request.id}-async-execution",
+        } <= cache.smembers(get_privacy_request_cache_index_key(privacy_request.id))
+
+        with mock.patch.object(
+            FidesopsRedis, "delete_keys_by_prefix"
+        ) as delete_keys_by_prefix:
+            clear_cache_for_privacy_request(privacy_request.id)
+
+        delete_keys_by_prefix.assert_not_called()
+        assert privacy_request.get_cached_task_id() is None
+        assert cache.get(f"id-{privacy_request.id}-encryption-key") is None
+
+    def test_clear_unindexed_keys(self, cache: FidesopsRedis, privacy_request) -> None:
+        """Keys cached before the index existed are found by prefix instead"""
+        cache.set_with_autoexpire(f"id-{privacy_request.id}-legacy-key", "value")
+
+        clear_cache_for_privacy_request(privacy_request.id)
+        assert cache.get(f"id-{privacy_request.id}-legacy-key") is None
+
+
 class TestCustomJSONEncoder:
     def test_encode_enum_string(self):
         class TestEnum(Enum):
@@ -197,6 +263,75 @@ class TestCustomDecoder:
         assert cache.decode_obj(value) is None
 
 
+class TestMsgpackCacheCodec:
+    @pytest.fixture
+    def msgpack_codec(self):
+        original_value = CONFIG.redis.cache_codec
+        CONFIG.redis.cache_codec = "msgpack"
+        yield get_cache_codec()
+        CONFIG.redis.cache_codec = original_value
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"a": b"some value"},
+            {"a": ObjectId("507f191e810c19729de860ea")},
+            {"a": {"b": datetime(2023, 2, 17, 14, 5)}},
+            {"birthday": date(2001, 11, 8)},
+            [{"id": 1, "email": "customer-1@example.com"}, {"id": 2, "email": None}],
+            "some value",
+            1,
+        ],
+    )
+    def test_round_trip(self, msgpack_codec, value):
+        encoded = msgpack_codec.encode(value)
+        assert encoded.startswith(MSGPACK_VERSION_TAG)
+        assert FidesopsRedis.decode_obj(encoded) == value
+
+    def test_encode_enum_and_object(self, msgpack_codec):
+        class TestEnum(Enum):
+            test = "test_value"
+
+        class SomeClass:
+            def __init__(self):
+                self.val = TestEnum.test
+
+        encoded = msgpack_codec.encode([SomeClass()])
+        assert FidesopsRedis.decode_obj(encoded) == [{"val": "test_value"}]
+
+    def test_large_values_are_compressed(self):
+        codec = MsgpackCacheCodec(compression_threshold_bytes=100)
+        rows = [{"id": i, "email": f"customer-{i}@example.com"} for i in range(100)]
+
+        encoded = codec.encode(rows)
+        assert encoded.startswith(MSGPACK_COMPRESSED_VERSION_TAG)
+        assert len(encoded) < len(JSONCacheCodec().encode(rows))
+        assert FidesopsRedis.decode_obj(encoded) == rows
+
+    def test_integers_wider_than_64_bits_fall_back_to_json(self, msgpack_codec):
+        value = {"id": 2**70, "count": 1}
+        encoded = msgpack_codec.encode(value)
+        assert not encoded.startswith(MSGPACK_VERSION_TAG)
+        assert FidesopsRedis.decode_obj(encoded) == value
+
+    def test_json_values_still_decode(self, msgpack_codec):
+        value = {"a": datetime(2023, 2, 17, 14, 5)}
+        assert FidesopsRedis.decode_obj(FidesopsRedis.encode_obj(value)) == value
+
+    def test_json_codec(self):
+        assert isinstance(get_cache_codec("json"), JSONCacheCodec)
+        assert get_cache_codec("json").encode({"a": 1}) == '{"a": 1}'
+
+    def test_set_encoded_object(self, cache, msgpack_codec):
+        value = [{"id": 1, "created": datetime(2023, 2, 17, 14, 5)}]
+        cache.set_encoded_object("msgpack_codec_test", value)
+
+        assert cache.get("EN_msgpack_codec_test").startswith(MSGPACK_VERSION_TAG)
+        assert cache.get_encoded_objects_by_prefix("msgpack_codec_test") == {
+            "EN_msgpack_codec_test": value
+        }
+
+
 class TestCacheTaskTrackingKey:
     def test_cache_tracking_key_privacy_request(self, privacy_request):
         assert privacy_request.get_cached_task_id() is None
@@ -213,6 +348,19 @@ class TestCacheTaskTrackingKey:
 
         assert request_task.get_cached_task_id() == "test_5678"
 
+    def test_request_task_tracking_key_cleared_with_privacy_request(self, request_task):
+        cache_task_tracking_key(
+            request_task.id, "test_5678", request_task.privacy_request_id
+        )
+        assert request_task.get_cached_task_id() == "test_5678"
+
+        clear_cache_for_privacy_request(request_task.privacy_request_id)
+
+        assert request_task.get_cached_task_id() is None
+        assert not get_cache().exists(
+            get_privacy_request_cache_index_key(request_task.id)
+        )
+
 
 class TestCeleryTasksInFlight:
     def test_celery_tasks_in_flight_no_celery_tasks(self):
@@ -241,3 +389,16 @@ class TestCeleryTasksInFlight:
         query_task_mock.return_value = {"@celery1234": {"abcde": ["reserved", {}]}}
 
         assert celery_tasks_in_flight(["abde"])
+
+    @mock.patch("fides.api.util.cache.celery_app.control.inspect.query_task")
+    def test_get_celery_task_ids_in_flight(self, query_task_mock):
+        query_task_mock.return_value = {
+            "@celery1234": {"abcde": ["reserved", {}], "fghij": ["completed", {}]},
+            "@celery5678": {"klmno": ["active", {}]},
+        }
+
+        assert get_celery_task_ids_in_flight(["abcde", "fghij", "klmno"]) == {
+            "abcde",
+            "klmno",
+        }
+        query_task_mock.assert_called_once_with("abcde", "fghij", "klmno")
@@ -1,10 +1,12 @@
 from typing import Dict, List
 
+import pytest
 from immutables import Map
 from ordered_set import OrderedSet
 
 from fides.api.util.collection_util import (
     append,
+    chunks,
     filter_nonempty_values,
     make_immutable,
     make_mutable,
@@ -98,3 +100,11 @@ class TestMutabilityConversion:
         str_obj = "hello"
         assert make_mutable(int_obj) == 42
         assert make_mutable(str_obj) == "hello"
+
+
+def test_chunks() -> None:
+    assert list(chunks([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+    assert list(chunks(iter(range(4)), 4)) == [[0, 1, 2, 3]]
+    assert list(chunks([], 3)) == []
+    with pytest.raises(ValueError):
+        list(chunks([1], 0))